@@ -45,14 +45,7 @@ class GenericButton(QPushButton):
         )
 
         # Set a limit to how big the height can be
-        self.setMaximumHeight(int(sc.FONT_XL[:2]))
-
-        # Use CSS to set the font-size of this button
-        self.setStyleSheet(
-            """
-            font-size: {font_size};
-            """.format(font_size=sc.FONT_L)
-        )
+        self.setMaximumHeight(sc.FONT_XL_PX)
 
 
 class FullPageButton(QPushButton):
@@ -78,13 +71,6 @@ class FullPageButton(QPushButton):
             QSizePolicy.Expanding
         )
 
-        # Use CSS to set the font-size of this button
-        self.setStyleSheet(
-            """
-            font-size: {font_size};
-            """.format(font_size=sc.FONT_L)
-        )
-
 
 class ProfileCreateButton(QPushButton):
     """ProfileCreateButton.
@@ -103,15 +89,6 @@ class ProfileCreateButton(QPushButton):
         self.setText("Create New")
         # Set a fixed width for the button
         self.setFixedWidth(150)
-        # Use CSS to set the background color, font color, font size, and font weight of this button
-        self.setStyleSheet(
-            """
-            background-color: green;
-            color: white;
-            font-size: {font_size};
-            font-weight: bold;
-            """.format(font_size=sc.FONT_M)
-        )
 
 
 class ProfileDeleteButton(QPushButton):
@@ -136,12 +113,3 @@ class ProfileDeleteButton(QPushButton):
         )
         # Fix the width
         self.setFixedWidth(100)
-        # Use CSS to set the background color, font color, font size, and font weight of this button
-        self.setStyleSheet(
-            """
-            background-color: red;
-            color: white;
-            font-size: {font_size};
-            font-weight: bold;
-            """.format(font_size=sc.FONT_S)
-        )
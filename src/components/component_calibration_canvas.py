@@ -0,0 +1,344 @@
+"""
+component_calibration_canvas.py
+---
+This file contains the CalibrationCanvas class, which shows the goal photo with the corners selected and the lines dividing the goal drawn over it, and lets the user drag the corners.
+---
+
+Date: October 18, 2026
+Last Modified: October 18, 2026
+"""
+
+try:
+    import pathlib
+    import sys
+    sys.path.append(
+        "{}/Developer/ball_e_gui/src/helpers".format(pathlib.Path.home()))
+
+    from helper_goal_calibration import get_homography, get_zone_lines
+except ImportError:
+    print("{}: Imports failed".format(__file__))
+finally:
+    import time
+
+    from PyQt5.QtCore import QLine, QPoint, QRect, Qt, pyqtSignal
+    from PyQt5.QtGui import QBrush, QPainter, QPen, QPixmap, QRegion
+    from PyQt5.QtWidgets import QApplication, QWidget
+
+# Radius (in pixels) of the circles marking the corners
+MARKER_RADIUS = 20
+# Width (in pixels) of the pen the corner markers and the goal's lines are drawn with
+LAYER_PEN_WIDTH = 12
+# How close (in pixels) to a corner a press has to be to start dragging it
+MARKER_GRAB_RADIUS = 60
+# Each line's part of the region to repaint is made of this many boxes along it, which hug slanted lines more tightly than one box
+LINE_REGION_SEGMENTS = 4
+# Largest size (in pixels) the photo is shown at, the same as the camera preview's. Bigger photos (i.e.: full-resolution stills) are scaled down to fit.
+PHOTO_MAX_WIDTH = 960
+PHOTO_MAX_HEIGHT = 540
+
+
+class CalibrationCanvas(QWidget):
+    """CalibrationCanvas.
+
+    This class draws three layers on top of each other in its paintEvent: the goal photo, the lines outlining and dividing the goal, and the corner markers. Each layer is cached (the photo as a pixmap, the lines as end points, and one pixmap of a marker that is stamped at every corner), and when a corner moves only the parts of the widget its marker and the lines covered, and now cover, are repainted.
+
+    The photo is shown scaled down to fit PHOTO_MAX_WIDTH x PHOTO_MAX_HEIGHT, but the corners it is given and hands out are always in pixels of the photo itself.
+    """
+
+    # Emitted with the (x, y) (in pixels of the photo) of a press that is not on a corner marker
+    tapped = pyqtSignal(int, int)
+    # Emitted with the index of a corner once the user lets go of it after dragging it
+    corner_moved = pyqtSignal(int)
+
+    def __init__(self, parent=None):
+        """__init__.
+
+        Initializes an empty CalibrationCanvas object
+
+        :param parent: Default arg.
+        """
+        super().__init__(parent=parent)
+        # Every pixel is painted by paintEvent, so Qt does not need to clear the background first
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+
+        # Photo layer, scaled to the size it is shown at
+        self.photo = QPixmap()
+        # (width, height) tuple of the photo before it was scaled
+        self.photo_size = (0, 0)
+        # Size of the photo shown over the size of the photo
+        self.photo_scale = 1.0
+        # Line layer: QLine objects (in pixels of the widget) of the lines outlining and dividing the goal, once all 4 corners are selected
+        self.grid_lines = list()
+        # Marker layer: (x, y) tuples (in pixels of the photo) of the corners selected, in the order they were selected
+        self.corners = list()
+        self.marker_pixmap = self.render_marker()
+        # QRegion object the line and marker layers cover, kept so only the new one has to be worked out when they change
+        self.layers_region = QRegion()
+
+        # Index of the corner being dragged, or None
+        self.dragged_corner_index = None
+
+    def render_marker(self):
+        """render_marker.
+
+        Returns a pixmap of one corner marker on a transparent background, which is stamped at every corner instead of drawing the circle each time
+        """
+        marker_size = 2 * (MARKER_RADIUS + LAYER_PEN_WIDTH) + 1
+        marker_pixmap = QPixmap(marker_size, marker_size)
+        marker_pixmap.fill(Qt.transparent)
+
+        painter_obj = QPainter(marker_pixmap)
+        painter_obj.setRenderHint(QPainter.Antialiasing)
+        painter_obj.setPen(QPen(Qt.green, LAYER_PEN_WIDTH, Qt.SolidLine))
+        painter_obj.setBrush(QBrush(Qt.green, Qt.SolidPattern))
+        painter_obj.drawEllipse(QPoint(marker_size // 2, marker_size // 2),
+                                MARKER_RADIUS, MARKER_RADIUS)
+        painter_obj.end()
+        return marker_pixmap
+
+    def set_photo(self, photo):
+        """set_photo.
+
+        Shows a new photo, scaled down once (if it is too big) so painting never has to scale it
+
+        :param photo: QPixmap object of the photo
+        """
+        self.photo_size = (photo.width(), photo.height())
+        if photo.isNull():
+            self.photo_scale = 1.0
+            self.photo = photo
+        else:
+            self.photo_scale = min(1.0, PHOTO_MAX_WIDTH / photo.width(),
+                                   PHOTO_MAX_HEIGHT / photo.height())
+            if self.photo_scale < 1.0:
+                photo = photo.scaled(max(1, round(photo.width() * self.photo_scale)), max(1, round(photo.height() * self.photo_scale)),
+                                     Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+            self.photo = photo
+            self.setFixedSize(photo.size())
+        self.update_layers()
+        self.update()
+
+    def get_photo_size(self):
+        """get_photo_size.
+
+        Returns the (width, height) tuple of the photo, before it was scaled to be shown
+        """
+        return self.photo_size
+
+    def to_widget_point(self, point):
+        """to_widget_point.
+
+        Returns the QPoint object of the widget's pixel showing a point of the photo
+
+        :param point: (x, y) tuple (in pixels of the photo)
+        """
+        return QPoint(round(point[0] * self.photo_scale), round(point[1] * self.photo_scale))
+
+    def to_photo_point(self, point):
+        """to_photo_point.
+
+        Returns the (x, y) tuple (in pixels of the photo) shown at a pixel of the widget
+
+        :param point: QPoint object (in pixels of the widget)
+        """
+        return (round(point.x() / self.photo_scale), round(point.y() / self.photo_scale))
+
+    def set_corners(self, corners):
+        """set_corners.
+
+        Shows the corners selected, and the goal's lines if all 4 are, repainting only where the old and new ones are
+
+        :param corners: List of up to 4 (x, y) tuples (in pixels of the photo) of the goal's top-left, top-right, bottom-right, and bottom-left corners
+        """
+        self.corners = [tuple(corner) for corner in corners]
+        self.update_layers()
+
+    def get_corners(self):
+        """get_corners.
+
+        Returns the list of the (x, y) tuples (in pixels of the photo) of the corners selected
+        """
+        return list(self.corners)
+
+    def move_corner(self, corner_index, point):
+        """move_corner.
+
+        Moves one corner, repainting only where its marker and the goal's lines were and now are
+
+        :param corner_index: Integer index of the corner
+        :param point: (x, y) tuple (in pixels of the photo) of where the corner moves to
+        """
+        self.corners[corner_index] = tuple(point)
+        self.update_layers()
+
+    def update_layers(self):
+        """update_layers.
+
+        Works out the line layer and the region of the layers again after the corners change, and repaints where the layers were and now are
+        """
+        dirty_region = self.layers_region
+        self.build_grid_lines()
+        self.layers_region = self.get_layers_region()
+        self.update(dirty_region.united(self.layers_region))
+
+    def build_grid_lines(self):
+        """build_grid_lines.
+
+        Works out the line layer from the corners. Only the homography is needed for this, so it is quick enough to do on every move of a dragged corner.
+        """
+        if len(self.corners) == 4:
+            self.grid_lines = [QLine(self.to_widget_point(start_point), self.to_widget_point(end_point))
+                               for start_point, end_point in get_zone_lines(get_homography(self.corners))]
+        else:
+            self.grid_lines = list()
+
+    def get_marker_rect(self, corner):
+        """get_marker_rect.
+
+        Returns the QRect object (in pixels of the widget) the marker of a corner is stamped in
+
+        :param corner: (x, y) tuple (in pixels of the photo) of the corner
+        """
+        marker_size = self.marker_pixmap.width()
+        marker_centre = self.to_widget_point(corner)
+        return QRect(marker_centre.x() - marker_size // 2, marker_centre.y() - marker_size // 2, marker_size, marker_size)
+
+    def get_layers_region(self):
+        """get_layers_region.
+
+        Returns the QRegion object covering the corner markers and the goal's lines, which is what has to be repainted when they change. Each line only adds thin boxes along itself.
+        """
+        region = QRegion()
+        for corner in self.corners:
+            region = region.united(self.get_marker_rect(corner))
+        pen_margin = LAYER_PEN_WIDTH // 2 + 1
+        for grid_line in self.grid_lines:
+            line_points = [grid_line.p1() + (grid_line.p2() - grid_line.p1()) * segment / LINE_REGION_SEGMENTS
+                           for segment in range(LINE_REGION_SEGMENTS + 1)]
+            for start_point, end_point in zip(line_points, line_points[1:]):
+                region = region.united(QRect(start_point, end_point).normalized().adjusted(
+                    -pen_margin, -pen_margin, pen_margin, pen_margin))
+        return region
+
+    def paintEvent(self, event):
+        """paintEvent.
+
+        Draws the layers, only within the part of the widget that needs repainting
+
+        :param event: Default arg.
+        """
+        painter_obj = QPainter(self)
+        dirty_region = event.region()
+
+        # The painter is clipped to the dirty region, so only those pixels of the photo are copied
+        dirty_rect = dirty_region.boundingRect()
+        if self.photo.isNull():
+            painter_obj.fillRect(dirty_rect, Qt.black)
+        else:
+            painter_obj.drawPixmap(dirty_rect, self.photo, dirty_rect)
+
+        if len(self.grid_lines) > 0:
+            painter_obj.setPen(QPen(Qt.green, LAYER_PEN_WIDTH, Qt.SolidLine))
+            painter_obj.drawLines(self.grid_lines)
+
+        for corner in self.corners:
+            marker_rect = self.get_marker_rect(corner)
+            if dirty_region.intersects(marker_rect):
+                painter_obj.drawPixmap(marker_rect.topLeft(), self.marker_pixmap)
+
+        painter_obj.end()
+
+    def get_grabbed_corner(self, point):
+        """get_grabbed_corner.
+
+        Returns the index of the corner closest to a point if it is within MARKER_GRAB_RADIUS, or None
+
+        :param point: QPoint object (in pixels of the widget) of the press
+        """
+        if len(self.corners) == 0:
+            return None
+        distances = [(marker_centre.x() - point.x())**2 + (marker_centre.y() - point.y())**2
+                     for marker_centre in map(self.to_widget_point, self.corners)]
+        closest_corner_index = min(range(len(distances)),
+                                   key=lambda corner_index: distances[corner_index])
+        return closest_corner_index if distances[closest_corner_index] <= MARKER_GRAB_RADIUS**2 else None
+
+    def mousePressEvent(self, event):
+        """mousePressEvent.
+
+        Starts dragging a corner if the press is on its marker, otherwise emits tapped
+
+        :param event: Default arg.
+        """
+        self.dragged_corner_index = self.get_grabbed_corner(event.pos())
+        if self.dragged_corner_index is None:
+            self.tapped.emit(*self.to_photo_point(event.pos()))
+
+    def mouseMoveEvent(self, event):
+        """mouseMoveEvent.
+
+        Moves the corner being dragged, keeping it on the photo
+
+        :param event: Default arg.
+        """
+        if self.dragged_corner_index is None:
+            return
+        x_coord = min(max(event.pos().x(), 0), self.width() - 1)
+        y_coord = min(max(event.pos().y(), 0), self.height() - 1)
+        self.move_corner(self.dragged_corner_index,
+                         self.to_photo_point(QPoint(x_coord, y_coord)))
+
+    def mouseReleaseEvent(self, event):
+        """mouseReleaseEvent.
+
+        Emits corner_moved once a dragged corner is let go of
+
+        :param event: Default arg.
+        """
+        if self.dragged_corner_index is None:
+            return
+        corner_index = self.dragged_corner_index
+        self.dragged_corner_index = None
+        self.corner_moved.emit(corner_index)
+
+
+def main():
+    """main.
+
+    Main prototype/testing area. Code prototyping and checking happens here. Drags a corner of a goal across a 960x540 photo and prints how much of the photo each step repaints and how long the repaints take, then shows a full-resolution photo.
+    """
+    app = QApplication(sys.argv)
+
+    photo = QPixmap(960, 540)
+    photo.fill(Qt.darkGreen)
+    canvas = CalibrationCanvas()
+    canvas.set_photo(photo)
+    canvas.set_corners([(300, 100), (700, 140), (690, 450), (310, 500)])
+    canvas.show()
+    app.processEvents()
+
+    photo_area = photo.width() * photo.height()
+    repainted_area = 0
+    start_time = time.perf_counter()
+    for step in range(60):
+        dirty_region = canvas.layers_region
+        canvas.move_corner(2, (690 + step, 450 + step // 2))
+        dirty_region = dirty_region.united(canvas.layers_region)
+        repainted_area += sum(rect.width() * rect.height()
+                              for rect in dirty_region.rects())
+        canvas.repaint(dirty_region)
+    step_ms = (time.perf_counter() - start_time) * 1000 / 60
+
+    print("Each drag step repaints {:.0%} of the photo on average, in {:.2f} ms".format(
+        repainted_area / 60 / photo_area, step_ms))
+
+    # A full-resolution still is shown scaled down, with the corners still in its own pixels
+    canvas.set_photo(QPixmap(3264, 2464))
+    canvas.set_corners([(1020, 310), (2380, 440), (2350, 1400), (1050, 1550)])
+    print("A 3264x2464 photo is shown at {}x{}, its corner (2380, 440) at {}".format(
+        canvas.width(), canvas.height(), canvas.to_widget_point(canvas.get_corners()[1])))
+
+
+if __name__ == "__main__":
+    # Run the main function
+    main()
@@ -18,17 +18,13 @@ try:
         "{}/Developer/ball_e_gui/src/helpers".format(pathlib.Path.home()))
 
     import style_constants as sc
-    from helper_profiler import Profiler
 
     from component_dropdown import Dropdown
     from component_labels import ProfileLabel
+    from helper_pixmap_cache import get_lax_goal_pixmap
 except ImportError:
     print("{}: Imports failed".format(__file__))
 finally:
-    import csv
-
-    from PyQt5.QtCore import Qt
-    from PyQt5.QtGui import QPainter, QPen, QPixmap
     from PyQt5.QtWidgets import QLabel, QVBoxLayout, QWidget
 
 
@@ -38,66 +34,27 @@ class DrillCreationWidget(QWidget):
     This class configures and creates all required components and logic to create drills.
     """
 
-    def __init__(self, local_location, ball_number):
+    def __init__(self, drill_document, ball_number):
         """__init__.
 
-        Initializes the Drill Creation Widget with the path where this profiles needs to be saved and how many balls the drill consists of.
-        :param local_location: String of the path where this drill would be saved
-        :param ball_number: Integer number of balls required for this drill
+        Initializes the Drill Creation Widget with the drill being edited and which ball of the drill this widget edits.
+        :param drill_document: DrillDocument object shared by all the ball tabs of the drill
+        :param ball_number: String number of the ball this widget edits
         """
         super().__init__()
 
-        self.local_location = local_location
+        self.drill_document = drill_document
         self.ball_number = ball_number
 
-        self.drill_profiler = Profiler("drill_profiles")
-
         widget_layout = QVBoxLayout()
 
         # Initialize where all the balls will be placed and their speed by default (Center Middle location @ 30 MPH)
         self.shot_location_label = ProfileLabel("Shot Location: Center Middle")
         self.lax_goal_label = QLabel()
-        lax_goal_img_location = str(
-            pathlib.Path.home()) + '/Developer/ball_e_gui/src/images/lax_goal.png'
-        pixmap_object = QPixmap()
-        pixmap_object.load(lax_goal_img_location)
-        self.scaled_pixmap_obj = pixmap_object.scaled(pixmap_object.width()-300,
-                                                      pixmap_object.height()-300)
+        # The goal image with its 9 sections is rendered once and shared by every ball tab
+        self.scaled_pixmap_obj = get_lax_goal_pixmap()
         # What function to call when the Lacrosse goal picture has been clicked
         self.lax_goal_label.mousePressEvent = self.save_shot_location
-
-        # Draw the lines on the Lax goal image. These lines divide the goal into 9 sections.
-        painter_obj = QPainter(self.scaled_pixmap_obj)
-        painter_obj.setPen(QPen(Qt.green, 12, Qt.SolidLine))
-
-        # Top Line
-        painter_obj.drawLine(0, 0, self.scaled_pixmap_obj.width(), 0)
-        # Top 1/3 Line
-        painter_obj.drawLine(0, int(self.scaled_pixmap_obj.height(
-        )/3), self.scaled_pixmap_obj.width(), int(self.scaled_pixmap_obj.height()/3))
-        # Bottom 1/3 Line
-        painter_obj.drawLine(0, (self.scaled_pixmap_obj.height() - int(self.scaled_pixmap_obj.height()/3)),
-                             self.scaled_pixmap_obj.width(), (self.scaled_pixmap_obj.height() - int(self.scaled_pixmap_obj.height()/3)))
-        # Bottom Line
-        painter_obj.drawLine(0, self.scaled_pixmap_obj.height(),
-                             self.scaled_pixmap_obj.width(), self.scaled_pixmap_obj.height())
-        # Left Line
-        painter_obj.drawLine(0, 0,
-                             0, self.scaled_pixmap_obj.height())
-        # Left 1/3 Line
-        painter_obj.drawLine(int(self.scaled_pixmap_obj.width(
-        )/3), 0, int(self.scaled_pixmap_obj.width(
-        )/3), self.scaled_pixmap_obj.height())
-        # Right 1/3 Line
-        painter_obj.drawLine(int(self.scaled_pixmap_obj.width() - self.scaled_pixmap_obj.width()/3), 0,
-                             int(self.scaled_pixmap_obj.width() - self.scaled_pixmap_obj.width()/3), self.scaled_pixmap_obj.height())
-        # Right Line
-        painter_obj.drawLine(self.scaled_pixmap_obj.width(), 0,
-                             self.scaled_pixmap_obj.width(), self.scaled_pixmap_obj.height())
-
-        painter_obj.end()
-
-        # Update the image with the lines drawn
         self.lax_goal_label.setPixmap(self.scaled_pixmap_obj)
 
         # Create dropdown for selecting the speed
@@ -156,48 +113,43 @@ class DrillCreationWidget(QWidget):
         elif x_coord >= third_of_width and x_coord <= two_third_of_width:
             middle_flag = True
 
-        drill_info = self.drill_profiler.get_profile_info(self.local_location)
-
         # Figure out which of the 9 locations the user has clicked on and save it to each ball
         if top_flag and left_flag:
             self.shot_location_label.setText(
                 "Shot Location: Top Left")
-            drill_info[self.ball_number][0] = "TL"
+            self.drill_document.set_shot_location(self.ball_number, "TL")
         elif top_flag and right_flag:
             self.shot_location_label.setText(
                 "Shot Location: Top Right")
-            drill_info[self.ball_number][0] = "TR"
+            self.drill_document.set_shot_location(self.ball_number, "TR")
         elif top_flag and middle_flag:
             self.shot_location_label.setText(
                 "Shot Location: Top Middle")
-            drill_info[self.ball_number][0] = "TM"
+            self.drill_document.set_shot_location(self.ball_number, "TM")
         elif center_flag and left_flag:
             self.shot_location_label.setText(
                 "Shot Location: Center Left")
-            drill_info[self.ball_number][0] = "CL"
+            self.drill_document.set_shot_location(self.ball_number, "CL")
         elif center_flag and right_flag:
             self.shot_location_label.setText(
                 "Shot Location: Center Right")
-            drill_info[self.ball_number][0] = "CR"
+            self.drill_document.set_shot_location(self.ball_number, "CR")
         elif center_flag and middle_flag:
             self.shot_location_label.setText(
                 "Shot Location: Center Middle")
-            drill_info[self.ball_number][0] = "CM"
+            self.drill_document.set_shot_location(self.ball_number, "CM")
         elif bottom_flag and left_flag:
             self.shot_location_label.setText(
                 "Shot Location: Bottom Left")
-            drill_info[self.ball_number][0] = "BL"
+            self.drill_document.set_shot_location(self.ball_number, "BL")
         elif bottom_flag and right_flag:
             self.shot_location_label.setText(
                 "Shot Location: Bottom Right")
-            drill_info[self.ball_number][0] = "BR"
+            self.drill_document.set_shot_location(self.ball_number, "BR")
         elif bottom_flag and middle_flag:
             self.shot_location_label.setText(
                 "Shot Location: Bottom Middle")
-            drill_info[self.ball_number][0] = "BM"
-
-        # Update the information
-        self.update_drill_local_file(drill_info)
+            self.drill_document.set_shot_location(self.ball_number, "BM")
 
     def save_speed_selection(self, selected_speed):
         """save_speed_selection.
@@ -207,23 +159,5 @@ class DrillCreationWidget(QWidget):
         :param selected_speed: Integer number of a value in MPH for what the ball speed should be
         """
 
-        drill_info = self.drill_profiler.get_profile_info(self.local_location)
-        drill_info[self.ball_number][1] = selected_speed
-
-        self.update_drill_local_file(drill_info)
-
-    def update_drill_local_file(self, drill_info):
-        """update_drill_local_file.
-
-        Updates the updated drill information to the appropriate .csv file
-
-        :param drill_info: Dictionary which consists of the drill's information
-        """
-        with open(self.local_location, 'w', newline='') as file:
-            writer = csv.writer(file, delimiter=',')
-            writer.writerow(
-                ["Ball #", "Target Location", "Ball Speed", "Rate of Fire"]
-            )
-            for ball in drill_info:
-                writer.writerow([str(ball), drill_info[ball][0],
-                                 drill_info[ball][1], drill_info[ball][2]])
+        # Only the in-memory drill is updated. It is written to disk once, when the drill is saved.
+        self.drill_document.set_speed(self.ball_number, selected_speed)
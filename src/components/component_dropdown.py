@@ -36,5 +36,5 @@ class Dropdown(QComboBox):
         super().__init__()
 
         self.dropdown_font = self.font()
-        self.dropdown_font.setPointSize(int(sc.FONT_XL[0:2]))
+        self.dropdown_font.setPointSize(sc.FONT_XL_PX)
         self.setFont(self.dropdown_font)
@@ -35,15 +35,6 @@ class HomeScreenButton(QPushButton):
             QSizePolicy.Preferred,
             QSizePolicy.Expanding
         )
-        # Use CSS to style the background color, font color, font size, and font wieght of this button
-        self.setStyleSheet(
-            """
-            background-color: green;
-            color: white;
-            font-size: 60px;
-            font-weight: bold;
-            """
-        )
 
 
 class PowerOffButton(QPushButton):
@@ -68,15 +59,6 @@ class PowerOffButton(QPushButton):
         # Set the size and shape to be a pretty large square
         self.setFixedHeight(400)
         self.setFixedWidth(400)
-        # Use CSS to style the background color, font color, font size, and font weight of this button
-        self.setStyleSheet(
-            """
-            background-color: red;
-            color: white;
-            font-size: 40px;
-            font-weight: bold;
-            """
-        )
 
 
 class HomeScreenTitle(QLabel):
@@ -97,14 +79,6 @@ class HomeScreenTitle(QLabel):
 
         # Set the text of this QLabel
         self.setText(text)
-        # Use CSS to style the font color, font size, and font weight of this QLabel
-        self.setStyleSheet(
-            """
-            color: black;
-            font-size: 100px;
-            font-weight: bold
-            """
-        )
 
 
 class HomeScreenSubtitle(QLabel):
@@ -124,10 +98,3 @@ class HomeScreenSubtitle(QLabel):
         super().__init__()
         # Set the text of this QLabel
         self.setText(text)
-        # Use CSS to style the font color and font size of this QLabel
-        self.setStyleSheet(
-            """
-            color: black;
-            font-size: 60px;
-            """
-        )
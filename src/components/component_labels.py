@@ -9,17 +9,7 @@ Date: May 4, 2021
 Last Modified: May 08, 2021
 """
 
-try:
-    import pathlib
-    import sys
-    sys.path.append(
-        "{}/Developer/ball_e_gui/src/helpers".format(pathlib.Path.home()))
-
-    import style_constants as sc
-except ImportError:
-    print("{}: Imports failed".format(__file__))
-finally:
-    from PyQt5.QtWidgets import QLabel
+from PyQt5.QtWidgets import QLabel
 
 
 class ProfileLabel(QLabel):
@@ -39,13 +29,6 @@ class ProfileLabel(QLabel):
         super().__init__()
         # Set the text of the QLabel
         self.setText(profile_label)
-        # Use CSS to configure the text color and the font-size of this label
-        self.setStyleSheet(
-            """
-            color: black;
-            font-size: {font_size};
-            """.format(font_size=sc.FONT_L)
-        )
 
 
 class TableHeaderLabel(QLabel):
@@ -65,11 +48,3 @@ class TableHeaderLabel(QLabel):
         super().__init__()
         # Set the text of the QLabel
         self.setText(table_header_label)
-        # Use CSS to configure the text color, font-size, and font-weight of this label
-        self.setStyleSheet(
-            """
-            color: black;
-            font-size: {font_size};
-            font-weight: bold;
-            """.format(font_size=sc.FONT_L)
-        )
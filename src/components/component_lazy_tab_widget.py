@@ -0,0 +1,76 @@
+"""
+component_lazy_tab_widget.py
+---
+This file contains the LazyTabWidget class, a QTabWidget whose tabs only build their contents the first time they are opened.
+---
+
+Date: October 18, 2026
+Last Modified: October 18, 2026
+"""
+
+import logging
+import time
+
+from PyQt5.QtWidgets import QTabWidget, QVBoxLayout, QWidget
+
+logger = logging.getLogger(__name__)
+
+
+class LazyTabWidget(QTabWidget):
+    """LazyTabWidget.
+
+    This class adds tabs as empty placeholders. A tab's widget is only created, by the function it was added with, when the user first opens that tab.
+    """
+
+    def __init__(self, parent=None):
+        """__init__.
+
+        Initializes the LazyTabWidget object
+
+        :param parent: Default arg.
+        """
+        super().__init__(parent=parent)
+
+        # {tab index: function which creates the tab's widget}, for the tabs that have not been opened yet
+        self.tab_factories = dict()
+
+        self.currentChanged.connect(self.build_tab)
+
+    def add_lazy_tab(self, widget_factory, label):
+        """add_lazy_tab.
+
+        Adds a placeholder tab which builds its widget when it is first opened. The first tab added is opened (and so built) straight away.
+
+        :param widget_factory: Function taking no arguments which returns the tab's QWidget object
+        :param label: String label of the tab
+        """
+        placeholder = QWidget()
+        placeholder_layout = QVBoxLayout()
+        placeholder_layout.setContentsMargins(0, 0, 0, 0)
+        placeholder.setLayout(placeholder_layout)
+
+        self.tab_factories[self.count()] = widget_factory
+        return self.addTab(placeholder, label)
+
+    def build_tab(self, index):
+        """build_tab.
+
+        Builds the widget of the tab that was just opened, if it has not been built yet
+
+        :param index: Integer index of the tab that was opened
+        """
+        widget_factory = self.tab_factories.pop(index, None)
+        if widget_factory is None:
+            return
+
+        start_time = time.perf_counter()
+        self.widget(index).layout().addWidget(widget_factory())
+        logger.debug("Opened tab '%s' in %.1f ms", self.tabText(index),
+                     (time.perf_counter() - start_time)*1000)
+
+    def get_built_tab_count(self):
+        """get_built_tab_count.
+
+        Returns how many of the tabs have had their widget built
+        """
+        return self.count() - len(self.tab_factories)
@@ -38,5 +38,5 @@ class LineEdit(QLineEdit):
 
         # Set the font to be big enough for easy view and clickability of the QLineObject itself
         self.line_edit_font = self.font()
-        self.line_edit_font.setPointSize(int(sc.FONT_XL[0:2]))
+        self.line_edit_font.setPointSize(sc.FONT_XL_PX)
         self.setFont(self.line_edit_font)
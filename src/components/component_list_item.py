@@ -9,7 +9,6 @@ Date: May 4, 2021
 Last Modified: May 08, 2021
 """
 
-from PyQt5.QtGui import QFont
 from PyQt5.QtWidgets import QListWidgetItem
 
 
@@ -28,9 +27,5 @@ class ListItem(QListWidgetItem):
         """
 
         super().__init__()
-        # Set the text of the object
+        # Set the text of the object. Its font size comes from the QListWidget's entry in the app style sheet.
         self.setText(text)
-        # Set the font size of the object
-        font = QFont()
-        font.setPixelSize(22)
-        self.setFont(font)
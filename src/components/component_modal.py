@@ -15,7 +15,7 @@ try:
     sys.path.append(
         "{}/Developer/ball_e_gui/src/helpers".format(pathlib.Path.home()))
 
-    import style_constants as sc
+    from helper_display_metrics import get_display_metrics
 
     from component_button import GenericButton
 except ImportError:
@@ -51,43 +51,24 @@ class Modal(QDialog):
         modal_layout = QVBoxLayout()
         heading_bar = QWidget()
         heading_bar_layout = QHBoxLayout()
-        # heading_bar.setFixedHeight(int(0.03*sc.SCREEN_WIDTH))
-        heading_bar.setMinimumHeight(int(0.05*sc.SCREEN_WIDTH))
+        # heading_bar.setFixedHeight(int(0.03*get_display_metrics().screen_width))
+        heading_bar.setMinimumHeight(int(0.05*get_display_metrics().screen_width))
+
+        # The app style sheet colors the heading bar by its modalType property
+        heading_bar.setObjectName("modalHeadingBar")
+        heading_bar.setProperty("modalType", type)
 
         heading_bar_label = QLabel()
+        heading_bar_label.setObjectName("modalHeadingLabel")
 
         heading_bar_label.setAlignment(Qt.AlignCenter)
-        heading_bar_label.setStyleSheet(
-            """
-            font-size: {font_size};
-            color: white;
-            """.format(font_size=sc.FONT_XL)
-        )
         heading_bar_layout.addWidget(heading_bar_label)
 
         # Depending on the type of modal, customize it appropriately
-        if type == "info":
-            heading_bar.setStyleSheet(
-                """
-                background-color: {background_color};
-                """.format(background_color=sc.COLOR_INFO)
-            )
-            heading_bar_label.setText(window_title)
-        elif type == "error":
-
-            heading_bar.setStyleSheet(
-                """
-                background-color: {background_color};
-                """.format(background_color=sc.COLOR_ERROR)
-            )
+        if type == "info" or type == "error":
             heading_bar_label.setText(window_title)
 
         elif type == "choice":
-            heading_bar.setStyleSheet(
-                """
-                background-color: {background_color};
-                """.format(background_color=sc.COLOR_INFO)
-            )
             heading_bar_label.setText(window_title)
 
             self.yes_button = GenericButton("Yes")
@@ -116,8 +97,8 @@ class Modal(QDialog):
             modal_layout.addWidget(close_modal_button)
 
         self.setLayout(modal_layout)
-        self.setMinimumWidth(int(0.5*sc.SCREEN_WIDTH))
-        self.setMinimumHeight(int(0.5*sc.SCREEN_HEIGHT))
+        self.setMinimumWidth(int(0.5*get_display_metrics().screen_width))
+        self.setMinimumHeight(int(0.5*get_display_metrics().screen_height))
 
         # As long as the modal is not a "choice" type, execute independently
         if not type == "choice":
@@ -0,0 +1,301 @@
+"""
+component_profile_table.py
+---
+This file contains the model, delegate, and view classes used to show a list of Goalie or Drill profiles in a table throughout Ball-E's GUI app.
+---
+
+Date: October 18, 2026
+Last Modified: October 18, 2026
+"""
+
+try:
+    import pathlib
+    import sys
+    sys.path.append(
+        "{}/Developer/ball_e_gui/src/helpers".format(pathlib.Path.home()))
+
+    import style_constants as sc
+except ImportError:
+    print("{}: Imports failed".format(__file__))
+finally:
+    import bisect
+
+    from PyQt5 import QtWidgets
+    from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+    from PyQt5.QtGui import QColor, QFontMetrics
+    from PyQt5.QtWidgets import (QHeaderView, QStyledItemDelegate,
+                                 QTableView)
+
+# How many rows are handed to the view at a time as the user scrolls down
+FETCH_BATCH_SIZE = 100
+
+# Padding (in pixels) around the text of each cell
+CELL_PADDING = 8
+
+
+class ProfileTableModel(QAbstractTableModel):
+    """ProfileTableModel.
+
+    This class serves a sorted list of profile names to a QTableView. Rows are only handed to the view in batches as it asks for them, so a table of thousands of profiles opens as fast as a small one.
+    """
+
+    def __init__(self, profile_names, table_font, show_delete_column=False, parent=None):
+        """__init__.
+
+        Initializes the model with the profiles to show
+
+        :param profile_names: Iterable of the profile names (i.e.: goalie_a)
+        :param table_font: QFont object used for every cell of the table
+        :param show_delete_column: Boolean value which when True adds a second column acting as a Delete button
+        :param parent: Default arg.
+        """
+        super().__init__(parent=parent)
+
+        self.table_font = table_font
+        self.show_delete_column = show_delete_column
+
+        self.profile_names = sorted(profile_names)
+        # How many of the profile names have been handed to the view so far
+        self.fetched_count = min(len(self.profile_names), FETCH_BATCH_SIZE)
+
+    def rowCount(self, parent=QModelIndex()):
+        """rowCount.
+
+        Returns how many rows the view currently knows about
+
+        :param parent: Default arg.
+        """
+        if parent.isValid():
+            return 0
+        return self.fetched_count
+
+    def columnCount(self, parent=QModelIndex()):
+        """columnCount.
+
+        Returns 2 columns if the Delete column is shown, otherwise 1
+
+        :param parent: Default arg.
+        """
+        if parent.isValid():
+            return 0
+        return 2 if self.show_delete_column else 1
+
+    def data(self, index, role=Qt.DisplayRole):
+        """data.
+
+        Returns what the view needs to draw a cell
+
+        :param index: QModelIndex object of the cell
+        :param role: The kind of data the view is asking for
+        """
+        if not index.isValid() or index.row() >= self.fetched_count:
+            return None
+
+        if role == Qt.DisplayRole:
+            if index.column() == 0:
+                return self.get_display_name(index.row())
+            return "Delete"
+        elif role == Qt.FontRole:
+            return self.table_font
+        elif role == Qt.TextAlignmentRole:
+            if index.column() == 0:
+                return int(Qt.AlignLeft | Qt.AlignVCenter)
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        """canFetchMore.
+
+        Returns whether or not there are profiles that have not been handed to the view yet
+
+        :param parent: Default arg.
+        """
+        if parent.isValid():
+            return False
+        return self.fetched_count < len(self.profile_names)
+
+    def fetchMore(self, parent=QModelIndex()):
+        """fetchMore.
+
+        Hands the next batch of profiles to the view
+
+        :param parent: Default arg.
+        """
+        if parent.isValid():
+            return
+        batch_size = min(FETCH_BATCH_SIZE, len(
+            self.profile_names) - self.fetched_count)
+        if batch_size <= 0:
+            return
+
+        self.beginInsertRows(QModelIndex(), self.fetched_count,
+                             self.fetched_count + batch_size - 1)
+        self.fetched_count += batch_size
+        self.endInsertRows()
+
+    def get_profile_name(self, row):
+        """get_profile_name.
+
+        Returns the profile name (i.e.: goalie_a) of a row
+
+        :param row: Integer row number
+        """
+        return self.profile_names[row]
+
+    def get_display_name(self, row):
+        """get_display_name.
+
+        Returns the profile name of a row the way it is shown to the user (i.e.: Goalie A)
+
+        :param row: Integer row number
+        """
+        return self.profile_names[row].replace('_', ' ').title()
+
+    def get_row(self, profile_name):
+        """get_row.
+
+        Returns the row number of a profile, or None if it is not in the table
+
+        :param profile_name: String name of the profile (i.e.: goalie_a)
+        """
+        row = bisect.bisect_left(self.profile_names, profile_name)
+        if row < len(self.profile_names) and self.profile_names[row] == profile_name:
+            return row
+        return None
+
+    def add_profile(self, profile_name):
+        """add_profile.
+
+        Adds a profile to the table in its sorted place and returns its row number
+
+        :param profile_name: String name of the profile (i.e.: goalie_a)
+        """
+        row = bisect.bisect_left(self.profile_names, profile_name)
+        if row < len(self.profile_names) and self.profile_names[row] == profile_name:
+            return row
+
+        # Rows past what the view has fetched are only added to the list. The view gets them when it scrolls there.
+        if row <= self.fetched_count:
+            self.beginInsertRows(QModelIndex(), row, row)
+            self.profile_names.insert(row, profile_name)
+            self.fetched_count += 1
+            self.endInsertRows()
+        else:
+            self.profile_names.insert(row, profile_name)
+
+        return row
+
+    def remove_row(self, row):
+        """remove_row.
+
+        Removes a profile from the table
+
+        :param row: Integer row number
+        """
+        if row < self.fetched_count:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self.profile_names[row]
+            self.fetched_count -= 1
+            self.endRemoveRows()
+        else:
+            del self.profile_names[row]
+
+    def update_profiles(self, profile_names):
+        """update_profiles.
+
+        Brings the table in line with a new set of profiles by only removing and inserting the rows that changed. Returns the (added, removed) profile name lists.
+
+        :param profile_names: Iterable of the profile names (i.e.: goalie_a)
+        """
+        new_names = set(profile_names)
+        old_names = set(self.profile_names)
+
+        removed = sorted(old_names - new_names)
+        added = sorted(new_names - old_names)
+
+        # Remove from the bottom up so the rows still to be removed keep their row numbers
+        for profile_name in reversed(removed):
+            self.remove_row(self.get_row(profile_name))
+        for profile_name in added:
+            self.add_profile(profile_name)
+
+        return added, removed
+
+    def set_profiles(self, profile_names):
+        """set_profiles.
+
+        Replaces every profile in the table
+
+        :param profile_names: Iterable of the profile names (i.e.: goalie_a)
+        """
+        self.beginResetModel()
+        self.profile_names = sorted(profile_names)
+        self.fetched_count = min(len(self.profile_names), FETCH_BATCH_SIZE)
+        self.endResetModel()
+
+
+class ProfileDeleteDelegate(QStyledItemDelegate):
+    """ProfileDeleteDelegate.
+
+    This class draws the Delete cell of a profile table so that it looks like a button
+    """
+
+    def paint(self, painter, option, index):
+        """paint.
+
+        Draws white 'Delete' text on the error color
+
+        :param painter: QPainter object to draw with
+        :param option: QStyleOptionViewItem object describing the cell
+        :param index: QModelIndex object of the cell
+        """
+        painter.save()
+        painter.fillRect(option.rect, QColor(sc.COLOR_ERROR))
+        painter.setPen(QColor(sc.COLOR_WHITE))
+        painter.setFont(index.data(Qt.FontRole))
+        painter.drawText(option.rect.adjusted(CELL_PADDING, 0, -CELL_PADDING, 0),
+                         index.data(Qt.TextAlignmentRole), index.data(Qt.DisplayRole))
+        painter.restore()
+
+
+class ProfileTableView(QTableView):
+    """ProfileTableView.
+
+    This class configures the QTableView object used to show profile tables, with every row the same height so that nothing has to be measured per row
+    """
+
+    def __init__(self, profile_table_model, parent=None):
+        """__init__.
+
+        Configures the QTableView object as designed
+
+        :param profile_table_model: ProfileTableModel object to show
+        :param parent: Default arg.
+        """
+        super().__init__(parent=parent)
+
+        self.setModel(profile_table_model)
+
+        # Do not allow the user to edit the contents of the table
+        self.setEditTriggers(QtWidgets.QTableView.NoEditTriggers)
+
+        # Hide all headers of the table
+        self.verticalHeader().setVisible(False)
+        self.horizontalHeader().setVisible(False)
+
+        # Every row is exactly one line of the table font tall
+        font_metrics = QFontMetrics(profile_table_model.table_font)
+        self.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.verticalHeader().setDefaultSectionSize(
+            font_metrics.height() + 2*CELL_PADDING)
+
+        # Resize the left column to stretch as far out as possible
+        self.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+
+        if profile_table_model.show_delete_column:
+            # The right column is drawn as a button and is just wide enough for its text
+            self.setItemDelegateForColumn(1, ProfileDeleteDelegate(self))
+            self.horizontalHeader().setSectionResizeMode(1, QHeaderView.Fixed)
+            self.horizontalHeader().resizeSection(
+                1, font_metrics.boundingRect("Delete").width() + 4*CELL_PADDING)
@@ -15,7 +15,7 @@ try:
     sys.path.append(
         "{}/Developer/ball_e_gui/src/helpers".format(pathlib.Path.home()))
 
-    import style_constants as sc
+    from helper_display_metrics import get_display_metrics
 except ImportError:
     print("{}: Imports failed".format(__file__))
 finally:
@@ -46,15 +46,7 @@ class ToolbarButton(QPushButton):
             QSizePolicy.Expanding
         )
         # Fix the width
-        self.setFixedWidth(int(0.25*sc.SCREEN_WIDTH))
-
-        # Use CSS to set font size and color of this button
-        self.setStyleSheet(
-            """
-            font-size: {font_size};
-            background-color: white
-            """.format(font_size=sc.FONT_L)
-        )
+        self.setFixedWidth(int(0.25*get_display_metrics().screen_width))
 
 
 class ToolbarTitle(QLabel):
@@ -74,14 +66,6 @@ class ToolbarTitle(QLabel):
         super().__init__()
         # Set the text of the toolbar
         self.setText(toolbar_title)
-        # Use CSS to set the color, font-size, and font-weight of this label
-        self.setStyleSheet(
-            """
-            color: white;
-            font-size: {font_size};
-            font-weight: bold
-            """.format(font_size=sc.FONT_XL)
-        )
         # Center align text in the label
         self.setAlignment(Qt.AlignCenter)
 
@@ -104,15 +88,9 @@ class ToolbarComponent(QWidget):
 
         super().__init__(parent=parent)
 
-        # Use CSS to set the background color of the widget
-        self.setStyleSheet(
-            """
-            background-color: {background_color}
-            """.format(background_color=sc.COLOR_TOOLBAR)
-        )
 
         # Set fixed height for the toolbar component
-        self.setFixedHeight(int(0.15*sc.SCREEN_WIDTH))
+        self.setFixedHeight(int(0.15*get_display_metrics().screen_width))
 
         self.toolbar_layout = QHBoxLayout()
         self.toolbar_layout.setContentsMargins(0, 0, 0, 0)
@@ -0,0 +1,90 @@
+"""
+helper_atomic_file.py
+---
+This file contains the functions which write a file atomically: the contents go to a temporary file in the same directory, which then replaces the file, so a power cut never leaves a half-written file behind.
+---
+
+Date: October 18, 2026
+Last Modified: October 18, 2026
+"""
+
+import os
+import stat
+import tempfile
+
+
+def get_new_file_mode():
+    """get_new_file_mode.
+
+    Returns the permission bits open() gives a new file, i.e.: 0o666 less the process's umask
+    """
+    # The umask can only be read by setting it, so set it straight back
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def get_replacement_mode(path):
+    """get_replacement_mode.
+
+    Returns the permission bits a file replacing the one at a path should have: the existing file's, or those of a new file if there is none
+
+    :param path: String path of the file being replaced
+    """
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return get_new_file_mode()
+
+
+def write_atomically(path, write_contents, newline=None):
+    """write_atomically.
+
+    Writes a text file atomically. The temporary file is given the permissions of the file it replaces, since tempfile.mkstemp creates it readable by its owner only.
+
+    :param path: String path of the file
+    :param write_contents: Function taking the open file object, which writes the contents to it
+    :param newline: Newline argument of open() (i.e.: '' for the csv module)
+    """
+    file_dir = os.path.dirname(path)
+    file_descriptor, temp_path = tempfile.mkstemp(
+        dir=file_dir, prefix='.', suffix='{}.tmp'.format(os.path.splitext(path)[1]))
+    try:
+        os.fchmod(file_descriptor, get_replacement_mode(path))
+        with os.fdopen(file_descriptor, 'w', newline=newline) as file:
+            write_contents(file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        # Never leave the temporary file lying around next to the file
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def main():
+    """Main prototype/testing area. Code prototyping and checking happens here.
+
+    Replaces a file that is readable by everyone and checks that it still is, and that a new file gets the umask's permissions.
+    """
+    test_dir = tempfile.mkdtemp()
+    test_path = os.path.join(test_dir, 'test.csv')
+    with open(test_path, 'w') as file:
+        file.write("old\n")
+    os.chmod(test_path, 0o644)
+
+    write_atomically(test_path, lambda file: file.write("new\n"))
+    with open(test_path) as file:
+        print("Contents: {!r}, mode: {:o}, leftover files: {}".format(
+            file.read(), stat.S_IMODE(os.stat(test_path).st_mode), len(os.listdir(test_dir)) - 1))
+
+    new_path = os.path.join(test_dir, 'new.csv')
+    write_atomically(new_path, lambda file: file.write("new\n"))
+    print("New file mode: {:o} (umask mode {:o})".format(
+        stat.S_IMODE(os.stat(new_path).st_mode), get_new_file_mode()))
+
+
+if __name__ == "__main__":
+    # Run the main function
+    main()
@@ -0,0 +1,223 @@
+"""
+helper_calibration_cache.py
+---
+This file contains the CalibrationCache class, which saves the last goal calibration along with a fingerprint of the scene, so it can be used again straight away when Ball-E has not been moved since.
+---
+
+Date: October 18, 2026
+Last Modified: October 18, 2026
+"""
+
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from helper_atomic_file import write_atomically
+
+logger = logging.getLogger(__name__)
+
+CALIBRATION_CACHE_PATH = str(
+    Path.home()) + '/Documents/ball_e_profiles/calibration_cache.json'
+
+# (width, height) photos are shrunk to before their edges are fingerprinted
+FINGERPRINT_SIZE = (64, 36)
+# Cells with edges at least this share as strong as the scene's strongest edges are set in the fingerprint
+FINGERPRINT_EDGE_SHARE = 0.3
+# Scenes whose fingerprints differ in more than this share of their edge cells are not the same setup
+FINGERPRINT_MAX_DIFFERENCE = 0.15
+
+
+def get_scene_fingerprint(frame):
+    """get_scene_fingerprint.
+
+    Returns a fingerprint of the scene in a photo: one bit per cell of a FINGERPRINT_SIZE grid, set where the scene has a strong edge. Edges are measured against the scene's strongest ones, so it does not change with the photo's size or the light, and flat areas (sky, grass) stay unset instead of flipping with noise.
+
+    :param frame: numpy array of the BGR photo
+    """
+    gray_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    small_frame = cv2.resize(gray_frame, FINGERPRINT_SIZE,
+                             interpolation=cv2.INTER_AREA).astype(np.float32)
+    edge_strength = np.abs(cv2.Sobel(small_frame, cv2.CV_32F, 1, 0)) + \
+        np.abs(cv2.Sobel(small_frame, cv2.CV_32F, 0, 1))
+    return np.packbits(edge_strength > FINGERPRINT_EDGE_SHARE * np.percentile(edge_strength, 95))
+
+
+def get_fingerprint_difference(fingerprint, other_fingerprint):
+    """get_fingerprint_difference.
+
+    Returns the share (from 0 to 1) of the edge cells set in either scene fingerprint that are not set in both
+
+    :param fingerprint: numpy array from get_scene_fingerprint
+    :param other_fingerprint: numpy array from get_scene_fingerprint
+    """
+    if fingerprint.shape != other_fingerprint.shape:
+        return 1.0
+    edge_cells = np.count_nonzero(np.unpackbits(fingerprint | other_fingerprint))
+    if edge_cells == 0:
+        return 0.0
+    return np.count_nonzero(np.unpackbits(fingerprint ^ other_fingerprint)) / edge_cells
+
+
+class CachedCalibration():
+    """CachedCalibration.
+
+    The CachedCalibration class holds a calibration found in the cache, sized for the photo it was looked up with
+    """
+
+    def __init__(self, corners, goal_distance, goal_distance_variance, fingerprint_difference):
+        """__init__.
+
+        Initializes the CachedCalibration object
+
+        :param corners: List of the (x, y) tuples of the goal's top-left, top-right, bottom-right, and bottom-left corners in the photo
+        :param goal_distance: Distance (in ft.) of Ball-E from the goal
+        :param goal_distance_variance: Variance (in sq. ft.) of the distance, or None if it is not known
+        :param fingerprint_difference: Share of the scene's fingerprint that changed since the calibration was saved
+        """
+        self.corners = corners
+        self.goal_distance = goal_distance
+        self.goal_distance_variance = goal_distance_variance
+        self.fingerprint_difference = fingerprint_difference
+
+
+class CalibrationCache():
+    """CalibrationCache.
+
+    The CalibrationCache class keeps the last calibration (corners, homography, and distance) in a .json file. The file is only read the first time the cache is used.
+    """
+
+    def __init__(self, cache_path=CALIBRATION_CACHE_PATH):
+        """__init__.
+
+        Initializes the CalibrationCache object
+
+        :param cache_path: String path of the .json file
+        """
+        self.cache_path = cache_path
+        # The saved calibration as a dictionary object, None if there is none, or False if the file has not been read yet
+        self.calibration = False
+
+    def save(self, frame, corners, goal_distance, homography=None, goal_distance_variance=None):
+        """save.
+
+        Saves a calibration with the fingerprint of the photo it was made on. The file is written atomically, so a power cut never leaves half a calibration behind.
+
+        :param frame: numpy array of the BGR photo the corners were selected on
+        :param corners: List of the (x, y) tuples of the goal's top-left, top-right, bottom-right, and bottom-left corners in the photo
+        :param goal_distance: Distance (in ft.) of Ball-E from the goal
+        :param homography: 3x3 numpy array from the goal plane to the photo, or None
+        :param goal_distance_variance: Variance (in sq. ft.) of the distance, or None
+        """
+        self.calibration = {
+            "fingerprint": get_scene_fingerprint(frame).tolist(),
+            "image_size": [frame.shape[1], frame.shape[0]],
+            "corners": [[float(x), float(y)] for x, y in corners],
+            "homography": None if homography is None else np.asarray(homography).tolist(),
+            "goal_distance": goal_distance,
+            "goal_distance_variance": goal_distance_variance,
+            "saved_at": time.time(),
+        }
+
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        write_atomically(self.cache_path,
+                         lambda file: json.dump(self.calibration, file))
+
+    def load(self):
+        """load.
+
+        Returns the saved calibration as a dictionary object, or None if there is none, reading the file only the first time
+        """
+        if self.calibration is False:
+            try:
+                with open(self.cache_path) as file:
+                    self.calibration = json.load(file)
+            except FileNotFoundError:
+                self.calibration = None
+            except ValueError:
+                logger.warning(
+                    "Ignoring unreadable calibration cache %s", self.cache_path)
+                self.calibration = None
+        return self.calibration
+
+    def find(self, frame):
+        """find.
+
+        Returns the saved calibration as a CachedCalibration object with its corners scaled to the photo, if the photo shows the same scene it was saved with. Otherwise returns None.
+
+        :param frame: numpy array of the BGR photo just taken
+        """
+        calibration = self.load()
+        if calibration is None:
+            return None
+
+        fingerprint_difference = get_fingerprint_difference(
+            get_scene_fingerprint(frame), np.array(calibration["fingerprint"], np.uint8))
+        if fingerprint_difference > FINGERPRINT_MAX_DIFFERENCE:
+            logger.info("Scene changed since the last calibration (%.0f%% of the fingerprint differs)",
+                        fingerprint_difference * 100)
+            return None
+
+        saved_width, saved_height = calibration["image_size"]
+        scale_x = frame.shape[1] / saved_width
+        scale_y = frame.shape[0] / saved_height
+        corners = [(int(round(x * scale_x)), int(round(y * scale_y)))
+                   for x, y in calibration["corners"]]
+        return CachedCalibration(corners, calibration["goal_distance"], calibration.get("goal_distance_variance"),
+                                 fingerprint_difference)
+
+    def clear(self):
+        """clear.
+
+        Forgets the saved calibration
+        """
+        self.calibration = None
+        if os.path.exists(self.cache_path):
+            os.remove(self.cache_path)
+
+
+# The CalibrationCache object shared by every screen
+calibration_cache = CalibrationCache()
+
+
+def main():
+    """Main prototype/testing area. Code prototyping and checking happens here.
+
+    Saves a calibration of a drawn goal, then looks it up with a brighter, noisier, and smaller photo of the same setup, with one where Ball-E was nudged, and with one where it was moved, and prints how long each lookup took.
+    """
+    from helper_goal_detector import draw_test_goal
+
+    corners = [(560, 260), (1360, 260), (1360, 860), (560, 860)]
+    frame = draw_test_goal(1920, 1080, corners, 24)
+
+    cache = CalibrationCache(os.path.join(
+        tempfile.mkdtemp(), 'calibration_cache.json'))
+    cache.save(frame, corners, 12.5)
+    # A new cache object reads the file back, like after a restart
+    cache = CalibrationCache(cache.cache_path)
+
+    same_setup_frame = cv2.resize(cv2.add(frame, (12, 12, 12, 0)), (960, 540))
+    noise = np.random.default_rng(1).normal(0, 6, same_setup_frame.shape)
+    same_setup_frame = np.clip(
+        same_setup_frame + noise, 0, 255).astype(np.uint8)
+    nudged_frame = draw_test_goal(
+        1920, 1080, [(x + 40, y) for x, y in corners], 24)
+    moved_frame = draw_test_goal(
+        1920, 1080, [(760, 300), (1460, 320), (1450, 880), (770, 860)], 24)
+
+    for name, test_frame in (("Same setup", same_setup_frame), ("Nudged", nudged_frame), ("Moved", moved_frame)):
+        start_time = time.monotonic()
+        cached_calibration = cache.find(test_frame)
+        lookup_ms = (time.monotonic() - start_time) * 1000
+        print("{}: {} in {:.1f} ms".format(name, "not found" if cached_calibration is None else "corners {}, {} ft., {:.0%} changed".format(
+            cached_calibration.corners, cached_calibration.goal_distance, cached_calibration.fingerprint_difference), lookup_ms))
+
+
+if __name__ == "__main__":
+    # Run the main function
+    main()
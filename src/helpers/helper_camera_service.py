@@ -0,0 +1,521 @@
+"""
+helper_camera_service.py
+---
+This file contains the VideoThread class, which reads the camera feed, and the CameraService class, which keeps one VideoThread running across visits to the screens that show the feed so the camera is not brought up and torn down on every visit.
+---
+
+Date: October 18, 2026
+Last Modified: October 18, 2026
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+
+import cv2
+from PyQt5 import QtGui
+from PyQt5.QtCore import QObject, QThread, QTimer, pyqtSignal
+from PyQt5.QtWidgets import QApplication
+
+from helper_capture_sources import create_capture_source
+from helper_frame_mailbox import FrameMailbox
+from helper_frame_ring import FrameRing
+
+logger = logging.getLogger(__name__)
+
+# How long (in ms) the camera is kept open after the last screen showing it is left
+CAMERA_IDLE_TIMEOUT_MS = 30000
+# How long (in ms) stopping the camera waits for the capture thread to finish
+CAMERA_SHUTDOWN_TIMEOUT_MS = 2000
+
+# (share of the preview size, frame rate) steps the camera feed goes down through when frames are not processed or shown fast enough
+PREVIEW_PROFILE_LADDER = ((1.0, 30), (0.75, 30), (0.75, 20), (0.5, 20), (0.5, 15))
+# How many shown frames each check on whether to step down covers
+ADAPT_WINDOW_FRAMES = 60
+# Step down when more than this share of the frames captured is never shown...
+ADAPT_MAX_DROP_RATIO = 0.25
+# ...or when processing a frame takes more than this share of the time between frames
+ADAPT_MAX_PROCESSING_SHARE = 0.5
+
+# The CameraService object, created the first time it is asked for
+camera_service = None
+
+
+def get_camera_service():
+    """get_camera_service.
+
+    Returns the CameraService object shared by every screen, creating it the first time it is asked for. The QApplication must exist before this is called.
+    """
+    global camera_service
+
+    if camera_service is None:
+        camera_service = CameraService()
+        # Never leave the camera open when the app closes
+        QApplication.instance().aboutToQuit.connect(camera_service.shutdown)
+
+    return camera_service
+
+
+class VideoThread(QThread):
+    """VideoThread.
+
+    This class gets the video stream from from the camera using OpenCV. Each frame is converted and scaled for display on this thread, then left in a single-frame mailbox for the GUI to pick up. The most recent full-size frames are also kept in a ring, so the sharpest of them can be used as the photo.
+
+    The camera is asked for frames that just fit the preview. If processing frames takes too long or the GUI does not show enough of them, the feed steps down PREVIEW_PROFILE_LADDER to a smaller size or lower frame rate.
+    """
+
+    # Emitted when a frame is waiting in the (previously empty) mailbox
+    frame_ready_signal = pyqtSignal()
+
+    def __init__(self, display_width=960, display_height=540, capture_source=None, frame_taps=()):
+        """__init__.
+
+        Initializes OpenCV appropriately
+
+        :param display_width: Width (in pixels) of the preview the frames are shown in
+        :param display_height: Height (in pixels) of the preview the frames are shown in
+        :param capture_source: CaptureSource object to read frames from, or None for the one set up by helper_capture_sources (the CSI camera by default)
+        :param frame_taps: Tuple of the functions handed every frame (see frame_taps)
+        """
+
+        super().__init__()
+        self._run_flag = True
+
+        if capture_source is None:
+            capture_source = create_capture_source()
+        self.capture_source = capture_source
+
+        # Size of the preview, and the maximum size of the frames shown at the current step of PREVIEW_PROFILE_LADDER
+        self.preview_width = display_width
+        self.preview_height = display_height
+        self.display_width = display_width
+        self.display_height = display_height
+        self.profile_level = 0
+        # Set when the capture source must be configured again (before the next frame is read)
+        self.reconfigure_event = threading.Event()
+        # (preview width, preview height, step of PREVIEW_PROFILE_LADDER) the capture source was last opened with, to go back to if it cannot be reopened with new ones
+        self.open_profile = None
+
+        # Times (in s) the most recent frames took to process, and the mailbox counters when the current check started
+        self.processing_times = deque(maxlen=ADAPT_WINDOW_FRAMES)
+        self.window_start_stats = None
+
+        # Functions waiting for a full-resolution still, each called with the BGR frame (or None) on this thread
+        self.still_callbacks = deque()
+
+        # Frames are only handed on while this is set. Otherwise they are read (so the camera does not back up) and thrown away.
+        self.delivery_event = threading.Event()
+        self.delivery_event.set()
+
+        # Holds the newest (QImage, BGR frame) pair until the GUI takes it
+        self.frame_mailbox = FrameMailbox()
+        # Holds the most recent BGR frames, to pick the photo from
+        self.frame_ring = FrameRing()
+        # Tuple of the functions (i.e.: SessionRecorder.submit) that are handed every BGR frame on this thread, even while delivery is paused. They must not block. The CameraService replaces the whole tuple when they change, so it is never changed while it is being read.
+        self.frame_taps = tuple(frame_taps)
+
+    def run(self):
+        """run.
+
+        Captures the video stream
+        """
+
+        self.configure_capture_source()
+        if not self.capture_source.open():
+            logger.error("Could not open the capture source %s",
+                         type(self.capture_source).__name__)
+            self.capture_source.release()
+            return
+        self.open_profile = (self.preview_width,
+                             self.preview_height, self.profile_level)
+
+        while self._run_flag:
+            if self.reconfigure_event.is_set() and not self.reconfigure_capture_source():
+                break
+            if self.still_callbacks:
+                self.take_still()
+
+            ret, cv_img = self.capture_source.read()
+            if ret:
+                for frame_tap in self.frame_taps:
+                    frame_tap(cv_img)
+            if ret and self.delivery_event.is_set():
+                processing_start_time = time.monotonic()
+                self.frame_ring.push(cv_img)
+                # Only one signal is ever queued. If the GUI is busy, newer frames replace the one waiting.
+                if self.frame_mailbox.put((self.convert_cv_qt(cv_img), cv_img)):
+                    self.frame_ready_signal.emit()
+                self.processing_times.append(
+                    time.monotonic() - processing_start_time)
+                self.check_profile()
+        # shut down capture system
+        self.capture_source.release()
+
+    def configure_capture_source(self):
+        """configure_capture_source.
+
+        Works out the size and frame rate of the current step of PREVIEW_PROFILE_LADDER and asks the capture source for them. Returns True if the capture source must be reopened.
+        """
+        self.reconfigure_event.clear()
+        self.processing_times.clear()
+        self.window_start_stats = None
+
+        size_share, framerate = PREVIEW_PROFILE_LADDER[self.profile_level]
+        self.display_width = max(1, int(self.preview_width*size_share))
+        self.display_height = max(1, int(self.preview_height*size_share))
+        logger.info("Camera feed: %dx%d at %d fps", self.display_width,
+                    self.display_height, framerate)
+        return self.capture_source.configure(self.display_width, self.display_height, framerate)
+
+    def reconfigure_capture_source(self):
+        """reconfigure_capture_source.
+
+        Configures the capture source for the current preview size and step of PREVIEW_PROFILE_LADDER, reopening it if needed. If it cannot be reopened, goes back to the profile it was last opened with. Returns False if it cannot be reopened with that either, in which case the capture thread has to stop.
+        """
+        if not self.configure_capture_source():
+            return True
+
+        self.capture_source.release()
+        if self.capture_source.open():
+            self.open_profile = (self.preview_width,
+                                 self.preview_height, self.profile_level)
+            return True
+
+        logger.error("Could not reopen the capture source %s at %dx%d, going back to the last profile that worked",
+                     type(self.capture_source).__name__, self.display_width, self.display_height)
+        self.capture_source.release()
+        self.preview_width, self.preview_height, self.profile_level = self.open_profile
+        self.configure_capture_source()
+        if self.capture_source.open():
+            return True
+
+        logger.error("Could not reopen the capture source %s",
+                     type(self.capture_source).__name__)
+        return False
+
+    def check_profile(self):
+        """check_profile.
+
+        Every ADAPT_WINDOW_FRAMES frames, steps down PREVIEW_PROFILE_LADDER if too many frames were not shown or processing them took too long
+        """
+        stats = self.frame_mailbox.get_stats()
+        if self.window_start_stats is None:
+            self.window_start_stats = stats
+            return
+
+        captured_count = stats["captured"] - \
+            self.window_start_stats["captured"]
+        if captured_count < ADAPT_WINDOW_FRAMES:
+            return
+
+        drop_ratio = (stats["dropped"] -
+                      self.window_start_stats["dropped"]) / captured_count
+        processing_share = sum(self.processing_times) / len(self.processing_times) * \
+            PREVIEW_PROFILE_LADDER[self.profile_level][1]
+        self.window_start_stats = stats
+
+        if (drop_ratio > ADAPT_MAX_DROP_RATIO or processing_share > ADAPT_MAX_PROCESSING_SHARE) and \
+                self.profile_level < len(PREVIEW_PROFILE_LADDER) - 1:
+            logger.info("Camera feed falling behind (%.0f%% of frames dropped, %.0f%% of the frame time spent processing), stepping down",
+                        drop_ratio*100, processing_share*100)
+            self.profile_level += 1
+            self.reconfigure_event.set()
+
+    def set_preview_size(self, preview_width, preview_height):
+        """set_preview_size.
+
+        Sizes the frames for a new preview size, starting again from the top of PREVIEW_PROFILE_LADDER. The capture source is only reopened if it needs to be for the new size (i.e.: the CSI camera needs a different sensor mode).
+
+        :param preview_width: Width (in pixels) of the preview the frames are shown in
+        :param preview_height: Height (in pixels) of the preview the frames are shown in
+        """
+        if (preview_width, preview_height) == (self.preview_width, self.preview_height) and self.profile_level == 0:
+            return
+
+        self.preview_width = preview_width
+        self.preview_height = preview_height
+        self.profile_level = 0
+        self.reconfigure_event.set()
+
+    def request_still(self, still_callback):
+        """request_still.
+
+        Asks for a frame at the camera's full resolution, separate from the (smaller) preview frames. The preview pauses while it is taken.
+
+        :param still_callback: Function called with the BGR frame (or None if it could not be taken). It runs on this thread.
+        """
+        self.still_callbacks.append(still_callback)
+
+    def take_still(self):
+        """take_still.
+
+        Takes a full-resolution still and hands it to every function waiting for one
+        """
+        still_frame = self.capture_source.capture_still()
+        while self.still_callbacks:
+            self.still_callbacks.popleft()(still_frame)
+
+    def convert_cv_qt(self, cv_img):
+        """convert_cv_qt.
+
+        Converts an OpenCV (BGR) image to an RGB QImage that fits in the display size, keeping its aspect ratio
+
+        :param cv_img: numpy array of the BGR image
+        """
+        h, w = cv_img.shape[:2]
+        scale = min(self.display_width/w, self.display_height/h)
+        # Sources like the CSI camera already deliver frames at the display size, unless the display size changed without the source being reopened
+        if scale < 1:
+            cv_img = cv2.resize(cv_img, (max(1, int(w*scale)), max(1, int(h*scale))),
+                                interpolation=cv2.INTER_AREA)
+        elif int(w*scale) > w and int(h*scale) > h:
+            cv_img = cv2.resize(cv_img, (int(w*scale), int(h*scale)),
+                                interpolation=cv2.INTER_LINEAR)
+        rgb_image = cv2.cvtColor(cv_img, cv2.COLOR_BGR2RGB)
+
+        h, w, ch = rgb_image.shape
+        bytes_per_line = ch * w
+        # The copy owns its pixels, so it outlives rgb_image when handed to the GUI thread
+        return QtGui.QImage(
+            rgb_image.data, w, h, bytes_per_line, QtGui.QImage.Format_RGB888).copy()
+
+    def set_delivering(self, delivering):
+        """set_delivering.
+
+        Starts or pauses handing frames on. Frames from before a pause are thrown away when delivery starts again, so nothing stale is shown or picked as the photo.
+
+        :param delivering: Boolean value which when True hands frames on
+        """
+        if delivering and not self.delivery_event.is_set():
+            self.frame_mailbox.clear()
+            self.frame_ring.clear()
+            self.delivery_event.set()
+        elif not delivering:
+            self.delivery_event.clear()
+
+    def get_sharpest_frame(self):
+        """get_sharpest_frame.
+
+        Returns a copy of the sharpest of the most recent frames, or None if no frame was captured
+        """
+        return self.frame_ring.get_sharpest_frame()
+
+    def get_recent_frames(self):
+        """get_recent_frames.
+
+        Returns a (N, height, width, channels) numpy array with a copy of the most recent frames, oldest first, or None if no frame was captured
+        """
+        return self.frame_ring.get_frames()
+
+    def get_stats(self):
+        """get_stats.
+
+        Returns the capture fps, display fps, captured/displayed/dropped frame counters, average processing time (in ms) of the most recent frames, and step of PREVIEW_PROFILE_LADDER as a dictionary object
+        """
+        stats = self.frame_mailbox.get_stats()
+        processing_times = list(self.processing_times)
+        stats["processing_ms"] = sum(processing_times) / \
+            len(processing_times) * 1000 if processing_times else 0.0
+        stats["profile_level"] = self.profile_level
+        return stats
+
+    def stop(self, timeout_ms=CAMERA_SHUTDOWN_TIMEOUT_MS):
+        """stop.
+
+        Sets run flag to False and waits a bounded time for the thread to finish. Returns True if it finished in time.
+
+        :param timeout_ms: How long (in ms) to wait for the thread
+        """
+        self._run_flag = False
+        return self.wait(timeout_ms)
+
+
+class CameraService(QObject):
+    """CameraService.
+
+    The CameraService class hands out one running VideoThread to every screen that attaches to it. When the last screen detaches, frame delivery pauses but the camera stays open for CAMERA_IDLE_TIMEOUT_MS, so coming back is instant.
+
+    Frame taps (i.e.: the session recorder) are kept here rather than on the VideoThread, so they carry over to every VideoThread the camera is opened with. The camera stays open while there are any.
+    """
+
+    def __init__(self, idle_timeout_ms=CAMERA_IDLE_TIMEOUT_MS, capture_source_factory=create_capture_source, parent=None):
+        """__init__.
+
+        Initializes the CameraService object. The camera is only opened when a screen first attaches.
+
+        :param idle_timeout_ms: How long (in ms) the camera is kept open with nothing attached
+        :param capture_source_factory: Function returning a new CaptureSource object each time the camera is opened
+        :param parent: Default arg.
+        """
+        super().__init__(parent=parent)
+
+        self.capture_source_factory = capture_source_factory
+
+        self.video_thread = None
+        # Slots currently connected to the VideoThread's frame_ready_signal
+        self.consumers = list()
+        # Functions handed every frame, given to each VideoThread created
+        self.frame_taps = tuple()
+        # Threads that did not stop in time, kept alive until they do
+        self.finishing_threads = list()
+
+        self.idle_timer = QTimer(self)
+        self.idle_timer.setSingleShot(True)
+        self.idle_timer.setInterval(idle_timeout_ms)
+        self.idle_timer.timeout.connect(self.shutdown)
+
+    def attach(self, frame_ready_slot):
+        """attach.
+
+        Connects a slot to the frames of the camera, opening it if it is not open yet, and returns the VideoThread object
+
+        :param frame_ready_slot: Slot called when a new frame is waiting in the VideoThread's frame_mailbox
+        """
+        self.open_camera()
+
+        if frame_ready_slot not in self.consumers:
+            self.video_thread.frame_ready_signal.connect(frame_ready_slot)
+            self.consumers.append(frame_ready_slot)
+        self.video_thread.set_delivering(True)
+
+        return self.video_thread
+
+    def detach(self, frame_ready_slot):
+        """detach.
+
+        Disconnects a slot from the frames of the camera. When nothing is attached anymore, delivery pauses and the idle timeout starts.
+
+        :param frame_ready_slot: Slot given to attach()
+        """
+        if frame_ready_slot not in self.consumers:
+            return
+
+        self.consumers.remove(frame_ready_slot)
+        self.video_thread.frame_ready_signal.disconnect(frame_ready_slot)
+
+        if len(self.consumers) == 0:
+            self.video_thread.set_delivering(False)
+            self.start_idle_timeout()
+
+    def add_frame_tap(self, frame_tap):
+        """add_frame_tap.
+
+        Hands every frame captured from now on to a function as well, i.e.: to record the session, opening the camera if it is not open yet. The camera stays open until the function is removed.
+
+        :param frame_tap: Function taking the numpy array of the BGR frame. It runs on the capture thread, so it must return quickly and must not change the frame.
+        """
+        if frame_tap not in self.frame_taps:
+            self.frame_taps = self.frame_taps + (frame_tap,)
+        self.open_camera()
+        self.video_thread.frame_taps = self.frame_taps
+
+    def remove_frame_tap(self, frame_tap):
+        """remove_frame_tap.
+
+        Stops handing frames to a function. If nothing else uses the camera, the idle timeout starts.
+
+        :param frame_tap: Function given to add_frame_tap()
+        """
+        if frame_tap not in self.frame_taps:
+            return
+
+        self.frame_taps = tuple(
+            tap for tap in self.frame_taps if tap != frame_tap)
+        if self.video_thread is not None:
+            self.video_thread.frame_taps = self.frame_taps
+            self.start_idle_timeout()
+
+    def open_camera(self):
+        """open_camera.
+
+        Starts a VideoThread with the frame taps if the camera is not open, and stops the idle timeout
+        """
+        self.idle_timer.stop()
+
+        if self.video_thread is None or self.video_thread.isFinished():
+            self.video_thread = VideoThread(
+                capture_source=self.capture_source_factory(), frame_taps=self.frame_taps)
+            self.video_thread.start()
+
+    def start_idle_timeout(self):
+        """start_idle_timeout.
+
+        Starts the idle timeout if no screen is attached and no frame tap is left
+        """
+        if len(self.consumers) == 0 and len(self.frame_taps) == 0:
+            self.idle_timer.start()
+
+    def shutdown(self):
+        """shutdown.
+
+        Closes the camera, waiting at most CAMERA_SHUTDOWN_TIMEOUT_MS for the capture thread to finish
+        """
+        self.idle_timer.stop()
+
+        for frame_ready_slot in self.consumers:
+            self.video_thread.frame_ready_signal.disconnect(frame_ready_slot)
+        self.consumers = list()
+
+        if self.video_thread is not None:
+            if not self.video_thread.stop():
+                logger.warning(
+                    "Capture thread did not stop within %d ms", CAMERA_SHUTDOWN_TIMEOUT_MS)
+                # Deleting a running thread crashes the app, so keep it until it has finished
+                self.finishing_threads.append(self.video_thread)
+            self.video_thread = None
+
+        self.finishing_threads = [
+            thread for thread in self.finishing_threads if thread.isRunning()]
+
+    def is_open(self):
+        """is_open.
+
+        Returns True if the camera is open
+        """
+        return self.video_thread is not None and not self.video_thread.isFinished()
+
+
+def main():
+    """Main prototype/testing area. Code prototyping and checking happens here.
+
+    Visits a camera screen 10 times with a capture source that takes 1 s to open (like the CSI camera) and prints how long each visit took to show its first frame. Only the first visit should have to wait for the camera.
+    """
+    import sys
+
+    from helper_capture_sources import SyntheticCaptureSource
+
+    class SlowCaptureSource(SyntheticCaptureSource):
+        """Stands in for the CSI camera, whose pipeline takes about a second to bring up"""
+
+        def open(self):
+            time.sleep(1)
+            return super().open()
+
+    app = QApplication(sys.argv)
+    service = CameraService(
+        capture_source_factory=lambda: SlowCaptureSource(960, 540, 30))
+    frame_times = list()
+
+    def on_frame_ready():
+        if service.video_thread.frame_mailbox.take() is not None:
+            frame_times.append(time.monotonic())
+            app.quit()
+
+    for visit in range(10):
+        visit_start_time = time.monotonic()
+        service.attach(on_frame_ready)
+        app.exec_()
+        service.detach(on_frame_ready)
+        print("Visit {}: first frame after {:.0f} ms".format(
+            visit + 1, (frame_times[-1] - visit_start_time) * 1000))
+
+    shutdown_start_time = time.monotonic()
+    service.shutdown()
+    print("Shutdown took {:.0f} ms, camera open: {}".format(
+        (time.monotonic() - shutdown_start_time) * 1000, service.is_open()))
+
+
+if __name__ == "__main__":
+    # Run the main function
+    main()
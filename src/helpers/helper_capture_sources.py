@@ -0,0 +1,611 @@
+"""
+helper_capture_sources.py
+---
+This file contains the capture sources the camera feed can be read from: Ball-E's CSI camera, a V4L2 (i.e.: USB) camera, a video file or folder of images, or a generated test pattern. Every source reads frames the same way, so the camera feed (and everything after it) can be run and profiled on any Linux computer.
+---
+
+Date: October 18, 2026
+Last Modified: October 18, 2026
+"""
+
+import abc
+import glob
+import logging
+import math
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Set this environment variable to read the camera feed from somewhere other than the CSI camera, i.e.:
+# csi, v4l2:/dev/video0, file:/path/to/video.mp4, file:/path/to/images/, synthetic:1280x720@60
+CAPTURE_SOURCE_ENV = "BALL_E_CAPTURE_SOURCE"
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp')
+
+# Horizontal field of view (in degrees) of Ball-E's camera lens over the whole sensor
+CSI_LENS_HORIZONTAL_FOV_DEGREES = 62.2
+
+# Sensor modes of Ball-E's camera (IMX219) as (width, height, maximum fps, share of the sensor's width read, share of its height read), largest first. The modes that do not read the whole sensor crop it, which narrows the field of view.
+CSI_SENSOR_MODES = ((3264, 2464, 21, 1.0, 1.0), (3264, 1848, 28, 1.0, 0.75),
+                    (1920, 1080, 30, 0.588, 0.438), (1640, 1232, 30, 1.0, 1.0), (1280, 720, 60, 0.784, 0.584))
+# The sensor modes the camera feed is picked from: only those that read the whole sensor, so the field of view never changes with the preview size or frame rate
+CSI_FULL_FOV_SENSOR_MODES = tuple(
+    mode for mode in CSI_SENSOR_MODES if mode[3:] == (1.0, 1.0))
+# How many frames a still capture lets the camera's auto exposure settle for
+STILL_WARMUP_FRAMES = 10
+
+
+def create_capture_source(source_spec=None):
+    """create_capture_source.
+
+    Returns the capture source described by a string (see CAPTURE_SOURCE_ENV for examples). If no string is given, the CAPTURE_SOURCE_ENV environment variable is used, and if that is not set either, the CSI camera.
+
+    :param source_spec: String describing the capture source, or None
+    """
+    if source_spec is None:
+        source_spec = os.environ.get(CAPTURE_SOURCE_ENV, "csi")
+
+    source_type, _, source_arg = source_spec.partition(':')
+
+    if source_type == "csi":
+        return CSICaptureSource()
+    elif source_type == "v4l2":
+        # A number is the device's index, which cv2.VideoCapture only takes as an integer
+        if source_arg.isdigit():
+            return V4L2CaptureSource(int(source_arg))
+        return V4L2CaptureSource(source_arg if source_arg else 0)
+    elif source_type == "file":
+        return FileCaptureSource(source_arg)
+    elif source_type == "synthetic":
+        if source_arg:
+            size, _, fps = source_arg.partition('@')
+            width, height = size.split('x')
+            return SyntheticCaptureSource(int(width), int(height), float(fps) if fps else 30)
+        return SyntheticCaptureSource()
+    else:
+        raise ValueError(
+            "{} is not a valid capture source.".format(source_spec))
+
+
+def select_sensor_mode(display_width, display_height, framerate):
+    """select_sensor_mode.
+
+    Returns the smallest of CSI_FULL_FOV_SENSOR_MODES that can run at a frame rate and still fill a display size, or the biggest one that can run at the frame rate if none of them fill it (or the fastest one if none of them can run at it)
+
+    :param display_width: Width (in pixels) of the display size
+    :param display_height: Height (in pixels) of the display size
+    :param framerate: Frame rate (in fps) the mode must run at
+    """
+    fast_modes = [mode for mode in CSI_FULL_FOV_SENSOR_MODES if mode[2] >= framerate]
+    if len(fast_modes) == 0:
+        fast_modes = [max(CSI_FULL_FOV_SENSOR_MODES, key=lambda mode: mode[2])]
+
+    big_modes = [mode for mode in fast_modes
+                 if mode[0] >= display_width and mode[1] >= display_height]
+    if len(big_modes) > 0:
+        return min(big_modes, key=lambda mode: mode[0]*mode[1])
+    return max(fast_modes, key=lambda mode: mode[0]*mode[1])
+
+
+def fit_size(width, height, max_width, max_height):
+    """fit_size.
+
+    Returns the biggest (width, height) tuple with the aspect ratio of a size that fits in a maximum size
+
+    :param width: Width of the size
+    :param height: Height of the size
+    :param max_width: Width it must fit in
+    :param max_height: Height it must fit in
+    """
+    scale = min(max_width/width, max_height/height)
+    return max(1, int(width*scale)), max(1, int(height*scale))
+
+
+class FramePacer():
+    """FramePacer.
+
+    The FramePacer class sleeps just long enough between frames to keep a steady frame rate
+    """
+
+    def __init__(self, fps):
+        """__init__.
+
+        Initializes the FramePacer object
+
+        :param fps: Frames per second to keep to, or 0 to not wait at all
+        """
+        self.frame_interval = 1.0/fps if fps > 0 else 0.0
+        self.next_frame_time = None
+
+    def wait(self):
+        """wait.
+
+        Waits until the next frame is due
+        """
+        if self.frame_interval == 0.0:
+            return
+
+        now = time.monotonic()
+        if self.next_frame_time is None or now - self.next_frame_time > self.frame_interval:
+            # First frame, or too far behind to catch up: start counting from now
+            self.next_frame_time = now
+        elif self.next_frame_time > now:
+            time.sleep(self.next_frame_time - now)
+        self.next_frame_time += self.frame_interval
+
+
+class CaptureSource(abc.ABC):
+    """CaptureSource.
+
+    The CaptureSource class is what every capture source looks like to the camera feed. read() returns the same (success, BGR frame) tuple as cv2.VideoCapture.read().
+    """
+
+    @abc.abstractmethod
+    def open(self):
+        """open.
+
+        Opens the source. Returns True if frames can be read from it.
+        """
+
+    @abc.abstractmethod
+    def read(self):
+        """read.
+
+        Returns a (success, BGR frame) tuple, waiting for the next frame if needed
+        """
+
+    @abc.abstractmethod
+    def release(self):
+        """release.
+
+        Closes the source
+        """
+
+    def configure(self, display_width, display_height, framerate):
+        """configure.
+
+        Asks the source for frames that fit in a display size at a frame rate. Returns True if the source must be reopened for it to take effect. Sources that cannot change ignore it.
+
+        :param display_width: Maximum width (in pixels) of the frames
+        :param display_height: Maximum height (in pixels) of the frames
+        :param framerate: Frame rate (in fps) of the frames
+        """
+        return False
+
+    def capture_still(self):
+        """capture_still.
+
+        Returns a BGR frame at the source's full resolution, or None if it could not be taken. The source must be open and is left open. Sources that cannot take bigger frames than the preview return the next frame.
+        """
+        ret, frame = self.read()
+        return frame if ret else None
+
+    def get_horizontal_fov_degrees(self):
+        """get_horizontal_fov_degrees.
+
+        Returns the horizontal field of view (in degrees) of the frames read with the current settings, or None if the source does not know it
+        """
+        return None
+
+
+class VideoCaptureSource(CaptureSource):
+    """VideoCaptureSource.
+
+    The VideoCaptureSource class reads from a cv2.VideoCapture object. Subclasses describe which one.
+    """
+
+    def __init__(self):
+        """__init__.
+
+        Initializes the VideoCaptureSource object
+        """
+        self.capture = None
+
+    @abc.abstractmethod
+    def create_capture(self):
+        """create_capture.
+
+        Returns the (not yet read from) cv2.VideoCapture object of this source
+        """
+
+    def open(self):
+        """open.
+
+        Opens the source. Returns True if frames can be read from it.
+        """
+        self.capture = self.create_capture()
+        return self.capture.isOpened()
+
+    def read(self):
+        """read.
+
+        Returns a (success, BGR frame) tuple, waiting for the next frame if needed
+        """
+        return self.capture.read()
+
+    def release(self):
+        """release.
+
+        Closes the source
+        """
+        if self.capture is not None:
+            self.capture.release()
+            self.capture = None
+
+
+class CSICaptureSource(VideoCaptureSource):
+    """CSICaptureSource.
+
+    The CSICaptureSource class reads from the Jetson's CSI camera through GStreamer. The camera's scaler shrinks the frames to the display size, so they arrive ready to show.
+    """
+
+    def __init__(self, capture_width=1920, capture_height=1080, display_width=960, display_height=540, framerate=30, flip_method=0):
+        """__init__.
+
+        Initializes the CSICaptureSource object
+
+        :param capture_width: Width (in pixels) to capture feed
+        :param capture_height: Height (in pixels) to capture feed
+        :param display_width: Width (in pixels) to display feed
+        :param display_height: Height (in pixels) to display feed
+        :param framerate: Framerate (in fps) to display feed
+        :param flip_method: Argument for rotation of image capturing and displaying
+        """
+        super().__init__()
+
+        self.capture_width = capture_width
+        self.capture_height = capture_height
+        self.display_width = display_width
+        self.display_height = display_height
+        self.framerate = framerate
+        self.flip_method = flip_method
+
+    def create_capture(self):
+        """create_capture.
+
+        Returns the cv2.VideoCapture object of the GStreamer pipeline
+        """
+        return cv2.VideoCapture(self.gstreamer_pipeline(), cv2.CAP_GSTREAMER)
+
+    def configure(self, display_width, display_height, framerate):
+        """configure.
+
+        Picks the smallest full field of view sensor mode that fills the display size at the frame rate, and shrinks its frames to fit the display size. Returns True if the sensor mode or frame rate changed, as only then must the pipeline be reopened. Otherwise the frames keep their size until the pipeline is next opened, and are scaled to the display size as they are shown.
+
+        :param display_width: Maximum width (in pixels) of the frames
+        :param display_height: Maximum height (in pixels) of the frames
+        :param framerate: Frame rate (in fps) of the frames
+        """
+        previous_settings = (self.capture_width,
+                             self.capture_height, self.framerate)
+
+        self.capture_width, self.capture_height, max_framerate = select_sensor_mode(
+            display_width, display_height, framerate)[:3]
+        self.framerate = min(framerate, max_framerate)
+        self.display_width, self.display_height = fit_size(
+            self.capture_width, self.capture_height, display_width, display_height)
+        return (self.capture_width, self.capture_height, self.framerate) != previous_settings
+
+    def capture_still(self):
+        """capture_still.
+
+        Stops the preview, takes a frame with the biggest of CSI_FULL_FOV_SENSOR_MODES (which has the same field of view as the preview, so points line up), and starts the preview again. Returns the BGR frame, or None if it could not be taken.
+        """
+        preview_settings = (self.capture_width, self.capture_height,
+                            self.display_width, self.display_height, self.framerate)
+        still_mode = max(CSI_FULL_FOV_SENSOR_MODES,
+                         key=lambda mode: mode[0]*mode[1])
+
+        self.release()
+        self.capture_width, self.capture_height, self.framerate = still_mode[:3]
+        self.display_width, self.display_height = still_mode[:2]
+
+        frame = None
+        if self.open():
+            for _ in range(STILL_WARMUP_FRAMES):
+                ret, warmup_frame = self.capture.read()
+                if ret:
+                    frame = warmup_frame
+        self.release()
+
+        (self.capture_width, self.capture_height,
+         self.display_width, self.display_height, self.framerate) = preview_settings
+        if not self.open():
+            logger.error("Could not reopen the CSI camera after taking a still")
+        return frame
+
+    def get_horizontal_fov_degrees(self):
+        """get_horizontal_fov_degrees.
+
+        Returns the horizontal field of view (in degrees) of the sensor mode being captured, which is narrower than the lens's if the mode crops the sensor, or None if the capture size is not one of the sensor modes
+        """
+        for width, height, _, width_share, _ in CSI_SENSOR_MODES:
+            if (width, height) == (self.capture_width, self.capture_height):
+                return math.degrees(2 * math.atan(width_share * math.tan(math.radians(CSI_LENS_HORIZONTAL_FOV_DEGREES) / 2)))
+        return None
+
+    def gstreamer_pipeline(self):
+        """gstreamer_pipeline.
+
+        Uses gstreamer to talk to camera module
+        """
+
+        return (
+            "nvarguscamerasrc ! "
+            "video/x-raw(memory:NVMM), "
+            "width=(int)%d, height=(int)%d, "
+            "format=(string)NV12, framerate=(fraction)%d/1 ! "
+            "nvvidconv flip-method=%d ! "
+            "video/x-raw, width=(int)%d, height=(int)%d, format=(string)BGRx ! "
+            "videoconvert ! "
+            "video/x-raw, format=(string)BGR ! appsink"
+            % (
+                self.capture_width,
+                self.capture_height,
+                self.framerate,
+                self.flip_method,
+                self.display_width,
+                self.display_height,
+            )
+        )
+
+
+class V4L2CaptureSource(VideoCaptureSource):
+    """V4L2CaptureSource.
+
+    The V4L2CaptureSource class reads from a V4L2 camera device (i.e.: a USB webcam)
+    """
+
+    def __init__(self, device=0, width=None, height=None, fps=None):
+        """__init__.
+
+        Initializes the V4L2CaptureSource object
+
+        :param device: Integer index or String path (i.e.: /dev/video0) of the device
+        :param width: Width (in pixels) to ask the device for, or None for its default
+        :param height: Height (in pixels) to ask the device for, or None for its default
+        :param fps: Frame rate to ask the device for, or None for its default
+        """
+        super().__init__()
+
+        self.device = device
+        self.width = width
+        self.height = height
+        self.fps = fps
+
+    def create_capture(self):
+        """create_capture.
+
+        Returns the cv2.VideoCapture object of the device
+        """
+        capture = cv2.VideoCapture(self.device, cv2.CAP_V4L2)
+        if self.width is not None:
+            capture.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
+        if self.height is not None:
+            capture.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+        if self.fps is not None:
+            capture.set(cv2.CAP_PROP_FPS, self.fps)
+        return capture
+
+    def configure(self, display_width, display_height, framerate):
+        """configure.
+
+        Asks the device for the display size and frame rate (it uses the closest it supports). Returns True, as the device must be reopened.
+
+        :param display_width: Maximum width (in pixels) of the frames
+        :param display_height: Maximum height (in pixels) of the frames
+        :param framerate: Frame rate (in fps) of the frames
+        """
+        self.width = display_width
+        self.height = display_height
+        self.fps = framerate
+        return True
+
+
+class FileCaptureSource(CaptureSource):
+    """FileCaptureSource.
+
+    The FileCaptureSource class plays a video file, or a folder (or glob pattern) of images in name order, at a steady frame rate. It starts over when it reaches the end.
+    """
+
+    def __init__(self, path, fps=None, loop=True):
+        """__init__.
+
+        Initializes the FileCaptureSource object
+
+        :param path: String path of a video file, a folder of images, or a glob pattern of images
+        :param fps: Frame rate to play at, None for the video's own frame rate (30 for images), or 0 for as fast as possible
+        :param loop: Boolean value which when True starts over at the end instead of stopping
+        """
+        self.path = path
+        self.fps = fps
+        self.loop = loop
+
+        self.capture = None
+        self.image_paths = None
+        self.image_index = 0
+        self.frame_pacer = None
+
+    def open(self):
+        """open.
+
+        Opens the video file or lists the images. Returns True if frames can be read from it.
+        """
+        if os.path.isdir(self.path):
+            self.image_paths = sorted(os.path.join(self.path, name) for name in os.listdir(self.path)
+                                      if name.lower().endswith(IMAGE_EXTENSIONS))
+        elif glob.has_magic(self.path):
+            self.image_paths = sorted(glob.glob(self.path))
+
+        if self.image_paths is not None:
+            native_fps = 30
+            is_open = len(self.image_paths) > 0
+        else:
+            self.capture = cv2.VideoCapture(self.path)
+            native_fps = self.capture.get(cv2.CAP_PROP_FPS) or 30
+            is_open = self.capture.isOpened()
+
+        self.frame_pacer = FramePacer(
+            native_fps if self.fps is None else self.fps)
+        return is_open
+
+    def read(self):
+        """read.
+
+        Returns a (success, BGR frame) tuple, waiting for the next frame if needed
+        """
+        self.frame_pacer.wait()
+
+        if self.image_paths is not None:
+            if self.image_index >= len(self.image_paths):
+                if not self.loop:
+                    return False, None
+                self.image_index = 0
+            frame = cv2.imread(self.image_paths[self.image_index])
+            self.image_index += 1
+            return frame is not None, frame
+
+        ret, frame = self.capture.read()
+        if not ret and self.loop:
+            self.capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ret, frame = self.capture.read()
+        return ret, frame
+
+    def release(self):
+        """release.
+
+        Closes the video file
+        """
+        if self.capture is not None:
+            self.capture.release()
+            self.capture = None
+
+
+class SyntheticCaptureSource(CaptureSource):
+    """SyntheticCaptureSource.
+
+    The SyntheticCaptureSource class generates a moving test pattern at any resolution and frame rate, so nothing but this code is needed to feed frames. Like the CSI camera, it can be configured to generate smaller frames than its full resolution.
+    """
+
+    def __init__(self, width=1920, height=1080, fps=30):
+        """__init__.
+
+        Initializes the SyntheticCaptureSource object
+
+        :param width: Full width (in pixels) of the frames
+        :param height: Full height (in pixels) of the frames
+        :param fps: Frame rate to generate at, or 0 for as fast as possible
+        """
+        self.full_width = width
+        self.full_height = height
+        self.width = width
+        self.height = height
+        self.fps = fps
+
+        self.background = None
+        self.frame_count = 0
+        self.frame_pacer = None
+
+    def open(self):
+        """open.
+
+        Draws the still part of the pattern. Always returns True.
+        """
+        # Color gradient background with a white frame, roughly where a goal would be
+        x_ramp = np.linspace(0, 255, self.width, dtype=np.uint8)
+        y_ramp = np.linspace(0, 255, self.height, dtype=np.uint8)
+        self.background = np.empty((self.height, self.width, 3), np.uint8)
+        self.background[:, :, 0] = x_ramp[np.newaxis, :]
+        self.background[:, :, 1] = y_ramp[:, np.newaxis]
+        self.background[:, :, 2] = 64
+        cv2.rectangle(self.background, (self.width//4, self.height//4),
+                      (3*self.width//4, 3*self.height//4), (255, 255, 255), max(2, self.width//200))
+
+        self.frame_count = 0
+        self.frame_pacer = FramePacer(self.fps)
+        return True
+
+    def read(self):
+        """read.
+
+        Returns a (success, BGR frame) tuple, waiting for the next frame if needed
+        """
+        self.frame_pacer.wait()
+
+        frame = self.background.copy()
+        # A bar sweeping across the frame and the frame number make every frame different
+        bar_width = max(1, self.width//40)
+        bar_x = (self.frame_count*bar_width) % self.width
+        frame[:, bar_x:bar_x+bar_width] = 255
+        cv2.putText(frame, str(self.frame_count), (20, max(30, self.height//10)),
+                    cv2.FONT_HERSHEY_SIMPLEX, max(1, self.height//360), (0, 0, 0), 2)
+
+        self.frame_count += 1
+        return True, frame
+
+    def release(self):
+        """release.
+
+        Frees the pattern
+        """
+        self.background = None
+
+    def configure(self, display_width, display_height, framerate):
+        """configure.
+
+        Generates frames that fit in the display size at the frame rate from now on. Returns True, as the pattern must be drawn again.
+
+        :param display_width: Maximum width (in pixels) of the frames
+        :param display_height: Maximum height (in pixels) of the frames
+        :param framerate: Frame rate (in fps) of the frames
+        """
+        self.width, self.height = fit_size(
+            self.full_width, self.full_height, display_width, display_height)
+        self.fps = framerate
+        return True
+
+    def capture_still(self):
+        """capture_still.
+
+        Returns a frame of the pattern at its full resolution
+        """
+        still_source = SyntheticCaptureSource(
+            self.full_width, self.full_height, 0)
+        still_source.open()
+        ret, frame = still_source.read()
+        still_source.release()
+        return frame
+
+
+def main():
+    """Main prototype/testing area. Code prototyping and checking happens here.
+
+    Reads 300 frames from the capture source given as the first argument (or CAPTURE_SOURCE_ENV) and prints how fast they came in, i.e.: python3 helper_capture_sources.py synthetic:1920x1080@0
+    """
+    capture_source = create_capture_source(
+        sys.argv[1] if len(sys.argv) > 1 else None)
+    if not capture_source.open():
+        print("Could not open the capture source")
+        return
+
+    frame_count = 300
+    start_time = time.monotonic()
+    for _ in range(frame_count):
+        ret, frame = capture_source.read()
+        if not ret:
+            break
+    elapsed_time = time.monotonic() - start_time
+    capture_source.release()
+
+    print("{}: {} frames of {}x{} at {:.1f} fps".format(
+        type(capture_source).__name__, frame_count, frame.shape[1], frame.shape[0], frame_count/elapsed_time))
+
+
+if __name__ == "__main__":
+    # Run the main function
+    main()
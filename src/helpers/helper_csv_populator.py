@@ -15,6 +15,8 @@ import os
 import random
 from pathlib import Path
 
+from helper_goalie_history import GoalieHistory
+
 
 def main(dirname):
     """main.
@@ -30,15 +32,18 @@ def main(dirname):
         # Go through each directory in the goalie_profiles directory and populate with a .csv file
         for r, _, profile_infos in os.walk(location):
             for each_profile_info in profile_infos:
-                with open(os.path.join(r, each_profile_info), 'w', newline='') as file:
-                    writer = csv.writer(file, delimiter=',')
-                    writer.writerow(
-                        ["Drill Name", "Date Completed (Most recent prioritized)"])
-                    for counter in range(50):
-                        curr_date = datetime.datetime.today() - datetime.timedelta(days=counter)
-                        format_date = curr_date.strftime('%m/%d/%Y')
-                        writer.writerow(
-                            ["Drill {}".format(counter+1), format_date])
+                # Leave the goalie history's sidecar index files alone
+                if not each_profile_info.endswith('.csv'):
+                    continue
+                profile_path = os.path.join(r, each_profile_info)
+                # Start from an empty history, then append the drills oldest first like a real goalie would
+                open(profile_path, 'w').close()
+                goalie_history = GoalieHistory(profile_path)
+                for counter in reversed(range(50)):
+                    curr_date = datetime.datetime.today() - datetime.timedelta(days=counter)
+                    format_date = curr_date.strftime('%m/%d/%Y')
+                    goalie_history.append(
+                        "Drill {}".format(counter+1), format_date)
 
     elif dirname == "drill_profiles":
         location_choices = ["TL", "TM", "TR",
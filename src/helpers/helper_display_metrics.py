@@ -0,0 +1,60 @@
+"""
+helper_display_metrics.py
+---
+This file contains the DisplayMetrics class, which measures Ball-E's screen once the app is running and shares the result with every widget that sizes itself from it.
+---
+
+Date: October 18, 2026
+Last Modified: October 18, 2026
+"""
+
+from PyQt5.QtWidgets import QApplication
+
+# The logical DPI the px sizes in style_constants were designed at
+REFERENCE_DPI = 96.0
+
+# The DisplayMetrics object, created the first time it is asked for
+display_metrics = None
+
+
+def get_display_metrics():
+    """get_display_metrics.
+
+    Returns the DisplayMetrics object, measuring the screen the first time it is called. The QApplication must exist before this is called.
+    """
+    global display_metrics
+
+    if display_metrics is None:
+        app = QApplication.instance()
+        if app is None:
+            raise RuntimeError(
+                "The QApplication must be created before the display can be measured")
+        display_metrics = DisplayMetrics(app)
+
+    return display_metrics
+
+
+class DisplayMetrics():
+    """DisplayMetrics.
+
+    The DisplayMetrics class holds the size and scale of the screen Ball-E's app is shown on
+    """
+
+    def __init__(self, app):
+        """__init__.
+
+        Measures the first screen of the running app
+
+        :param app: The running QApplication object
+        """
+        screen = app.screens()[0]
+        screen_geometry = screen.geometry()
+
+        # Size (in pixels) of the screen
+        self.screen_width = screen_geometry.width()
+        self.screen_height = screen_geometry.height()
+
+        # How much bigger than the designed size text and widgets need to be to look the same on this screen
+        self.scale_factor = screen.logicalDotsPerInch() / REFERENCE_DPI
+        # How many physical pixels make up one logical pixel (i.e.: 2 on a high-DPI screen)
+        self.device_pixel_ratio = screen.devicePixelRatio()
@@ -0,0 +1,201 @@
+"""
+helper_distance_estimator.py
+---
+This file contains the functions which work out how far Ball-E is from the goal from the goal's corners, over several camera frames at once, so one shaky frame or tap does not throw the distance off.
+---
+
+Date: October 18, 2026
+Last Modified: October 18, 2026
+"""
+
+import time
+
+import cv2
+import numpy as np
+from helper_capture_sources import CSI_LENS_HORIZONTAL_FOV_DEGREES
+
+# Height of the goal's posts and width of its crossbar (in inches), which are the same on a regulation Lacrosse goal
+GOAL_SIZE_IN = 72
+# Distances further than this many (scaled) median absolute deviations from the median are thrown out
+OUTLIER_MAD_LIMIT = 3.0
+# Size (in pixels) of the window around each corner that is followed from frame to frame
+CORNER_TRACKING_WINDOW = (21, 21)
+# Most the aspect ratio of the frames the corners are followed through may differ from the reference frame's (i.e.: the IMX219's 3264x2464 and 1640x1232 modes differ by 0.5%)
+MAX_ASPECT_RATIO_DIFFERENCE = 0.01
+
+
+class DistanceEstimate():
+    """DistanceEstimate.
+
+    The DistanceEstimate class holds the distance worked out over several frames and how much it varied between them
+    """
+
+    def __init__(self, distance, variance, frames_used, frames_total):
+        """__init__.
+
+        Initializes the DistanceEstimate object
+
+        :param distance: Mean distance (in ft.) over the frames that were not thrown out
+        :param variance: Variance (in sq. ft.) of the distance over the frames that were not thrown out
+        :param frames_used: Integer number of frames that were not thrown out
+        :param frames_total: Integer number of frames the corners were found in
+        """
+        self.distance = distance
+        self.variance = variance
+        self.frames_used = frames_used
+        self.frames_total = frames_total
+
+    def get_standard_deviation(self):
+        """get_standard_deviation.
+
+        Returns the standard deviation (in ft.) of the distance
+        """
+        return float(np.sqrt(self.variance))
+
+
+def get_focal_length(image_width, horizontal_fov_degrees=None):
+    """get_focal_length.
+
+    Returns the camera's focal length (in pixels) for frames of a width
+
+    :param image_width: Width (in pixels) of the frames
+    :param horizontal_fov_degrees: Horizontal field of view (in degrees) of the frames (i.e.: of the capture source's sensor mode), or None for the whole of Ball-E's camera lens
+    """
+    if horizontal_fov_degrees is None:
+        horizontal_fov_degrees = CSI_LENS_HORIZONTAL_FOV_DEGREES
+    return (image_width / 2) / np.tan(np.radians(horizontal_fov_degrees) / 2)
+
+
+def get_distances(corner_tracks, image_width, horizontal_fov_degrees=None):
+    """get_distances.
+
+    Returns a numpy array with the distance (in ft.) of the goal in every frame, all worked out at once. Each of the left post, crossbar, and right post is GOAL_SIZE_IN long, so the goal is as far away as a GOAL_SIZE_IN object that looks as long as they do on average.
+
+    :param corner_tracks: (N, 4, 2) numpy array of the goal's top-left, top-right, bottom-right, and bottom-left corners in N frames
+    :param image_width: Width (in pixels) of the frames
+    :param horizontal_fov_degrees: Horizontal field of view (in degrees) of the frames, or None for the whole of Ball-E's camera lens
+    """
+    corner_tracks = np.asarray(corner_tracks, np.float64).reshape(-1, 4, 2)
+    top_left, top_right, bottom_right, bottom_left = np.moveaxis(
+        corner_tracks, 1, 0)
+
+    side_lengths = (np.linalg.norm(top_left - bottom_left, axis=1)
+                    + np.linalg.norm(top_right - top_left, axis=1)
+                    + np.linalg.norm(bottom_right - top_right, axis=1)) / 3
+    return get_focal_length(image_width, horizontal_fov_degrees) * GOAL_SIZE_IN / np.maximum(side_lengths, 1e-6) / 12
+
+
+def estimate_distance(corner_tracks, image_width, horizontal_fov_degrees=None):
+    """estimate_distance.
+
+    Works out the distance in every frame, throws out the ones too far from the median, and returns a DistanceEstimate object of the rest, or None if there are no frames
+
+    :param corner_tracks: (N, 4, 2) numpy array of the goal's top-left, top-right, bottom-right, and bottom-left corners in N frames
+    :param image_width: Width (in pixels) of the frames
+    :param horizontal_fov_degrees: Horizontal field of view (in degrees) of the frames, or None for the whole of Ball-E's camera lens
+    """
+    distances = get_distances(
+        corner_tracks, image_width, horizontal_fov_degrees)
+    if len(distances) == 0:
+        return None
+
+    median_distance = np.median(distances)
+    # 1.4826 scales the median absolute deviation to a standard deviation for normally distributed distances
+    deviation_limit = OUTLIER_MAD_LIMIT * 1.4826 * \
+        np.median(np.abs(distances - median_distance))
+    inliers = distances[np.abs(distances - median_distance)
+                        <= max(deviation_limit, 1e-9)]
+
+    return DistanceEstimate(float(inliers.mean()), float(inliers.var(ddof=1)) if len(inliers) > 1 else 0.0,
+                            len(inliers), len(distances))
+
+
+def track_corners(reference_frame, corners, frames):
+    """track_corners.
+
+    Follows the corners selected in one frame through other frames of the same scene with optical flow. The other frames may be smaller than the reference frame (i.e.: preview frames and a full-resolution still), as long as they have its aspect ratio: the reference frame is scaled down to their size to follow the corners, and the corners are scaled back up. Returns a (N, 4, 2) numpy array of the corners (in pixels of the reference frame) in each frame all 4 could be followed in, starting with the reference frame itself.
+
+    :param reference_frame: numpy array of the BGR frame the corners were selected in
+    :param corners: List of the (x, y) tuples of the goal's top-left, top-right, bottom-right, and bottom-left corners in the reference frame
+    :param frames: Sequence of numpy arrays of BGR frames all of the same size (i.e.: from a FrameRing), or None
+    """
+    reference_corners = np.float32(corners).reshape(4, 1, 2)
+    corner_tracks = [reference_corners.reshape(4, 2)]
+    if frames is None or len(frames) == 0:
+        return np.array(corner_tracks)
+
+    reference_height, reference_width = reference_frame.shape[:2]
+    frame_height, frame_width = frames[0].shape[:2]
+    scale = np.float32([frame_width / reference_width,
+                        frame_height / reference_height])
+    if abs(scale[0] / scale[1] - 1) > MAX_ASPECT_RATIO_DIFFERENCE:
+        return np.array(corner_tracks)
+
+    reference_gray_frame = cv2.cvtColor(reference_frame, cv2.COLOR_BGR2GRAY)
+    if (frame_width, frame_height) != (reference_width, reference_height):
+        reference_gray_frame = cv2.resize(reference_gray_frame, (frame_width, frame_height),
+                                          interpolation=cv2.INTER_AREA)
+    scaled_corners = reference_corners * scale
+    for frame in frames:
+        if frame.shape[:2] != (frame_height, frame_width):
+            continue
+        tracked_corners, status, _ = cv2.calcOpticalFlowPyrLK(
+            reference_gray_frame, cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY), scaled_corners, None,
+            winSize=CORNER_TRACKING_WINDOW, maxLevel=3)
+        if tracked_corners is not None and status.all():
+            corner_tracks.append(tracked_corners.reshape(4, 2) / scale)
+    return np.array(corner_tracks)
+
+
+def main():
+    """Main prototype/testing area. Code prototyping and checking happens here.
+
+    Draws a goal 30 ft. away in a burst of 8 1080p frames with camera shake, and one frame with a tap that is way off, then prints the distance worked out from the corners followed through the burst, and how long it took. Also follows the corners from a still twice the size of the burst's frames.
+    """
+    from helper_goal_detector import draw_test_goal
+
+    image_width, image_height = 1920, 1080
+    goal_size_px = get_focal_length(image_width) * GOAL_SIZE_IN / (30 * 12)
+    left, top = (image_width - goal_size_px) / 2, (image_height - goal_size_px) / 2
+    corners = np.array([(left, top), (left + goal_size_px, top),
+                        (left + goal_size_px, top + goal_size_px), (left, top + goal_size_px)])
+
+    rng = np.random.default_rng(2)
+    shakes = rng.normal(0, 2, (8, 2))
+    frames = [draw_test_goal(image_width, image_height, [tuple(int(round(value)) for value in corner) for corner in corners + shake], 10)
+              for shake in shakes]
+
+    start_time = time.monotonic()
+    corner_tracks = track_corners(frames[0], corners + shakes[0], frames[1:])
+    tracking_ms = (time.monotonic() - start_time) * 1000
+    # The same, with the corners selected on a still twice the size of the burst's frames
+    still_frame = cv2.resize(
+        frames[0], (image_width * 2, image_height * 2), interpolation=cv2.INTER_LINEAR)
+    still_corner_tracks = track_corners(
+        still_frame, (corners + shakes[0]) * 2, frames[1:])
+    print("Corners followed from a still twice the size: {} of {} frames, {:.2f} px apart at most".format(
+        len(still_corner_tracks) - 1, len(frames) - 1, np.abs(still_corner_tracks / 2 - corner_tracks).max()))
+    # A tap that is way off, as if on the wrong corner
+    corner_tracks = np.concatenate(
+        [corner_tracks, (corners + [(0, 0), (0, 0), (0, 0), (150, 0)]).reshape(1, 4, 2)])
+
+    start_time = time.monotonic()
+    distance_estimate = estimate_distance(corner_tracks, image_width)
+    estimate_ms = (time.monotonic() - start_time) * 1000
+
+    print("Single frame: {}".format(
+        get_distances(corner_tracks, image_width).round(2)))
+    print("Estimate: {:.2f} ft. +/- {:.2f} from {} of {} frames (tracking {:.1f} ms, estimate {:.2f} ms)".format(
+        distance_estimate.distance, distance_estimate.get_standard_deviation(), distance_estimate.frames_used,
+        distance_estimate.frames_total, tracking_ms, estimate_ms))
+
+    many_corner_tracks = np.repeat(corner_tracks, 1000, axis=0)
+    start_time = time.monotonic()
+    estimate_distance(many_corner_tracks, image_width)
+    print("{} frames at once: {:.1f} ms".format(
+        len(many_corner_tracks), (time.monotonic() - start_time) * 1000))
+
+
+if __name__ == "__main__":
+    # Run the main function
+    main()
@@ -0,0 +1,89 @@
+"""
+helper_drill_document.py
+---
+This file contains the DrillDocument class, which holds a drill that is being edited in memory and writes it to its .csv file in one go.
+---
+
+Date: October 18, 2026
+Last Modified: October 18, 2026
+"""
+
+import csv
+
+from helper_atomic_file import write_atomically
+
+DRILL_CSV_HEADER = ["Ball #", "Target Location", "Ball Speed", "Rate of Fire"]
+
+
+class DrillDocument():
+    """DrillDocument.
+
+    The DrillDocument class is the single in-memory copy of a drill shared by every ball tab while the drill is being created. Nothing touches the disk until save() is called.
+    """
+
+    def __init__(self, local_location, total_balls, rate_of_fire, default_location="CM", default_speed=30):
+        """__init__.
+
+        Initializes the DrillDocument object with every ball set to the default location and speed
+
+        :param local_location: String of the path where this drill would be saved
+        :param total_balls: Integer number of balls in the drill
+        :param rate_of_fire: Integer rate of fire (in s/ball) of the drill
+        :param default_location: String name of the section each ball is shot at by default
+        :param default_speed: Integer speed (in MPH) each ball is shot at by default
+        """
+        self.local_location = local_location
+
+        # {ball number: [target location, ball speed, rate of fire]}, matching Profiler.get_profile_info
+        self.drill_info = {
+            str(ball+1): [default_location, str(default_speed), str(rate_of_fire)] for ball in range(total_balls)
+        }
+
+        # Whether or not there are edits that have not been saved yet
+        self.dirty = True
+
+    def set_shot_location(self, ball_number, shot_location):
+        """set_shot_location.
+
+        Sets where a ball will be shot at
+
+        :param ball_number: String number of the ball
+        :param shot_location: String name of the section of the goal (i.e.: TL, CM, BR)
+        """
+        self.drill_info[ball_number][0] = shot_location
+        self.dirty = True
+
+    def set_speed(self, ball_number, speed):
+        """set_speed.
+
+        Sets how fast a ball will be shot
+
+        :param ball_number: String number of the ball
+        :param speed: Speed of the ball in MPH
+        """
+        self.drill_info[ball_number][1] = str(speed)
+        self.dirty = True
+
+    def save(self):
+        """save.
+
+        Writes the drill to its .csv file atomically, so a power cut never leaves a half-written drill behind. Nothing is written if there are no edits since the last save. Returns True if the file was written.
+        """
+        if not self.dirty:
+            return False
+
+        write_atomically(self.local_location, self.write_rows, newline='')
+        self.dirty = False
+        return True
+
+    def write_rows(self, file):
+        """write_rows.
+
+        Writes the drill's header and one row per ball to a file
+
+        :param file: File object opened for writing
+        """
+        writer = csv.writer(file, delimiter=',')
+        writer.writerow(DRILL_CSV_HEADER)
+        for ball in self.drill_info:
+            writer.writerow([ball] + self.drill_info[ball])
@@ -0,0 +1,105 @@
+"""
+helper_frame_mailbox.py
+---
+This file contains the FrameMailbox class, which hands camera frames from the capture thread to the GUI thread one at a time, always the newest one.
+---
+
+Date: October 18, 2026
+Last Modified: October 18, 2026
+"""
+
+import threading
+import time
+from collections import deque
+
+# How many of the most recent frames the frame rates are measured over
+FPS_WINDOW_FRAMES = 30
+
+
+class FrameMailbox():
+    """FrameMailbox.
+
+    The FrameMailbox class holds at most one frame. The capture thread puts each new frame in, replacing (and counting as dropped) any frame the GUI has not taken yet, so the GUI never falls behind the camera.
+    """
+
+    def __init__(self):
+        """__init__.
+
+        Initializes an empty FrameMailbox object
+        """
+        self.lock = threading.Lock()
+
+        # The newest frame that has not been taken yet, or None
+        self.frame = None
+
+        self.captured_count = 0
+        self.displayed_count = 0
+        self.dropped_count = 0
+
+        # Times (in s) of the most recent frames put in and taken out
+        self.capture_times = deque(maxlen=FPS_WINDOW_FRAMES)
+        self.display_times = deque(maxlen=FPS_WINDOW_FRAMES)
+
+    def put(self, frame):
+        """put.
+
+        Puts a new frame in the mailbox. Returns True if the mailbox was empty, i.e.: the GUI needs to be told that a frame is waiting.
+
+        :param frame: The frame (any object) to hand over
+        """
+        with self.lock:
+            was_empty = self.frame is None
+            if not was_empty:
+                # The GUI never saw the frame being replaced
+                self.dropped_count += 1
+            self.frame = frame
+            self.captured_count += 1
+            self.capture_times.append(time.monotonic())
+        return was_empty
+
+    def take(self):
+        """take.
+
+        Takes the newest frame out of the mailbox, or returns None if there is none
+        """
+        with self.lock:
+            frame = self.frame
+            self.frame = None
+            if frame is not None:
+                self.displayed_count += 1
+                self.display_times.append(time.monotonic())
+        return frame
+
+    def clear(self):
+        """clear.
+
+        Throws away the frame waiting in the mailbox, if any, without counting it as displayed or dropped
+        """
+        with self.lock:
+            self.frame = None
+
+    def get_stats(self):
+        """get_stats.
+
+        Returns the capture and display frame rates (over the most recent frames) and the frame counters as a dictionary object
+        """
+        with self.lock:
+            return {
+                "capture_fps": get_fps(self.capture_times),
+                "display_fps": get_fps(self.display_times),
+                "captured": self.captured_count,
+                "displayed": self.displayed_count,
+                "dropped": self.dropped_count,
+            }
+
+
+def get_fps(frame_times):
+    """get_fps.
+
+    Returns the frame rate of a list of frame times, or 0.0 if there are too few of them
+
+    :param frame_times: Sequence of frame times (in s), oldest first
+    """
+    if len(frame_times) < 2 or frame_times[-1] <= frame_times[0]:
+        return 0.0
+    return (len(frame_times) - 1) / (frame_times[-1] - frame_times[0])
@@ -0,0 +1,185 @@
+"""
+helper_frame_ring.py
+---
+This file contains the FrameRing class, which keeps the most recent camera frames in buffers that are allocated once and reused, and picks the sharpest of them (i.e.: for the goal calibration photo).
+---
+
+Date: October 18, 2026
+Last Modified: October 18, 2026
+"""
+
+import threading
+import time
+
+import cv2
+import numpy as np
+
+# How many of the most recent frames are kept (about a quarter of a second at 30 fps)
+FRAME_RING_SIZE = 8
+# Width (in pixels) frames are scaled down to before their sharpness is measured
+FOCUS_METRIC_WIDTH = 320
+
+
+class FrameRing():
+    """FrameRing.
+
+    The FrameRing class copies each new frame over the oldest one in a fixed set of NumPy buffers, so no memory is allocated per frame. The buffers are allocated on the first frame (and again only if the frame size changes).
+    """
+
+    def __init__(self, capacity=FRAME_RING_SIZE):
+        """__init__.
+
+        Initializes an empty FrameRing object
+
+        :param capacity: Integer number of frames to keep
+        """
+        self.capacity = capacity
+        self.lock = threading.Lock()
+
+        # (capacity, height, width, channels) array holding the frames, or None until the first frame
+        self.frames = None
+        # Index the next frame is copied to
+        self.next_index = 0
+        # How many buffers hold a frame
+        self.frame_count = 0
+
+        # Buffers the frames are scaled down and converted to grayscale in when measuring sharpness
+        self.small_frames = None
+        self.small_gray_frames = None
+
+    def push(self, frame):
+        """push.
+
+        Copies a frame into the ring, over the oldest frame if the ring is full
+
+        :param frame: numpy array of the BGR frame
+        """
+        with self.lock:
+            if self.frames is None or self.frames.shape[1:] != frame.shape or self.frames.dtype != frame.dtype:
+                self.allocate(frame)
+
+            np.copyto(self.frames[self.next_index], frame)
+            self.next_index = (self.next_index + 1) % self.capacity
+            self.frame_count = min(self.frame_count + 1, self.capacity)
+
+    def clear(self):
+        """clear.
+
+        Forgets the frames kept so far, keeping the buffers for the next ones
+        """
+        with self.lock:
+            self.next_index = 0
+            self.frame_count = 0
+
+    def allocate(self, frame):
+        """allocate.
+
+        Allocates the buffers for frames shaped like the given one, dropping any frames kept so far
+
+        :param frame: numpy array of a BGR frame
+        """
+        height, width = frame.shape[:2]
+        small_width = min(width, FOCUS_METRIC_WIDTH)
+        small_height = max(1, round(height * small_width / width))
+
+        self.frames = np.empty((self.capacity,) + frame.shape, frame.dtype)
+        self.small_frames = np.empty(
+            (small_height, small_width) + frame.shape[2:], frame.dtype)
+        self.small_gray_frames = np.empty(
+            (self.capacity, small_height, small_width), np.float32)
+        self.next_index = 0
+        self.frame_count = 0
+
+    def get_sharpness(self):
+        """get_sharpness.
+
+        Returns a numpy array with the sharpness (variance of the Laplacian of the scaled-down grayscale frame) of every frame kept, oldest first
+        """
+        with self.lock:
+            return self.measure_sharpness(self.get_indices())
+
+    def get_sharpest_frame(self):
+        """get_sharpest_frame.
+
+        Returns a copy of the sharpest frame kept, or None if there are no frames. The sharpness is measured and the frame copied under one hold of the lock, so a frame pushed in between can never take the place of the one picked.
+        """
+        with self.lock:
+            indices = self.get_indices()
+            sharpness = self.measure_sharpness(indices)
+            if len(sharpness) == 0:
+                return None
+            return self.frames[indices[int(np.argmax(sharpness))]].copy()
+
+    def measure_sharpness(self, indices):
+        """measure_sharpness.
+
+        Returns a numpy array with the sharpness of the frames in some buffers. The lock must be held when this is called, since the frames and the buffers they are scaled down in are shared.
+
+        :param indices: List of the buffer indices of the frames
+        """
+        if len(indices) == 0:
+            return np.empty(0)
+
+        small_gray_frames = self.small_gray_frames[:len(indices)]
+        for small_gray_frame, index in zip(small_gray_frames, indices):
+            cv2.resize(self.frames[index], self.small_frames.shape[1::-1],
+                       dst=self.small_frames, interpolation=cv2.INTER_AREA)
+            if self.small_frames.ndim == 3:
+                small_gray_frame[:] = cv2.cvtColor(
+                    self.small_frames, cv2.COLOR_BGR2GRAY)
+            else:
+                small_gray_frame[:] = self.small_frames
+
+        # 4-neighbour Laplacian of all frames at once
+        laplacians = (4 * small_gray_frames[:, 1:-1, 1:-1]
+                      - small_gray_frames[:, :-2, 1:-1] - small_gray_frames[:, 2:, 1:-1]
+                      - small_gray_frames[:, 1:-1, :-2] - small_gray_frames[:, 1:-1, 2:])
+        return laplacians.reshape(len(indices), -1).var(axis=1)
+
+    def get_frames(self):
+        """get_frames.
+
+        Returns a (N, height, width, channels) numpy array with a copy of every frame kept, oldest first, or None if there are no frames
+        """
+        with self.lock:
+            if self.frame_count == 0:
+                return None
+            return self.frames[self.get_indices()]
+
+    def get_indices(self):
+        """get_indices.
+
+        Returns the buffer indices of the frames kept, oldest first. The lock must be held when this is called.
+        """
+        first_index = (self.next_index - self.frame_count) % self.capacity
+        return [(first_index + offset) % self.capacity for offset in range(self.frame_count)]
+
+
+def main():
+    """Main prototype/testing area. Code prototyping and checking happens here.
+
+    Pushes 1080p frames, some of them blurred, and checks that a sharp one is picked and how long the pushing and picking take.
+    """
+    sharp_frame = np.zeros((1080, 1920, 3), np.uint8)
+    cv2.putText(sharp_frame, "Ball-E", (200, 600), cv2.FONT_HERSHEY_SIMPLEX,
+                12, (255, 255, 255), 20)
+    blurred_frame = cv2.GaussianBlur(sharp_frame, (51, 51), 0)
+
+    frame_ring = FrameRing()
+    start_time = time.monotonic()
+    for frame_number in range(300):
+        frame_ring.push(sharp_frame if frame_number == 296 else blurred_frame)
+    push_time = (time.monotonic() - start_time) / 300
+
+    start_time = time.monotonic()
+    sharpest_frame = frame_ring.get_sharpest_frame()
+    pick_time = time.monotonic() - start_time
+
+    print("Push: {:.2f} ms per frame, pick: {:.1f} ms, sharp frame picked: {}".format(
+        push_time * 1000, pick_time * 1000, np.array_equal(sharpest_frame, sharp_frame)))
+    print("Sharpness, oldest first: {}".format(frame_ring.get_sharpness().round(1)))
+
+
+if __name__ == "__main__":
+    # Run the main function
+    main()
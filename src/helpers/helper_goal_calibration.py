@@ -0,0 +1,187 @@
+"""
+helper_goal_calibration.py
+---
+This file contains the GoalCalibration class, which maps between the goal's corners in the photo and the goal itself with a homography, so the 9 sections of the goal follow its true perspective.
+---
+
+Date: October 18, 2026
+Last Modified: October 18, 2026
+"""
+
+import time
+
+import cv2
+import numpy as np
+
+# Names of the 9 sections of the goal, by row (top, center, bottom) and column (left, middle, right), as used in drill profiles
+GOAL_ZONE_NAMES = (("TL", "TM", "TR"),
+                   ("CL", "CM", "CR"),
+                   ("BL", "BM", "BR"))
+# Value in the zone lookup table of pixels outside the goal
+OUTSIDE_GOAL = -1
+
+# The goal's corners on its own plane, where it is a unit square: top-left, top-right, bottom-right, bottom-left
+GOAL_PLANE_CORNERS = np.float32([(0, 0), (1, 0), (1, 1), (0, 1)])
+
+
+def get_homography(corners):
+    """get_homography.
+
+    Returns the 3x3 numpy array of the homography from the goal's plane (a unit square) to the photo
+
+    :param corners: List of the (x, y) tuples of the goal's top-left, top-right, bottom-right, and bottom-left corners in the photo
+    """
+    return cv2.getPerspectiveTransform(GOAL_PLANE_CORNERS, np.float32(corners))
+
+
+def get_zone_lines(homography, rows=len(GOAL_ZONE_NAMES), columns=len(GOAL_ZONE_NAMES[0])):
+    """get_zone_lines.
+
+    Returns a list of ((x, y), (x, y)) tuples of the lines in the photo that outline the goal and divide it into its sections. It only needs the homography, so it is cheap enough to call while a corner is being dragged.
+
+    :param homography: 3x3 numpy array of the homography from the goal's plane to the photo
+    :param rows: Integer number of rows of sections
+    :param columns: Integer number of columns of sections
+    """
+    goal_lines = [((0, row / rows), (1, row / rows)) for row in range(rows + 1)] + \
+        [((column / columns, 0), (column / columns, 1))
+         for column in range(columns + 1)]
+    # Straight lines stay straight under a homography, so mapping their ends is enough
+    line_ends = cv2.perspectiveTransform(np.float32([end for goal_line in goal_lines for end in goal_line]).reshape(-1, 1, 2),
+                                         homography).reshape(-1, 2).round().astype(int)
+    return [((int(line_ends[index][0]), int(line_ends[index][1])), (int(line_ends[index + 1][0]), int(line_ends[index + 1][1])))
+            for index in range(0, len(line_ends), 2)]
+
+
+class GoalCalibration():
+    """GoalCalibration.
+
+    The GoalCalibration class holds the homography from the goal's plane (a unit square) to the photo, and a lookup table with the section of the goal every pixel of the photo shows, so any point can be classified with one array index. The table is only built the first time a point is classified, since it takes a while for a full-resolution photo and the corners are calibrated again every time the user moves one.
+    """
+
+    def __init__(self, corners, image_size, zone_names=GOAL_ZONE_NAMES):
+        """__init__.
+
+        Computes the homography
+
+        :param corners: List of the (x, y) tuples of the goal's top-left, top-right, bottom-right, and bottom-left corners in the photo
+        :param image_size: (width, height) tuple of the photo
+        :param zone_names: Rows of the names of the goal's sections
+        """
+        self.corners = [tuple(corner) for corner in corners]
+        self.image_width, self.image_height = image_size
+        self.zone_names = [name for row in zone_names for name in row]
+        self.rows = len(zone_names)
+        self.columns = len(zone_names[0])
+
+        # Goal plane -> photo, and photo -> goal plane
+        self.homography = get_homography(self.corners)
+        self.inverse_homography = np.linalg.inv(self.homography)
+
+        # (height, width) numpy array built by build_zone_lookup, or None until a point is first classified
+        self.zone_lookup = None
+
+    def build_zone_lookup(self):
+        """build_zone_lookup.
+
+        Returns a (height, width) numpy array with the index (in row order) of the section each pixel of the photo shows, or OUTSIDE_GOAL
+        """
+        # Every pixel centre of the photo, mapped onto the goal plane at once
+        pixel_x, pixel_y = np.meshgrid(np.arange(self.image_width, dtype=np.float32) + 0.5,
+                                       np.arange(self.image_height, dtype=np.float32) + 0.5)
+        h = self.inverse_homography.astype(np.float32)
+        scale = h[2, 0]*pixel_x + h[2, 1]*pixel_y + h[2, 2]
+        goal_x = (h[0, 0]*pixel_x + h[0, 1]*pixel_y + h[0, 2]) / scale
+        goal_y = (h[1, 0]*pixel_x + h[1, 1]*pixel_y + h[1, 2]) / scale
+
+        column = np.floor(goal_x * self.columns).astype(np.int16)
+        row = np.floor(goal_y * self.rows).astype(np.int16)
+        # Points behind the camera (scale < 0) map onto the goal plane too, so they are left out
+        inside = (column >= 0) & (column < self.columns) & (
+            row >= 0) & (row < self.rows) & (scale > 0)
+
+        zone_lookup = np.full((self.image_height, self.image_width),
+                              OUTSIDE_GOAL, np.int8)
+        zone_lookup[inside] = (row * self.columns + column)[inside]
+        return zone_lookup
+
+    def get_zone(self, x, y):
+        """get_zone.
+
+        Returns the index (in row order) of the section of the goal at a point of the photo, or OUTSIDE_GOAL
+
+        :param x: x-coordinate (in pixels) of the point
+        :param y: y-coordinate (in pixels) of the point
+        """
+        if 0 <= x < self.image_width and 0 <= y < self.image_height:
+            if self.zone_lookup is None:
+                self.zone_lookup = self.build_zone_lookup()
+            return int(self.zone_lookup[int(y), int(x)])
+        return OUTSIDE_GOAL
+
+    def get_zone_name(self, x, y):
+        """get_zone_name.
+
+        Returns the name (i.e.: TL) of the section of the goal at a point of the photo, or None if it is outside the goal
+
+        :param x: x-coordinate (in pixels) of the point
+        :param y: y-coordinate (in pixels) of the point
+        """
+        zone = self.get_zone(x, y)
+        return None if zone == OUTSIDE_GOAL else self.zone_names[zone]
+
+    def goal_to_image(self, goal_points):
+        """goal_to_image.
+
+        Returns a (N, 2) numpy array of points on the goal plane (where the goal is a unit square) mapped onto the photo
+
+        :param goal_points: Sequence of (x, y) points on the goal plane
+        """
+        return cv2.perspectiveTransform(np.float32(goal_points).reshape(-1, 1, 2), self.homography).reshape(-1, 2)
+
+    def image_to_goal(self, image_points):
+        """image_to_goal.
+
+        Returns a (N, 2) numpy array of points of the photo mapped onto the goal plane (where the goal is a unit square)
+
+        :param image_points: Sequence of (x, y) points of the photo
+        """
+        return cv2.perspectiveTransform(np.float32(image_points).reshape(-1, 1, 2), self.inverse_homography).reshape(-1, 2)
+
+    def get_zone_lines(self):
+        """get_zone_lines.
+
+        Returns a list of ((x, y), (x, y)) tuples of the lines in the photo that outline the goal and divide it into its sections
+        """
+        return get_zone_lines(self.homography, self.rows, self.columns)
+
+
+def main():
+    """Main prototype/testing area. Code prototyping and checking happens here.
+
+    Calibrates a goal seen at an angle in a 960x540 photo, prints how long building the lookup table takes, and checks a point in each section and one outside.
+    """
+    corners = [(300, 100), (700, 140), (690, 450), (310, 500)]
+
+    start_time = time.monotonic()
+    goal_calibration = GoalCalibration(corners, (960, 540))
+    goal_calibration.get_zone(0, 0)
+    print("Built in {:.1f} ms, lookup table {} KB".format(
+        (time.monotonic() - start_time) * 1000, goal_calibration.zone_lookup.nbytes // 1024))
+
+    section_centres = [((column + 0.5) / 3, (row + 0.5) / 3)
+                       for row in range(3) for column in range(3)]
+    for goal_point, image_point in zip(section_centres, goal_calibration.goal_to_image(section_centres)):
+        print("Goal {} -> photo {} -> {}".format(tuple(round(value, 2) for value in goal_point),
+                                                 tuple(round(float(value), 1) for value in image_point), goal_calibration.get_zone_name(*image_point)))
+    print("Photo (50, 50) -> {}".format(goal_calibration.get_zone_name(50, 50)))
+
+    start_time = time.monotonic()
+    for _ in range(100000):
+        goal_calibration.get_zone(480, 270)
+    print("get_zone: {:.2f} us".format((time.monotonic() - start_time) * 10))
+
+
+if __name__ == "__main__":
+    # Run the main function
+    main()
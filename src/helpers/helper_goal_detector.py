@@ -0,0 +1,270 @@
+"""
+helper_goal_detector.py
+---
+This file contains the functions which find the four corners of the Lacrosse goal in a photo, so the user only has to confirm (or nudge) them instead of tapping each one.
+---
+
+Date: October 18, 2026
+Last Modified: October 18, 2026
+"""
+
+import time
+
+import cv2
+import numpy as np
+
+# Photos are scaled down to this width (in pixels) before looking for the goal, which keeps detection well within 200 ms on the Jetson's CPU
+DETECTION_WIDTH = 480
+# HSV range of the goal's orange pipe (OpenCV hue goes from 0 to 179)
+ORANGE_HSV_LOWER = (3, 110, 90)
+ORANGE_HSV_UPPER = (24, 255, 255)
+# The goal must cover at least this share of the photo
+MIN_GOAL_AREA_SHARE = 0.02
+# How many points are checked for pipe along each side of the goal
+EDGE_SAMPLES = 40
+# Detections less confident than this are not proposed to the user
+MIN_PROPOSAL_CONFIDENCE = 0.5
+
+
+class GoalDetection():
+    """GoalDetection.
+
+    The GoalDetection class holds the corners found and how confident the detector is in them
+    """
+
+    def __init__(self, corners, confidence, detection_ms):
+        """__init__.
+
+        Initializes the GoalDetection object
+
+        :param corners: List of the (x, y) tuples of the top-left, top-right, bottom-right, and bottom-left corners, in the photo's pixels
+        :param confidence: Float from 0 to 1 of how much of the goal's posts and crossbar were found along the sides between the corners, with nothing orange in the mouth
+        :param detection_ms: How long (in ms) the detection took
+        """
+        self.corners = corners
+        self.confidence = confidence
+        self.detection_ms = detection_ms
+
+    def is_proposable(self):
+        """is_proposable.
+
+        Returns True if the detection is confident enough to be proposed to the user
+        """
+        return self.confidence >= MIN_PROPOSAL_CONFIDENCE
+
+
+def detect_goal_corners(frame):
+    """detect_goal_corners.
+
+    Finds the goal in a photo by masking its orange pipe, fitting a quadrilateral around the biggest orange shape, and checking how much of the posts and crossbar run along its sides and how empty the mouth between them is. Returns a GoalDetection object, or None if there is no goal-sized orange shape.
+
+    :param frame: numpy array of the BGR photo
+    """
+    start_time = time.monotonic()
+
+    height, width = frame.shape[:2]
+    scale = min(1.0, DETECTION_WIDTH / width)
+    small_frame = cv2.resize(frame, (max(1, int(width*scale)), max(1, int(height*scale))),
+                             interpolation=cv2.INTER_AREA) if scale < 1 else frame
+
+    # Orange pixels, with small gaps in the pipe closed
+    hsv_frame = cv2.cvtColor(small_frame, cv2.COLOR_BGR2HSV)
+    orange_mask = cv2.inRange(hsv_frame, ORANGE_HSV_LOWER, ORANGE_HSV_UPPER)
+    orange_mask = cv2.morphologyEx(orange_mask, cv2.MORPH_CLOSE,
+                                   cv2.getStructuringElement(cv2.MORPH_RECT, (5, 5)))
+
+    contours = cv2.findContours(
+        orange_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)[-2]
+    if len(contours) == 0:
+        return None
+
+    # The posts and crossbar form one shape, and its hull spans the goal mouth
+    hull = cv2.convexHull(max(contours, key=cv2.contourArea))
+    if cv2.contourArea(hull) < MIN_GOAL_AREA_SHARE * orange_mask.size:
+        return None
+
+    quadrilateral = fit_quadrilateral(hull)
+    if quadrilateral is None:
+        return None
+
+    corners = order_corners(quadrilateral)
+    confidence = get_edge_coverage(
+        orange_mask, corners) * get_mouth_emptiness(orange_mask, corners)
+    corners = move_to_pipe_center(orange_mask, corners)
+
+    corners = [(int(round(x / scale)), int(round(y / scale)))
+               for x, y in corners]
+    return GoalDetection(corners, confidence, (time.monotonic() - start_time) * 1000)
+
+
+def fit_quadrilateral(hull):
+    """fit_quadrilateral.
+
+    Simplifies a convex hull until it has four corners. Returns a (4, 2) numpy array of the corners, or None if it cannot be simplified to exactly four.
+
+    :param hull: Convex hull from cv2.convexHull
+    """
+    perimeter = cv2.arcLength(hull, True)
+    # Loosen the fit until only the four corners are left
+    for epsilon_share in np.linspace(0.01, 0.1, 19):
+        polygon = cv2.approxPolyDP(hull, epsilon_share * perimeter, True)
+        if len(polygon) == 4:
+            return polygon.reshape(4, 2).astype(np.float32)
+        if len(polygon) < 4:
+            break
+    return None
+
+
+def order_corners(corners):
+    """order_corners.
+
+    Returns the corners as a list of (x, y) tuples in clockwise order from the top-left, the order the user taps them in
+
+    :param corners: (4, 2) numpy array of the corners, in any order
+    """
+    # Top-left has the smallest x+y, bottom-right the biggest, top-right the smallest y-x, bottom-left the biggest
+    corner_sums = corners.sum(axis=1)
+    corner_differences = corners[:, 1] - corners[:, 0]
+    ordered_corners = [corners[np.argmin(corner_sums)], corners[np.argmin(corner_differences)],
+                       corners[np.argmax(corner_sums)], corners[np.argmax(corner_differences)]]
+    return [(float(x), float(y)) for x, y in ordered_corners]
+
+
+def move_to_pipe_center(orange_mask, corners):
+    """move_to_pipe_center.
+
+    The fitted corners sit on the outside of the pipe. Returns them moved in by half the pipe's thickness (worked out from how much orange there is along the posts and crossbar), so they sit where the user would tap.
+
+    :param orange_mask: numpy array of the mask of orange pixels
+    :param corners: List of the (x, y) tuples of the top-left, top-right, bottom-right, and bottom-left corners in the mask's pixels
+    """
+    top_left, top_right, bottom_right, bottom_left = np.array(corners)
+    pipe_length = (np.linalg.norm(top_left - bottom_left) + np.linalg.norm(top_right - top_left)
+                   + np.linalg.norm(bottom_right - top_right))
+    half_thickness = np.count_nonzero(orange_mask) / max(pipe_length, 1.0) / 2
+
+    def step(from_point, to_point):
+        direction = to_point - from_point
+        return half_thickness * direction / max(np.linalg.norm(direction), 1e-6)
+
+    # Top corners move in along both sides, bottom corners (the bottom of the posts) only sideways
+    moved_corners = [
+        top_left + step(top_left, top_right) + step(top_left, bottom_left),
+        top_right + step(top_right, top_left) + step(top_right, bottom_right),
+        bottom_right + step(bottom_right, bottom_left),
+        bottom_left + step(bottom_left, bottom_right),
+    ]
+    return [(float(x), float(y)) for x, y in moved_corners]
+
+
+def get_edge_coverage(orange_mask, corners):
+    """get_edge_coverage.
+
+    Returns the share (from 0 to 1) of points along the left post, crossbar, and right post that are orange. The bottom side is left out, as a goal has no pipe across the front of its mouth.
+
+    :param orange_mask: numpy array of the mask of orange pixels
+    :param corners: List of the (x, y) tuples of the top-left, top-right, bottom-right, and bottom-left corners in the mask's pixels
+    """
+    # The fitted corners sit on the outside of the pipe, so allow for its thickness
+    pipe_mask = cv2.dilate(orange_mask, np.ones((7, 7), np.uint8))
+    top_left, top_right, bottom_right, bottom_left = np.array(corners)
+
+    positions = np.linspace(0.05, 0.95, EDGE_SAMPLES)[:, np.newaxis]
+    sample_points = np.concatenate([
+        bottom_left + positions * (top_left - bottom_left),
+        top_left + positions * (top_right - top_left),
+        top_right + positions * (bottom_right - top_right),
+    ]).round().astype(int)
+
+    mask_height, mask_width = pipe_mask.shape
+    sample_points[:, 0] = sample_points[:, 0].clip(0, mask_width - 1)
+    sample_points[:, 1] = sample_points[:, 1].clip(0, mask_height - 1)
+    return float(np.count_nonzero(pipe_mask[sample_points[:, 1], sample_points[:, 0]])) / len(sample_points)
+
+
+def get_mouth_emptiness(orange_mask, corners):
+    """get_mouth_emptiness.
+
+    Returns the share (from 0 to 1) of the middle of the goal mouth that is not orange. An orange object that is not a goal (i.e.: a ball bag) is orange all the way through.
+
+    :param orange_mask: numpy array of the mask of orange pixels
+    :param corners: List of the (x, y) tuples of the top-left, top-right, bottom-right, and bottom-left corners in the mask's pixels
+    """
+    corners = np.array(corners)
+    # The middle half of the mouth, well clear of the pipe
+    mouth_corners = corners.mean(axis=0) + 0.5 * (corners - corners.mean(axis=0))
+    mouth_mask = np.zeros_like(orange_mask)
+    cv2.fillPoly(mouth_mask, [mouth_corners.round().astype(np.int32)], 255)
+
+    mouth_area = np.count_nonzero(mouth_mask)
+    if mouth_area == 0:
+        return 0.0
+    return 1.0 - np.count_nonzero(cv2.bitwise_and(orange_mask, mouth_mask)) / mouth_area
+
+
+def draw_test_goal(width, height, corners, pipe_width, background_noise=True):
+    """draw_test_goal.
+
+    Returns a BGR photo of an orange goal on a field, for trying out the detector
+
+    :param width: Width (in pixels) of the photo
+    :param height: Height (in pixels) of the photo
+    :param corners: List of the (x, y) tuples of the top-left, top-right, bottom-right, and bottom-left corners
+    :param pipe_width: Width (in pixels) of the pipe, or 0 for no goal
+    :param background_noise: Boolean value which when True adds noise to the photo
+    """
+    photo = np.empty((height, width, 3), np.uint8)
+    # Sky above, grass below
+    photo[:height//2] = (200, 170, 140)
+    photo[height//2:] = (60, 140, 60)
+    # The net behind the goal mouth
+    cv2.fillPoly(photo, [np.array(corners, np.int32)], (215, 215, 215))
+
+    top_left, top_right, bottom_right, bottom_left = corners
+    if pipe_width > 0:
+        for start_point, end_point in ((bottom_left, top_left), (top_left, top_right), (top_right, bottom_right)):
+            cv2.line(photo, start_point, end_point,
+                     (0, 110, 255), pipe_width)
+
+    if background_noise:
+        noise = np.random.default_rng(0).normal(0, 12, photo.shape)
+        photo = np.clip(photo + noise, 0, 255).astype(np.uint8)
+    return photo
+
+
+def main():
+    """Main prototype/testing area. Code prototyping and checking happens here.
+
+    Detects a drawn goal in 1080p photos, and prints how far the corners found are from the real ones, the confidence, and how long detection took.
+    """
+    test_goals = [
+        [(560, 260), (1360, 260), (1360, 860), (560, 860)],
+        [(420, 300), (1500, 240), (1540, 900), (380, 880)],
+        [(800, 400), (1100, 410), (1100, 640), (790, 630)],
+    ]
+    for corners in test_goals:
+        photo = draw_test_goal(1920, 1080, corners, 24)
+        goal_detection = detect_goal_corners(photo)
+        if goal_detection is None:
+            print("No goal found")
+            continue
+        corner_error = max(np.hypot(found[0] - real[0], found[1] - real[1])
+                           for found, real in zip(goal_detection.corners, corners))
+        print("Corners {}, off by at most {:.0f} px, confidence {:.2f}, {:.1f} ms".format(
+            goal_detection.corners, corner_error, goal_detection.confidence, goal_detection.detection_ms))
+
+    no_goal_photo = draw_test_goal(1920, 1080, test_goals[0], 0)
+    print("Photo without a goal: {}".format(detect_goal_corners(no_goal_photo)))
+
+    # An orange ball bag is the right color but the wrong shape
+    bag_photo = draw_test_goal(1920, 1080, test_goals[0], 0)
+    cv2.ellipse(bag_photo, (960, 700), (220, 160),
+                0, 0, 360, (0, 110, 255), -1)
+    bag_detection = detect_goal_corners(bag_photo)
+    print("Photo with a ball bag: {}".format(
+        None if bag_detection is None else "confidence {:.2f}, proposed: {}".format(bag_detection.confidence, bag_detection.is_proposable())))
+
+
+if __name__ == "__main__":
+    # Run the main function
+    main()
@@ -0,0 +1,285 @@
+"""
+helper_goalie_history.py
+---
+This file contains the GoalieHistory class, which appends completed drills to a goalie profile's .csv file and reads them back newest-first, one page at a time.
+---
+
+Date: October 18, 2026
+Last Modified: October 18, 2026
+"""
+
+import csv
+import io
+import os
+from array import array
+
+from helper_atomic_file import write_atomically
+
+GOALIE_CSV_HEADER = ["Drill Name", "Date Completed (Oldest first)"]
+# Goalie files with this header were written most recent drill first. They are read as they are, and turned around the first time a drill is appended.
+LEGACY_GOALIE_CSV_HEADER = [
+    "Drill Name", "Date Completed (Most recent prioritized)"]
+
+# The sidecar index sits next to the goalie's .csv file: <goalie_name>.csv.idx
+INDEX_SUFFIX = '.idx'
+# Every number in the index is an unsigned 64-bit integer
+INDEX_ITEM_SIZE = array('Q').itemsize
+
+
+class GoalieHistory():
+    """GoalieHistory.
+
+    The GoalieHistory class treats a goalie profile's .csv file as an append-only log (oldest drill first) and keeps a sidecar index of the byte offset of every row, so the most recent drills can be read by seeking from the end instead of loading the whole file.
+
+    Reading the history never writes to the profile: a missing or out of date index is rebuilt in memory, and a file stored most recent drill first is read as it is. Both are written to disk by the first append.
+    """
+
+    def __init__(self, profile_path):
+        """__init__.
+
+        Initializes the GoalieHistory object and brings its index up to date with the .csv file, in memory only
+
+        :param profile_path: Profile path containing the goalie's .csv file
+        """
+        self.profile_path = profile_path
+        self.index_path = profile_path + INDEX_SUFFIX
+
+        # Byte offset of the start of every row, in the order they are in the .csv file
+        self.offsets = array('Q')
+        # How many bytes of the .csv file the offsets cover
+        self.indexed_size = 0
+        # Whether or not the .csv file stores its drills most recent first (under LEGACY_GOALIE_CSV_HEADER)
+        self.legacy = False
+        # Whether or not the sidecar index on disk matches the offsets
+        self.index_stored = False
+
+        self.load_index()
+
+    def load_index(self):
+        """load_index.
+
+        Reads the sidecar index if it still describes the .csv file, and indexes only the rows appended to the .csv file since it was last written. If the .csv file was rewritten instead of appended to, the index is rebuilt. Nothing is written to disk.
+        """
+        self.legacy = self.has_legacy_header()
+
+        try:
+            csv_size = os.path.getsize(self.profile_path)
+        except FileNotFoundError:
+            csv_size = 0
+
+        self.offsets = array('Q')
+        self.indexed_size = 0
+        # A file stored most recent drill first never has an index of its own
+        if not self.legacy:
+            self.read_index()
+            if not self.index_matches_file(csv_size):
+                self.offsets = array('Q')
+                self.indexed_size = 0
+        self.index_stored = self.indexed_size == csv_size
+
+        if self.indexed_size < csv_size:
+            self.index_rows()
+
+    def read_index(self):
+        """read_index.
+
+        Reads the offsets and the size they cover from the sidecar index, if there is one
+        """
+        try:
+            with open(self.index_path, 'rb') as file:
+                index_bytes = file.read()
+        except FileNotFoundError:
+            return
+
+        # The first number is the size covered, the rest are the row offsets
+        usable_size = len(index_bytes) - (len(index_bytes) % INDEX_ITEM_SIZE)
+        stored = array('Q')
+        stored.frombytes(index_bytes[:usable_size])
+        if len(stored) > 0:
+            self.indexed_size = stored[0]
+            # Offsets written after the size (i.e.: an interrupted append) are ignored and re-indexed
+            self.offsets = array(
+                'Q', [offset for offset in stored[1:] if offset < self.indexed_size])
+
+    def has_legacy_header(self):
+        """has_legacy_header.
+
+        Checks whether the .csv file starts with LEGACY_GOALIE_CSV_HEADER, i.e.: its drills are stored most recent first
+        """
+        try:
+            with open(self.profile_path, newline='') as file:
+                header_line = file.readline()
+        except FileNotFoundError:
+            return False
+        return next(csv.reader([header_line]), None) == LEGACY_GOALIE_CSV_HEADER
+
+    def convert_legacy_file(self):
+        """convert_legacy_file.
+
+        Rewrites a .csv file stored most recent drill first so its drills are oldest first under GOALIE_CSV_HEADER, then indexes it again. The file is replaced atomically, so a power cut leaves either the old or the new file behind, and the old one is converted again by the next append.
+        """
+        with open(self.profile_path, newline='') as file:
+            rows = [row for row in csv.reader(file, delimiter=',') if len(row) > 0][1:]
+
+        def write_rows(file):
+            writer = csv.writer(file, delimiter=',')
+            writer.writerow(GOALIE_CSV_HEADER)
+            writer.writerows(reversed(rows))
+
+        write_atomically(self.profile_path, write_rows)
+        self.load_index()
+
+    def index_matches_file(self, csv_size):
+        """index_matches_file.
+
+        Checks whether the stored index still describes the start of the .csv file, i.e.: the file was only ever appended to since. The size covered must fit in the file, and the last row indexed must be a whole row that ends exactly where the index stops.
+
+        :param csv_size: Integer size of the .csv file in bytes
+        """
+        if self.indexed_size == 0:
+            return True
+        if self.indexed_size > csv_size:
+            return False
+
+        with open(self.profile_path, 'rb') as file:
+            if len(self.offsets) == 0:
+                # Only the header was indexed
+                file.seek(self.indexed_size - 1)
+                return file.read(1) == b'\n'
+
+            last_offset = self.offsets[-1]
+            if last_offset == 0:
+                return False
+            # The byte before the last row, and the last row itself
+            file.seek(last_offset - 1)
+            last_row = file.read(self.indexed_size - last_offset + 1)
+            return last_row.startswith(b'\n') and last_row.endswith(b'\n') and last_row.count(b'\n') == 2
+
+    def index_rows(self):
+        """index_rows.
+
+        Records the offsets of every row between the end of the index and the end of the .csv file
+        """
+        with open(self.profile_path, 'rb') as file:
+            file.seek(self.indexed_size)
+            # Skip the header row
+            if self.indexed_size == 0:
+                if not file.readline().endswith(b'\n'):
+                    return
+                self.indexed_size = file.tell()
+            while True:
+                row_offset = file.tell()
+                line = file.readline()
+                if not line:
+                    break
+                # A row without its line ending is still being written, so leave it for next time
+                if not line.endswith(b'\n'):
+                    break
+                if line.strip():
+                    self.offsets.append(row_offset)
+                self.indexed_size = file.tell()
+
+    def write_index(self):
+        """write_index.
+
+        Writes the whole sidecar index to disk
+        """
+        index_items = array('Q', [self.indexed_size])
+        index_items.extend(self.offsets)
+        with open(self.index_path, 'wb') as file:
+            index_items.tofile(file)
+            file.flush()
+            os.fsync(file.fileno())
+        self.index_stored = True
+
+    def append(self, drill_name, date_completed):
+        """append.
+
+        Appends a completed drill to the end of the goalie's history. The first append turns a file stored most recent drill first around, and writes the index if the one on disk is missing or out of date.
+
+        :param drill_name: String name of the drill that was completed
+        :param date_completed: String date (i.e.: MM/DD/YYYY) that the drill was completed on
+        """
+        # Pick up anything appended by someone else first
+        self.load_index()
+        if self.legacy:
+            self.convert_legacy_file()
+        if not self.index_stored:
+            self.write_index()
+
+        row_buffer = io.StringIO()
+        writer = csv.writer(row_buffer, delimiter=',')
+        # A brand new (empty) goalie file gets its header in the same write as the first drill
+        if self.indexed_size == 0:
+            writer.writerow(GOALIE_CSV_HEADER)
+        header_size = len(row_buffer.getvalue().encode())
+        writer.writerow([drill_name, date_completed])
+
+        with open(self.profile_path, 'ab') as file:
+            row_offset = file.tell() + header_size
+            file.write(row_buffer.getvalue().encode())
+            self.indexed_size = file.tell()
+
+        self.offsets.append(row_offset)
+
+        # Only the new offset and the size covered change, so the index is not rewritten.
+        # The offset is on disk before the size that covers it: if the app stops in between, the offset is past the stored size, so it is ignored and the row is indexed again.
+        with open(self.index_path, 'r+b') as file:
+            file.seek(len(self.offsets) * INDEX_ITEM_SIZE)
+            array('Q', [row_offset]).tofile(file)
+            file.flush()
+            os.fsync(file.fileno())
+            file.seek(0)
+            array('Q', [self.indexed_size]).tofile(file)
+
+    def get_entry_count(self):
+        """get_entry_count.
+
+        Returns how many drills the goalie has completed
+        """
+        return len(self.offsets)
+
+    def get_page(self, page_number, page_size):
+        """get_page.
+
+        Returns one page of the goalie's history as a list of [drill name, date completed] lists, newest first. Page 0 holds the most recent drills.
+
+        :param page_number: Integer number of the page, counting back from the most recent drills
+        :param page_size: Integer number of drills per page
+        """
+        if self.legacy:
+            # The most recent drills are at the start of the file
+            start = page_number*page_size
+            end = min(len(self.offsets), start + page_size)
+        else:
+            end = len(self.offsets) - page_number*page_size
+            start = max(0, end - page_size)
+        if start >= end:
+            return list()
+
+        start_offset = self.offsets[start]
+        end_offset = self.offsets[end] if end < len(
+            self.offsets) else self.indexed_size
+
+        # Only the bytes of the rows on this page are read
+        with open(self.profile_path, 'rb') as file:
+            file.seek(start_offset)
+            page_bytes = file.read(end_offset - start_offset)
+
+        rows = [[row[0], row[1]] for row in csv.reader(io.StringIO(
+            page_bytes.decode()), delimiter=',') if len(row) >= 2]
+        return rows if self.legacy else rows[::-1]
+
+
+def main():
+    """Main prototype/testing area. Code prototyping and checking happens here."""
+
+    history = GoalieHistory(
+        "/home/codeabiswas/Documents/ball_e_profiles/goalie_profiles/goalie_a/goalie_a.csv")
+    print(history.get_entry_count())
+    print(history.get_page(0, 10))
+
+
+if __name__ == "__main__":
+    # Run the main function
+    main()
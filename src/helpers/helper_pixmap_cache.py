@@ -0,0 +1,102 @@
+"""
+helper_pixmap_cache.py
+---
+This file contains the functions which render the Lacrosse goal image with its 9-section grid once and share the result with every screen and widget that shows it.
+---
+
+Date: October 18, 2026
+Last Modified: October 18, 2026
+"""
+
+import pathlib
+
+from PyQt5.QtCore import QSize, Qt
+from PyQt5.QtGui import QImageReader, QPainter, QPen, QPixmap
+
+LAX_GOAL_IMAGE_PATH = str(
+    pathlib.Path.home()) + '/Developer/ball_e_gui/src/images/lax_goal.png'
+
+# How many pixels are taken off the width and height of the Lacrosse goal image when it is shown
+LAX_GOAL_SIZE_REDUCTION = 300
+
+# (rows, columns) of the grid dividing the goal into 9 sections
+LAX_GOAL_GRID = (3, 3)
+
+# (color, width, style) of the grid lines
+LAX_GOAL_GRID_PEN = (Qt.green, 12, Qt.SolidLine)
+
+# {(image path, (width, height), (rows, columns), (color, width, style)): QPixmap object}, shared by the whole app
+grid_pixmaps = dict()
+
+
+def get_lax_goal_pixmap():
+    """get_lax_goal_pixmap.
+
+    Returns the Lacrosse goal image, shrunk for the screen and divided into 9 sections. Only the first call loads and paints it. The QApplication must exist before this is called.
+    """
+    # Only the image's header is read to find its size
+    image_size = QImageReader(LAX_GOAL_IMAGE_PATH).size()
+    target_size = (image_size.width() - LAX_GOAL_SIZE_REDUCTION,
+                   image_size.height() - LAX_GOAL_SIZE_REDUCTION)
+
+    return get_grid_pixmap(LAX_GOAL_IMAGE_PATH, target_size, LAX_GOAL_GRID, LAX_GOAL_GRID_PEN)
+
+
+def get_grid_pixmap(image_path, target_size, grid, pen):
+    """get_grid_pixmap.
+
+    Returns an image scaled to a size with a grid drawn over it, rendering it only if it has not been rendered before. QPixmap objects are implicitly shared, so every caller gets the same pixels without a copy.
+
+    :param image_path: String path of the image
+    :param target_size: (width, height) tuple the image is scaled to
+    :param grid: (rows, columns) tuple of the grid
+    :param pen: (color, width, style) tuple of the grid lines
+    """
+    cache_key = (image_path, tuple(target_size), tuple(grid), tuple(pen))
+
+    if cache_key not in grid_pixmaps:
+        grid_pixmaps[cache_key] = render_grid_pixmap(
+            image_path, target_size, grid, pen)
+
+    return grid_pixmaps[cache_key]
+
+
+def render_grid_pixmap(image_path, target_size, grid, pen):
+    """render_grid_pixmap.
+
+    Loads an image, scales it, and draws a grid over it
+
+    :param image_path: String path of the image
+    :param target_size: (width, height) tuple the image is scaled to
+    :param grid: (rows, columns) tuple of the grid
+    :param pen: (color, width, style) tuple of the grid lines
+    """
+    pixmap_object = QPixmap()
+    pixmap_object.load(image_path)
+    scaled_pixmap_obj = pixmap_object.scaled(QSize(*target_size))
+
+    width = scaled_pixmap_obj.width()
+    height = scaled_pixmap_obj.height()
+    rows, columns = grid
+
+    painter_obj = QPainter(scaled_pixmap_obj)
+    painter_obj.setPen(QPen(*pen))
+
+    # Lines in the bottom/right half are measured from the bottom/right edge so the grid is symmetric, matching how clicks are mapped to sections
+    for row in range(rows+1):
+        if 2*row <= rows:
+            line_y = int(height*row/rows)
+        else:
+            line_y = height - int(height*(rows-row)/rows)
+        painter_obj.drawLine(0, line_y, width, line_y)
+
+    for column in range(columns+1):
+        if 2*column <= columns:
+            line_x = int(width*column/columns)
+        else:
+            line_x = width - int(width*(columns-column)/columns)
+        painter_obj.drawLine(line_x, 0, line_x, height)
+
+    painter_obj.end()
+
+    return scaled_pixmap_obj
@@ -0,0 +1,86 @@
+"""
+helper_profile_cache.py
+---
+This file contains the ProfileCache class, which keeps recently parsed Goalie or Drill profiles in memory so that they are not re-read from disk every time they are looked at.
+---
+
+Date: October 18, 2026
+Last Modified: October 18, 2026
+"""
+
+import os
+from collections import OrderedDict
+
+# How many parsed profiles are kept in memory at once
+MAX_CACHED_PROFILES = 64
+
+
+class ProfileCache():
+    """ProfileCache.
+
+    The ProfileCache class is a bounded, least-recently-used store of parsed profiles. Every entry is keyed by the profile's (path, mtime, size) so an edited file is never served stale.
+    """
+
+    def __init__(self, max_entries=MAX_CACHED_PROFILES):
+        """__init__.
+
+        Initializes the ProfileCache object
+
+        :param max_entries: Integer number of parsed profiles to keep before the least recently used one is dropped
+        """
+        self.max_entries = max_entries
+        # {profile path: ((mtime, size), parsed profile)}, least recently used first
+        self.entries = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, profile_path, parse_function):
+        """get.
+
+        Returns a copy of the parsed profile, only calling the parse function if the profile is not cached or its file has changed
+
+        :param profile_path: Profile path containing the profile's .csv file
+        :param parse_function: Function which takes the profile path and returns the parsed profile dictionary object
+        """
+        stat_result = os.stat(profile_path)
+        file_key = (stat_result.st_mtime_ns, stat_result.st_size)
+
+        cached = self.entries.get(profile_path)
+        if cached is not None and cached[0] == file_key:
+            self.hits += 1
+            self.entries.move_to_end(profile_path)
+            info_dict = cached[1]
+        else:
+            self.misses += 1
+            info_dict = parse_function(profile_path)
+            self.entries[profile_path] = (file_key, info_dict)
+            self.entries.move_to_end(profile_path)
+            # Drop the least recently used profiles
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+        # Callers edit what they get back, so never hand out the cached object itself
+        return {key: list(value) for key, value in info_dict.items()}
+
+    def invalidate(self, profile_path=None):
+        """invalidate.
+
+        Drops a profile (or every profile) from the cache. Screens call this whenever they write or delete a profile.
+
+        :param profile_path: Profile path containing the profile's .csv file, or None to clear the whole cache
+        """
+        if profile_path is None:
+            self.entries.clear()
+        else:
+            # Deleting a profile directory removes everything cached underneath it
+            for cached_path in [path for path in self.entries
+                                if path == profile_path or path.startswith(profile_path.rstrip(os.sep) + os.sep)]:
+                del self.entries[cached_path]
+
+    def get_stats(self):
+        """get_stats.
+
+        Returns the cache's hit/miss counters and size as a dictionary object
+        """
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self.entries)}
@@ -0,0 +1,197 @@
+"""
+helper_profile_catalog.py
+---
+This file contains the ProfileCatalog class, which keeps a persistent SQLite index of the Goalie or Drill profiles on the device so that they do not have to be walked on disk every time a screen is opened.
+---
+
+Date: October 18, 2026
+Last Modified: October 18, 2026
+"""
+
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+# Directory mtimes this close to the last sync time cannot be trusted, because a second change in the same timestamp tick would not move the mtime again (i.e.: coarse SD card/FAT timestamps)
+RACY_MTIME_WINDOW_NS = 2 * 1000 * 1000 * 1000
+
+
+class ProfileCatalog():
+    """ProfileCatalog.
+
+    The ProfileCatalog class stores {profile name: profile .csv path} entries for one profile directory in a SQLite database next to the profiles and keeps it in sync using directory mtimes
+    """
+
+    def __init__(self, location):
+        """__init__.
+
+        Initializes the ProfileCatalog object and opens (or creates) its database
+
+        :param location: String path of the profile directory (i.e.: ~/Documents/ball_e_profiles/goalie_profiles)
+        """
+        self.location = location
+
+        # The catalog lives beside the profile directory (not inside it) so that nothing walking the profiles ever sees it
+        parent, dirname = os.path.split(location.rstrip(os.sep))
+        self.catalog_path = os.path.join(
+            parent, '.{}_catalog.sqlite3'.format(dirname))
+
+        try:
+            Path(parent).mkdir(parents=True, exist_ok=True)
+            self.connection = sqlite3.connect(self.catalog_path)
+            self.create_tables()
+        # If the disk cannot hold the catalog, keep it in memory for this run instead
+        except (OSError, sqlite3.Error):
+            self.connection = sqlite3.connect(':memory:')
+            self.create_tables()
+
+    def create_tables(self):
+        """create_tables.
+
+        Creates the catalog's tables if they do not exist yet
+        """
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER)")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS profiles (name TEXT PRIMARY KEY, csv_path TEXT)")
+
+    def get_meta(self, key):
+        """get_meta.
+
+        Returns a stored integer value from the meta table, or None if it has not been stored yet
+
+        :param key: String name of the value
+        """
+        row = self.connection.execute(
+            "SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return None if row is None else row[0]
+
+    def get_profiles(self):
+        """get_profiles.
+
+        Brings the catalog up to date and returns all the profiles as a {profile name: profile .csv path} dictionary object
+        """
+        self.sync()
+
+        rows = self.connection.execute(
+            "SELECT name, csv_path FROM profiles WHERE csv_path IS NOT NULL ORDER BY name")
+        return {name: csv_path for name, csv_path in rows}
+
+    def sync(self):
+        """sync.
+
+        Updates the catalog with whatever changed on disk since the last sync. If the profile directory's mtime has not moved, only the profiles still waiting for their .csv file are looked at.
+        """
+        try:
+            root_mtime_ns = os.stat(self.location).st_mtime_ns
+        # No profile directory means no profiles
+        except FileNotFoundError:
+            with self.connection:
+                self.connection.execute("DELETE FROM profiles")
+                self.connection.execute("DELETE FROM meta")
+            return
+
+        synced_at_ns = time.time_ns()
+        stored_mtime_ns = self.get_meta('root_mtime_ns')
+        stored_synced_at_ns = self.get_meta('synced_at_ns')
+
+        root_changed = (stored_mtime_ns != root_mtime_ns or stored_synced_at_ns is None or
+                        stored_synced_at_ns - root_mtime_ns < RACY_MTIME_WINDOW_NS)
+
+        with self.connection:
+            if root_changed:
+                # Only the top level is listed: profiles that already have a .csv file are never opened again
+                on_disk = {entry.name for entry in os.scandir(
+                    self.location) if entry.is_dir()}
+                known = {row[0] for row in self.connection.execute(
+                    "SELECT name FROM profiles")}
+
+                self.connection.executemany(
+                    "DELETE FROM profiles WHERE name = ?", [(name,) for name in known - on_disk])
+                self.connection.executemany(
+                    "INSERT INTO profiles (name, csv_path) VALUES (?, ?)",
+                    [(name, self.find_profile_csv(name)) for name in on_disk - known])
+
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('root_mtime_ns', ?)", (root_mtime_ns,))
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('synced_at_ns', ?)", (synced_at_ns,))
+
+            # Profile directories are created before their .csv file, so look again at those that were caught in between
+            pending = [row[0] for row in self.connection.execute(
+                "SELECT name FROM profiles WHERE csv_path IS NULL")]
+            for name in pending:
+                csv_path = self.find_profile_csv(name)
+                if csv_path is not None:
+                    self.connection.execute(
+                        "UPDATE profiles SET csv_path = ? WHERE name = ?", (csv_path, name))
+
+    def find_profile_csv(self, profile_name):
+        """find_profile_csv.
+
+        Returns the path of the .csv file for a profile, or None if the profile's directory does not have one (yet)
+
+        :param profile_name: String name of the profile's directory
+        """
+        profile_dir = os.path.join(self.location, profile_name)
+        try:
+            csv_names = sorted(entry.name for entry in os.scandir(profile_dir)
+                               if entry.is_file() and entry.name.endswith('.csv'))
+        except FileNotFoundError:
+            return None
+
+        if len(csv_names) == 0:
+            return None
+
+        # By convention, the profile's .csv file has the same name as its directory
+        if '{}.csv'.format(profile_name) in csv_names:
+            return os.path.join(profile_dir, '{}.csv'.format(profile_name))
+        return os.path.join(profile_dir, csv_names[0])
+
+    def invalidate(self, profile_name=None):
+        """invalidate.
+
+        Forces the next sync to look at a profile (or the whole profile directory) again. Screens call this after changing a profile's files in place.
+
+        :param profile_name: String name of the profile, or None for the whole catalog
+        """
+        with self.connection:
+            if profile_name is None:
+                self.connection.execute("DELETE FROM meta")
+            else:
+                self.connection.execute(
+                    "UPDATE profiles SET csv_path = NULL WHERE name = ?", (profile_name,))
+
+
+# One catalog (and so one database connection) per profile directory, shared by every Profiler
+profile_catalogs = dict()
+
+
+def get_profile_catalog(location):
+    """get_profile_catalog.
+
+    Returns the ProfileCatalog for a profile directory, opening its database the first time it is asked for
+
+    :param location: String path of the profile directory (i.e.: ~/Documents/ball_e_profiles/goalie_profiles)
+    """
+    if location not in profile_catalogs:
+        profile_catalogs[location] = ProfileCatalog(location)
+    return profile_catalogs[location]
+
+
+def main():
+    """Main prototype/testing area. Code prototyping and checking happens here."""
+
+    catalog = get_profile_catalog(
+        str(Path.home()) + '/Documents/ball_e_profiles/goalie_profiles')
+    start = time.perf_counter()
+    profiles = catalog.get_profiles()
+    print("{} profiles in {:.2f} ms".format(
+        len(profiles), (time.perf_counter() - start)*1000))
+
+
+if __name__ == "__main__":
+    # Run the main function
+    main()
@@ -0,0 +1,179 @@
+"""
+helper_profile_watcher.py
+---
+This file contains the ProfileWatcher class, which watches the Goalie or Drill profiles on disk and tells the screens that show them exactly what changed.
+---
+
+Date: October 18, 2026
+Last Modified: October 18, 2026
+"""
+
+import os
+
+from PyQt5.QtCore import QFileSystemWatcher, QObject, QTimer, pyqtSignal
+
+from helper_profiler import Profiler
+
+# Changes that happen this close together (i.e.: a directory and then its .csv file being created) are sent as one update
+CHANGE_COALESCE_MS = 100
+
+# One watcher per profile directory, shared by every screen
+profile_watchers = dict()
+
+
+def get_profile_watcher(dirname):
+    """get_profile_watcher.
+
+    Returns the ProfileWatcher for a profile directory, creating it the first time it is asked for. The QApplication must exist before this is called.
+
+    :param dirname: Name of the profile directory (i.e.: goalie_profiles or drill_profiles)
+    """
+    if dirname not in profile_watchers:
+        profile_watchers[dirname] = ProfileWatcher(dirname)
+    return profile_watchers[dirname]
+
+
+class ProfileWatcher(QObject):
+    """ProfileWatcher.
+
+    The ProfileWatcher class keeps a live {profile name: profile .csv path} set for one profile directory using inotify (through QFileSystemWatcher) and emits what was added, removed, or modified
+    """
+
+    # Added {profile name: profile .csv path}, removed [profile names], modified [profile names]
+    profiles_changed = pyqtSignal(dict, list, list)
+
+    def __init__(self, dirname, parent=None):
+        """__init__.
+
+        Initializes the ProfileWatcher object and starts watching the profile directory
+
+        :param dirname: Name of the profile directory (i.e.: goalie_profiles or drill_profiles)
+        :param parent: Default arg.
+        """
+        super().__init__(parent=parent)
+
+        self.profiler = Profiler(dirname)
+        self.location = self.profiler.location
+        self.profiles = self.profiler.get_profiles()
+
+        # Profile names whose directory or .csv file changed since the last update was sent
+        self.pending_profile_names = set()
+
+        self.file_system_watcher = QFileSystemWatcher(self)
+        self.file_system_watcher.directoryChanged.connect(
+            self.on_directory_changed)
+
+        self.coalesce_timer = QTimer(self)
+        self.coalesce_timer.setSingleShot(True)
+        self.coalesce_timer.setInterval(CHANGE_COALESCE_MS)
+        self.coalesce_timer.timeout.connect(self.send_changes)
+
+        self.watch_paths()
+
+    def watch_paths(self):
+        """watch_paths.
+
+        Makes sure the profile directory and every profile's directory are being watched, which takes one inotify watch per profile. The .csv files are not watched themselves: they are saved by replacing them, which shows up as a change of their directory. If the profile directory does not exist yet, its parent is watched until it does.
+        """
+        if not os.path.isdir(self.location):
+            parent = os.path.dirname(self.location)
+            if os.path.isdir(parent) and parent not in self.file_system_watcher.directories():
+                self.file_system_watcher.addPath(parent)
+            return
+
+        watched = set(self.file_system_watcher.directories())
+        wanted = {self.location}
+        for profile_name in self.profiles:
+            wanted.add(os.path.join(self.location, profile_name))
+
+        new_paths = [path for path in wanted - watched if os.path.exists(path)]
+        if len(new_paths) > 0:
+            # Paths that cannot be watched (i.e.: the inotify watch limit is reached) are still picked up whenever the profile directory changes
+            self.file_system_watcher.addPaths(new_paths)
+
+    def on_directory_changed(self, path):
+        """on_directory_changed.
+
+        Records which directory changed and schedules an update. Profiles added to or removed from the profile directory are found by the catalog when the update is sent.
+
+        :param path: String path of the directory that changed
+        """
+        if path != self.location and path != os.path.dirname(self.location):
+            self.pending_profile_names.add(os.path.basename(path))
+        self.coalesce_timer.start()
+
+    def send_changes(self):
+        """send_changes.
+
+        Compares the profiles on disk with the live set and emits what changed, if anything
+        """
+        # Profiles whose directory changed may have a new .csv file, so let the catalog look at them again
+        for profile_name in self.pending_profile_names:
+            self.profiler.catalog.invalidate(profile_name)
+
+        current_profiles = self.profiler.get_profiles()
+
+        added = {name: path for name, path in current_profiles.items()
+                 if name not in self.profiles}
+        removed = [name for name in self.profiles
+                   if name not in current_profiles]
+        modified = [name for name in sorted(self.pending_profile_names)
+                    if name in current_profiles and name in self.profiles]
+
+        self.profiles = current_profiles
+        self.pending_profile_names = set()
+
+        # Start watching the directories of profiles just added
+        self.watch_paths()
+
+        if len(added) > 0 or len(removed) > 0 or len(modified) > 0:
+            self.profiles_changed.emit(added, removed, modified)
+
+    def get_profiles(self):
+        """get_profiles.
+
+        Returns a copy of the live {profile name: profile .csv path} set
+        """
+        return dict(self.profiles)
+
+
+def main():
+    """Main prototype/testing area. Code prototyping and checking happens here.
+
+    Watches the drill profiles of a temporary home directory while a profile is created, saved, and deleted, and prints each update and how many paths are watched.
+    """
+    import shutil
+    import sys
+    import tempfile
+
+    from PyQt5.QtCore import QCoreApplication
+
+    app = QCoreApplication(sys.argv)
+    os.environ['HOME'] = tempfile.mkdtemp()
+    profile_dir = os.path.join(
+        os.environ['HOME'], 'Documents/ball_e_profiles/drill_profiles/Drill 1')
+    profile_path = os.path.join(profile_dir, 'Drill 1.csv')
+
+    watcher = get_profile_watcher('drill_profiles')
+    watcher.profiles_changed.connect(lambda added, removed, modified: print("Added {}, removed {}, modified {}, {} paths watched".format(
+        list(added), removed, modified, len(watcher.file_system_watcher.directories() + watcher.file_system_watcher.files()))))
+
+    def create_profile():
+        os.makedirs(profile_dir)
+        with open(profile_path, 'w') as file:
+            file.write("Drill Name,Drill 1\n")
+
+    def save_profile():
+        temp_path = profile_path + '.tmp'
+        with open(temp_path, 'w') as file:
+            file.write("Drill Name,Drill 1\nTotal Number of Balls,10\n")
+        os.replace(temp_path, profile_path)
+
+    for step_index, step in enumerate((create_profile, save_profile, lambda: shutil.rmtree(profile_dir), app.quit)):
+        QTimer.singleShot((step_index + 1) * 4 * CHANGE_COALESCE_MS, step)
+    app.exec_()
+
+
+if __name__ == "__main__":
+    # Run the main function
+    main()
@@ -10,9 +10,15 @@ Last Modified: May 08, 2021
 """
 
 import csv
-import os
 from pathlib import Path
 
+from helper_goalie_history import GoalieHistory
+from helper_profile_cache import ProfileCache
+from helper_profile_catalog import get_profile_catalog
+
+# Parsed profiles are shared by every Profiler in the app
+profile_cache = ProfileCache()
+
 
 class Profiler():
     """Profiler.
@@ -28,6 +34,11 @@ class Profiler():
         :param dirname: Direction and name of the profile (i.e.: goalie_profiles or drill_profiles)
         """
         self.dirname = dirname
+        self.location = str(Path.home()) + \
+            '/Documents/ball_e_profiles/' + self.dirname
+
+        # Persistent index of the profiles so that they are not walked on disk every time. It is shared by every Profiler of the same directory.
+        self.catalog = get_profile_catalog(self.location)
 
     def get_profiles(self):
         """get_profiles.
@@ -35,22 +46,39 @@ class Profiler():
         Lists all the profiles in the directory
         """
 
-        location = str(Path.home()) + \
-            '/Documents/ball_e_profiles/' + self.dirname
-        profile_names = list()
-        profile_info = list()
-        for r, profile_dirs, profile_infos in os.walk(location):
-            for profile_dir in profile_dirs:
-                profile_names.append(profile_dir)
-            for each_profile_info in profile_infos:
-                profile_info.append(os.path.join(r, each_profile_info))
-
-        return {profile_names[i]: profile_info[i] for i in range(len(profile_names))}
+        return self.catalog.get_profiles()
 
     def get_profile_info(self, profile_path):
         """get_profile_info.
 
-        This method retrieves all the profiles info and appropriately puts them in a dictionary object.
+        This method retrieves all the profiles info and appropriately puts them in a dictionary object. Profiles that have not changed on disk are served from memory.
+
+        :param profile_path: Profile path containing the profile's .csv file
+        """
+        return profile_cache.get(profile_path, self.read_profile_info)
+
+    def get_goalie_history(self, profile_path):
+        """get_goalie_history.
+
+        This method returns the goalie's drill history, which can be read newest-first one page at a time instead of loading the whole profile.
+
+        :param profile_path: Profile path containing the goalie's .csv file
+        """
+        return GoalieHistory(profile_path)
+
+    def invalidate_profile_info(self, profile_path=None):
+        """invalidate_profile_info.
+
+        This method must be called after a profile's .csv file has been written or deleted so that it is read from disk again.
+
+        :param profile_path: Profile path containing the profile's .csv file (or its directory), or None for all profiles
+        """
+        profile_cache.invalidate(profile_path)
+
+    def read_profile_info(self, profile_path):
+        """read_profile_info.
+
+        This method parses the profile's .csv file from disk into a dictionary object.
 
         :param profile_path: Profile path containing the profile's .csv file
         """
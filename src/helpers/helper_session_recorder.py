@@ -0,0 +1,261 @@
+"""
+helper_session_recorder.py
+---
+This file contains the SessionRecorder class, which records the camera feed of a training session to the USB stick. Frames are encoded on a worker thread and written as a series of fixed-length video files.
+---
+
+Date: October 18, 2026
+Last Modified: October 18, 2026
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+
+import cv2
+
+logger = logging.getLogger(__name__)
+
+# How many frames can wait to be encoded. When the encoder falls this far behind, new frames are dropped.
+RECORDER_QUEUE_SIZE = 30
+# How long (in s) each video file is
+RECORDING_SEGMENT_SECONDS = 60
+# Frame rate the video files are played back at
+RECORDING_FPS = 30
+# Codec and file extension of the video files
+RECORDING_FOURCC = "MJPG"
+RECORDING_EXTENSION = ".avi"
+# How long (in s) stopping waits for the frames already queued to be written
+RECORDER_SHUTDOWN_TIMEOUT_S = 5
+# Where USB sticks get mounted
+USB_MOUNT_ROOTS = ("/media/", "/run/media/", "/mnt/")
+
+
+def find_usb_mount():
+    """find_usb_mount.
+
+    Returns the mount point of the first mounted USB stick (a /dev/sd* partition mounted under one of USB_MOUNT_ROOTS), or None if there is none
+    """
+    with open("/proc/mounts") as file:
+        for line in file:
+            device, mount_point = line.split()[:2]
+            # Spaces in mount points are written as \040
+            mount_point = mount_point.replace("\\040", " ")
+            if device.startswith("/dev/sd") and mount_point.startswith(USB_MOUNT_ROOTS):
+                return mount_point
+    return None
+
+
+class SessionRecorder():
+    """SessionRecorder.
+
+    The SessionRecorder class takes frames from the camera thread without ever blocking it: frames go into a bounded queue, and if the queue is full the frame is dropped. A worker thread encodes the queued frames and starts a new file every RECORDING_SEGMENT_SECONDS.
+    """
+
+    def __init__(self, output_directory, segment_seconds=RECORDING_SEGMENT_SECONDS, fps=RECORDING_FPS, queue_size=RECORDER_QUEUE_SIZE):
+        """__init__.
+
+        Initializes the SessionRecorder object
+
+        :param output_directory: String path of the directory (i.e.: the USB stick's mount point) the video files are written to
+        :param segment_seconds: How long (in s) each video file is
+        :param fps: Frame rate the video files are played back at
+        :param queue_size: How many frames can wait to be encoded
+        """
+        self.output_directory = output_directory
+        self.segment_seconds = segment_seconds
+        self.fps = fps
+
+        self.frame_queue = queue.Queue(maxsize=queue_size)
+        self.stop_event = threading.Event()
+        self.worker_thread = None
+
+        # Name shared by all the video files of this session
+        self.session_name = None
+        self.video_writer = None
+        self.segment_path = None
+        self.segment_start_time = None
+        self.segment_paths = list()
+
+        self.lock = threading.Lock()
+        self.submitted_count = 0
+        self.dropped_count = 0
+        self.encoded_count = 0
+        # Bytes of the video files that are finished
+        self.written_bytes = 0
+        self.start_time = None
+
+    def start(self):
+        """start.
+
+        Starts the worker thread. Frames submitted before this are dropped.
+        """
+        os.makedirs(self.output_directory, exist_ok=True)
+        self.session_name = time.strftime("ball_e_session_%Y%m%d_%H%M%S")
+        self.start_time = time.monotonic()
+        self.stop_event.clear()
+
+        self.worker_thread = threading.Thread(
+            target=self.run, name="SessionRecorder", daemon=True)
+        self.worker_thread.start()
+
+    def submit(self, frame):
+        """submit.
+
+        Queues a frame to be recorded, or drops it if the encoder is behind. Never blocks, so it can be called from the camera thread. Returns True if the frame was queued.
+
+        :param frame: numpy array of the BGR frame. It is encoded later, so it must not be changed afterwards.
+        """
+        with self.lock:
+            self.submitted_count += 1
+        if self.worker_thread is None or self.stop_event.is_set():
+            with self.lock:
+                self.dropped_count += 1
+            return False
+
+        try:
+            self.frame_queue.put_nowait(frame)
+        except queue.Full:
+            with self.lock:
+                self.dropped_count += 1
+            return False
+        return True
+
+    def stop(self, timeout=RECORDER_SHUTDOWN_TIMEOUT_S):
+        """stop.
+
+        Stops taking frames, gives the worker thread a bounded time to write the frames already queued, and closes the last video file. Returns True if the worker thread finished in time. With a timeout of 0 it returns at once, and the worker thread finishes writing on its own.
+
+        :param timeout: How long (in s) to wait for the worker thread
+        """
+        if self.worker_thread is None:
+            return True
+
+        self.stop_event.set()
+        self.worker_thread.join(timeout)
+        finished = not self.worker_thread.is_alive()
+        if not finished and timeout > 0:
+            logger.warning(
+                "Session recorder did not finish within %d s", timeout)
+        self.worker_thread = None
+        return finished
+
+    def run(self):
+        """run.
+
+        Encodes queued frames until stopped and the queue is empty. Runs on the worker thread.
+        """
+        while not (self.stop_event.is_set() and self.frame_queue.empty()):
+            try:
+                frame = self.frame_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            if self.video_writer is None or time.monotonic() - self.segment_start_time >= self.segment_seconds:
+                self.start_segment(frame)
+            self.video_writer.write(frame)
+
+            with self.lock:
+                self.encoded_count += 1
+
+        self.finish_segment()
+
+    def start_segment(self, frame):
+        """start_segment.
+
+        Finishes the current video file, if any, and opens the next one sized for the frame
+
+        :param frame: numpy array of the first BGR frame of the new file
+        """
+        self.finish_segment()
+
+        self.segment_path = os.path.join(self.output_directory, "{}_{:03d}{}".format(
+            self.session_name, len(self.segment_paths) + 1, RECORDING_EXTENSION))
+        height, width = frame.shape[:2]
+        self.video_writer = cv2.VideoWriter(self.segment_path, cv2.VideoWriter_fourcc(*RECORDING_FOURCC),
+                                            self.fps, (width, height))
+        self.segment_start_time = time.monotonic()
+        self.segment_paths.append(self.segment_path)
+
+    def finish_segment(self):
+        """finish_segment.
+
+        Closes the current video file, if any, and adds its size to the bytes written
+        """
+        if self.video_writer is None:
+            return
+
+        self.video_writer.release()
+        self.video_writer = None
+        try:
+            segment_bytes = os.path.getsize(self.segment_path)
+        except OSError:
+            logger.warning("Could not write %s", self.segment_path)
+            segment_bytes = 0
+        with self.lock:
+            self.written_bytes += segment_bytes
+
+    def get_segment_paths(self):
+        """get_segment_paths.
+
+        Returns a list of the paths of the video files of this session, oldest first
+        """
+        return list(self.segment_paths)
+
+    def get_stats(self):
+        """get_stats.
+
+        Returns the encoder's queue depth, the frame counters, and the write throughput (of finished files, in MB/s) as a dictionary object
+        """
+        with self.lock:
+            elapsed_time = time.monotonic() - self.start_time if self.start_time is not None else 0.0
+            return {
+                "queue_depth": self.frame_queue.qsize(),
+                "submitted": self.submitted_count,
+                "encoded": self.encoded_count,
+                "dropped": self.dropped_count,
+                "segments": len(self.segment_paths),
+                "written_mb": self.written_bytes / 1e6,
+                "write_mbps": self.written_bytes / 1e6 / elapsed_time if elapsed_time > 0 else 0.0,
+            }
+
+
+def main():
+    """Main prototype/testing area. Code prototyping and checking happens here.
+
+    Feeds 1080p test frames at 60 fps (faster than the encoder can keep up with) for 6 s into 2 s files, and prints how long submitting took and the recorder's stats.
+    """
+    import sys
+    import tempfile
+
+    from helper_capture_sources import SyntheticCaptureSource
+
+    output_directory = sys.argv[1] if len(
+        sys.argv) > 1 else tempfile.mkdtemp()
+    capture_source = SyntheticCaptureSource(1920, 1080, 60)
+    capture_source.open()
+
+    session_recorder = SessionRecorder(output_directory, segment_seconds=2)
+    session_recorder.start()
+
+    longest_submit_time = 0.0
+    end_time = time.monotonic() + 6
+    while time.monotonic() < end_time:
+        ret, frame = capture_source.read()
+        submit_start_time = time.monotonic()
+        session_recorder.submit(frame)
+        longest_submit_time = max(
+            longest_submit_time, time.monotonic() - submit_start_time)
+
+    print("Longest submit: {:.2f} ms".format(longest_submit_time * 1000))
+    print("Stopped in time: {}".format(session_recorder.stop()))
+    print(session_recorder.get_stats())
+    print(session_recorder.get_segment_paths())
+    capture_source.release()
+
+
+if __name__ == "__main__":
+    # Run the main function
+    main()
@@ -0,0 +1,169 @@
+"""
+helper_session_screens.py
+---
+This file contains the SessionScreenManager class, which owns the screens that are built anew for every training session and tears the old ones down (along with their drill handler threads) when they are replaced.
+---
+
+Date: October 18, 2026
+Last Modified: October 18, 2026
+"""
+
+import logging
+import sys
+
+from PyQt5.QtCore import QObject, QThread
+from PyQt5.QtWidgets import QApplication, QLabel, QStackedWidget, QVBoxLayout, QWidget
+
+logger = logging.getLogger(__name__)
+
+# How long (in ms) the app waits for the handler threads still finishing when it closes
+HANDLER_SHUTDOWN_TIMEOUT_MS = 2000
+
+
+class SessionScreenManager():
+    """SessionScreenManager.
+
+    The SessionScreenManager class keeps at most one screen per slot (i.e.: the Number of Balls selection screen) in the stacked widget. Putting a new screen in a slot removes the old one from the stacked widget, disconnects and stops its drill handler thread, and deletes it.
+    """
+
+    def __init__(self, stacked_widget):
+        """__init__.
+
+        Initializes the SessionScreenManager object
+
+        :param stacked_widget: QStackedWidget object the session screens are shown in
+        """
+        self.stacked_widget = stacked_widget
+
+        # {slot name: QWidget object of the screen currently in that slot}
+        self.screens = dict()
+        # Handler threads asked to stop that have not finished yet. They are kept referenced until they are deleted, since deleting a running thread crashes the app.
+        self.finishing_threads = set()
+
+    def replace(self, slot_name, screen):
+        """replace.
+
+        Adds a new screen to the stacked widget in place of the screen that was in the slot, and returns the new screen
+
+        :param slot_name: String name of the slot (i.e.: training_session_screen)
+        :param screen: QWidget object of the new screen
+        """
+        old_screen = self.screens.get(slot_name)
+        self.screens[slot_name] = screen
+        self.stacked_widget.addWidget(screen)
+
+        if old_screen is not None:
+            # Never pull the screen the user is looking at out from under them
+            if self.stacked_widget.currentWidget() is old_screen:
+                self.stacked_widget.setCurrentWidget(screen)
+            self.tear_down(old_screen)
+
+        return screen
+
+    def release(self, slot_name):
+        """release.
+
+        Tears down the screen in a slot, if there is one
+
+        :param slot_name: String name of the slot (i.e.: training_session_screen)
+        """
+        screen = self.screens.pop(slot_name, None)
+        if screen is not None:
+            self.tear_down(screen)
+
+    def release_all(self):
+        """release_all.
+
+        Tears down every session screen when the app is closing, and waits up to HANDLER_SHUTDOWN_TIMEOUT_MS for the handler threads to finish, since the app cannot exit while they run
+        """
+        for slot_name in list(self.screens):
+            self.release(slot_name)
+
+        for handler_thread in list(self.finishing_threads):
+            if not handler_thread.wait(HANDLER_SHUTDOWN_TIMEOUT_MS):
+                logger.warning(
+                    "Drill handler thread did not stop within %d ms", HANDLER_SHUTDOWN_TIMEOUT_MS)
+
+    def tear_down(self, screen):
+        """tear_down.
+
+        Removes a screen from the stacked widget, stops its drill handler thread, and schedules both to be deleted
+
+        :param screen: QWidget object of the screen
+        """
+        handler_thread = getattr(screen, "drill_handler_thread", None)
+        if handler_thread is not None:
+            self.stop_handler_thread(handler_thread)
+
+        self.stacked_widget.removeWidget(screen)
+        screen.deleteLater()
+
+    def stop_handler_thread(self, handler_thread):
+        """stop_handler_thread.
+
+        Disconnects everything listening to a session's handler thread, stops its drill, and asks it to stop, without waiting for it. The thread is deleted once it has finished.
+
+        :param handler_thread: The drill handler thread object of the session
+        """
+        if not isinstance(handler_thread, QObject):
+            return
+
+        # Nothing from a finished session may call back into the app
+        try:
+            handler_thread.disconnect()
+        except TypeError:
+            # Raised when nothing was connected
+            pass
+
+        # A drill loop that does not check for interruption keeps sending the ball machine commands until it is told to stop
+        stop_drill = getattr(handler_thread, "stop_drill", None)
+        if stop_drill is not None:
+            stop_drill()
+
+        if isinstance(handler_thread, QThread):
+            # Connected before checking whether it is running, so a thread finishing in between is still deleted
+            self.finishing_threads.add(handler_thread)
+            handler_thread.finished.connect(handler_thread.deleteLater)
+            handler_thread.destroyed.connect(
+                lambda *args: self.finishing_threads.discard(handler_thread))
+            if handler_thread.isRunning():
+                handler_thread.requestInterruption()
+                handler_thread.quit()
+                return
+
+        handler_thread.deleteLater()
+
+    def get_screen_count(self):
+        """get_screen_count.
+
+        Returns how many session screens are currently alive
+        """
+        return len(self.screens)
+
+
+def main():
+    """Main prototype/testing area. Code prototyping and checking happens here.
+
+    Replaces a session screen a few times and prints how many screens are left in the stack. The soak test over many sessions is in tests/test_session_screens.py.
+    """
+    app = QApplication(sys.argv)
+    stacked_widget = QStackedWidget()
+    stacked_widget.addWidget(QWidget())
+    session_screens = SessionScreenManager(stacked_widget)
+
+    for session in range(3):
+        session_screen = QWidget()
+        screen_layout = QVBoxLayout()
+        screen_layout.addWidget(QLabel("Session {}".format(session + 1)))
+        session_screen.setLayout(screen_layout)
+        session_screens.replace("training_session_screen", session_screen)
+        app.processEvents()
+        print("Session {}: {} screens in the stack, {} session screens".format(
+            session + 1, stacked_widget.count(), session_screens.get_screen_count()))
+
+    session_screens.release_all()
+
+
+if __name__ == "__main__":
+    # Run the main function
+    main()
@@ -0,0 +1,162 @@
+"""
+helper_snapshot_store.py
+---
+This file contains the SnapshotStore class, which hands frames taken by one screen (i.e.: the goal photo) to the screens that use them in memory, and only optionally saves them to disk in the background.
+---
+
+Date: October 18, 2026
+Last Modified: October 18, 2026
+"""
+
+import logging
+import pathlib
+import threading
+
+import cv2
+from PyQt5.QtGui import QImage
+
+logger = logging.getLogger(__name__)
+
+# Name the goal photo is stored under
+GOAL_SNAPSHOT_NAME = "lax_goal"
+# Name the frames taken just before the goal photo are stored under
+GOAL_BURST_SNAPSHOT_NAME = "lax_goal_burst"
+# Where the goal photo is saved, if it is saved
+GOAL_SNAPSHOT_PATH = str(
+    pathlib.Path.home()) + '/Developer/ball_e_gui/src/images/temp_training_lax_goal.png'
+# Set to False to keep the goal photo in memory only
+SAVE_GOAL_SNAPSHOT_PNG = True
+
+
+class SnapshotStore():
+    """SnapshotStore.
+
+    The SnapshotStore class keeps the newest frame under each name, both as the BGR numpy array it was taken as and as an RGB QImage ready to be shown. Nothing is decoded or read back from disk.
+    """
+
+    def __init__(self):
+        """__init__.
+
+        Initializes an empty SnapshotStore object
+        """
+        self.lock = threading.Lock()
+
+        # {name: (BGR numpy array, QImage object)}
+        self.snapshots = dict()
+        # {name: (N, height, width, channels) BGR numpy array}
+        self.bursts = dict()
+        # {name: horizontal field of view (in degrees) of the camera the burst was taken with}
+        self.burst_fovs = dict()
+        # Threads still saving snapshots to disk
+        self.save_threads = list()
+
+    def put(self, name, frame, save_path=None):
+        """put.
+
+        Stores a frame under a name, replacing the one stored before, and optionally saves it as an image file on a background thread
+
+        :param name: String name of the snapshot (i.e.: GOAL_SNAPSHOT_NAME)
+        :param frame: numpy array of the BGR frame. The store keeps it as is, so it must not be changed afterwards.
+        :param save_path: String path of the image file to save the frame to, or None to not save it
+        """
+        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        height, width, channels = rgb_frame.shape
+        # The copy owns its pixels, so it outlives rgb_frame
+        image = QImage(rgb_frame.data, width, height, channels * width,
+                       QImage.Format_RGB888).copy()
+
+        with self.lock:
+            self.snapshots[name] = (frame, image)
+
+        if save_path is not None:
+            save_thread = threading.Thread(
+                target=self.save, args=(frame, save_path))
+            save_thread.start()
+            self.save_threads = [
+                thread for thread in self.save_threads if thread.is_alive()] + [save_thread]
+
+    def save(self, frame, save_path):
+        """save.
+
+        Saves a frame to an image file. Runs on a background thread.
+
+        :param frame: numpy array of the BGR frame
+        :param save_path: String path of the image file
+        """
+        if not cv2.imwrite(save_path, frame):
+            logger.warning("Could not save the snapshot to %s", save_path)
+
+    def put_burst(self, name, frames, horizontal_fov_degrees=None):
+        """put_burst.
+
+        Stores a burst of frames under a name, replacing the one stored before. They are only kept in memory, and not converted for showing.
+
+        :param name: String name of the burst (i.e.: GOAL_BURST_SNAPSHOT_NAME)
+        :param frames: (N, height, width, channels) numpy array of the BGR frames, or None to forget the burst. The store keeps it as is, so it must not be changed afterwards.
+        :param horizontal_fov_degrees: Horizontal field of view (in degrees) of the camera the frames were taken with, or None if it is not known. It is kept even if there are no frames.
+        """
+        with self.lock:
+            if frames is None:
+                self.bursts.pop(name, None)
+            else:
+                self.bursts[name] = frames
+            self.burst_fovs[name] = horizontal_fov_degrees
+
+    def get_burst(self, name):
+        """get_burst.
+
+        Returns the (N, height, width, channels) BGR numpy array of the frames stored under a name, or None if there are none. It must not be changed.
+
+        :param name: String name of the burst
+        """
+        with self.lock:
+            return self.bursts.get(name)
+
+    def get_burst_fov_degrees(self, name):
+        """get_burst_fov_degrees.
+
+        Returns the horizontal field of view (in degrees) of the camera the burst stored under a name was taken with, or None if it is not known
+
+        :param name: String name of the burst
+        """
+        with self.lock:
+            return self.burst_fovs.get(name)
+
+    def get_frame(self, name):
+        """get_frame.
+
+        Returns the BGR numpy array stored under a name, or None if there is none. It must not be changed.
+
+        :param name: String name of the snapshot
+        """
+        with self.lock:
+            snapshot = self.snapshots.get(name)
+        return None if snapshot is None else snapshot[0]
+
+    def get_image(self, name):
+        """get_image.
+
+        Returns the QImage object stored under a name, or None if there is none. QImage objects are implicitly shared, so painting on it (or a QPixmap made from it) leaves the stored one untouched.
+
+        :param name: String name of the snapshot
+        """
+        with self.lock:
+            snapshot = self.snapshots.get(name)
+        return None if snapshot is None else snapshot[1]
+
+    def wait_for_saves(self, timeout=None):
+        """wait_for_saves.
+
+        Waits for the snapshots being saved to finish, i.e.: before the app closes. Returns True if they all finished.
+
+        :param timeout: Seconds to wait for each save, or None to wait as long as it takes
+        """
+        for save_thread in self.save_threads:
+            save_thread.join(timeout)
+        self.save_threads = [
+            thread for thread in self.save_threads if thread.is_alive()]
+        return len(self.save_threads) == 0
+
+
+# The SnapshotStore object shared by every screen
+snapshot_store = SnapshotStore()
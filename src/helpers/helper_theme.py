@@ -0,0 +1,149 @@
+"""
+helper_theme.py
+---
+This file builds the one style sheet used by the whole of Ball-E's GUI app from the style constants, and applies it to the running app.
+---
+
+Date: October 18, 2026
+Last Modified: October 18, 2026
+"""
+
+from PyQt5.QtWidgets import QApplication
+
+import style_constants as sc
+
+# The tokens the style sheet is built from. A theme only needs to give the tokens it changes.
+DEFAULT_THEME = {
+    "font_s": sc.FONT_S,
+    "font_m": sc.FONT_M,
+    "font_l": sc.FONT_L,
+    "font_xl": sc.FONT_XL,
+    "color_toolbar": sc.COLOR_TOOLBAR,
+    "color_info": sc.COLOR_INFO,
+    "color_error": sc.COLOR_ERROR,
+    "color_white": sc.COLOR_WHITE,
+}
+
+# Components are selected by their class name, and their variants by object name (#name) or property ([property="value"])
+STYLESHEET_TEMPLATE = """
+GenericButton, FullPageButton {{
+    font-size: {font_l};
+}}
+
+ProfileCreateButton {{
+    background-color: green;
+    color: white;
+    font-size: {font_m};
+    font-weight: bold;
+}}
+
+ProfileDeleteButton {{
+    background-color: red;
+    color: white;
+    font-size: {font_s};
+    font-weight: bold;
+}}
+
+ProfileLabel {{
+    color: black;
+    font-size: {font_l};
+}}
+
+TableHeaderLabel {{
+    color: black;
+    font-size: {font_l};
+    font-weight: bold;
+}}
+
+QListWidget {{
+    font-size: {font_m};
+}}
+
+QHeaderView#profileInfoHeader {{
+    font-size: {font_l};
+}}
+
+HomeScreenButton {{
+    background-color: green;
+    color: white;
+    font-size: 60px;
+    font-weight: bold;
+}}
+
+PowerOffButton {{
+    background-color: red;
+    color: white;
+    font-size: 40px;
+    font-weight: bold;
+}}
+
+HomeScreenTitle {{
+    color: black;
+    font-size: 100px;
+    font-weight: bold;
+}}
+
+HomeScreenSubtitle {{
+    color: black;
+    font-size: 60px;
+}}
+
+ToolbarComponent, ToolbarComponent * {{
+    background-color: {color_toolbar};
+}}
+
+ToolbarComponent ToolbarButton {{
+    font-size: {font_l};
+    background-color: {color_white};
+}}
+
+ToolbarTitle {{
+    color: white;
+    font-size: {font_xl};
+    font-weight: bold;
+}}
+
+QWidget#modalHeadingBar[modalType="info"], QWidget#modalHeadingBar[modalType="info"] *,
+QWidget#modalHeadingBar[modalType="choice"], QWidget#modalHeadingBar[modalType="choice"] * {{
+    background-color: {color_info};
+}}
+
+QWidget#modalHeadingBar[modalType="error"], QWidget#modalHeadingBar[modalType="error"] * {{
+    background-color: {color_error};
+}}
+
+QLabel#modalHeadingLabel {{
+    font-size: {font_xl};
+    color: white;
+}}
+"""
+
+# {sorted theme tokens: style sheet}, so switching back to a theme does not build it again
+compiled_stylesheets = dict()
+
+
+def build_stylesheet(theme):
+    """build_stylesheet.
+
+    Returns the style sheet for a theme, building it only the first time
+
+    :param theme: Dictionary object of every token in DEFAULT_THEME
+    """
+    theme_key = tuple(sorted(theme.items()))
+    if theme_key not in compiled_stylesheets:
+        compiled_stylesheets[theme_key] = STYLESHEET_TEMPLATE.format(**theme)
+    return compiled_stylesheets[theme_key]
+
+
+def apply_theme(theme_overrides=None):
+    """apply_theme.
+
+    Styles the whole app with one style sheet. Calling it again with other tokens switches the theme of every widget at once. The QApplication must exist before this is called.
+
+    :param theme_overrides: Dictionary object of the tokens to change from DEFAULT_THEME, or None for the default theme
+    """
+    theme = dict(DEFAULT_THEME)
+    if theme_overrides is not None:
+        theme.update(theme_overrides)
+
+    QApplication.instance().setStyleSheet(build_stylesheet(theme))
@@ -9,15 +9,19 @@ Date: May 4, 2021
 Last Modified: May 08, 2021
 """
 
-import sys
-
-from PyQt5.QtWidgets import QApplication, QDesktopWidget
-
-FONT_S = "16px"
-FONT_M = "22px"
-FONT_L = "40px"
-FONT_XL = "50px"
-FONT_XXL = "80px"
+# Font sizes in pixels
+FONT_S_PX = 16
+FONT_M_PX = 22
+FONT_L_PX = 40
+FONT_XL_PX = 50
+FONT_XXL_PX = 80
+
+# Font sizes as used in style sheets
+FONT_S = "{}px".format(FONT_S_PX)
+FONT_M = "{}px".format(FONT_M_PX)
+FONT_L = "{}px".format(FONT_L_PX)
+FONT_XL = "{}px".format(FONT_XL_PX)
+FONT_XXL = "{}px".format(FONT_XXL_PX)
 
 COLOR_TOOLBAR = "#2E75B6"
 COLOR_INFO = "#C55A11"
@@ -37,8 +41,4 @@ MAX_DISTANCE = 20
 # Table Header Height 22+8=30px
 TABLE_HEADER_HEIGHT = 30
 
-app = QApplication(sys.argv)
-SCREEN_HEIGHT = QDesktopWidget().screenGeometry(0).height()
-SCREEN_WIDTH = QDesktopWidget().screenGeometry(0).width()
-# Preventing Segmentation Fault
-app = None
+# The screen's size is measured once the app is running, see helper_display_metrics.get_display_metrics()
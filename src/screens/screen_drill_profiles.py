@@ -24,23 +24,25 @@ try:
     from component_drill_creation_widget import DrillCreationWidget
     from component_dropdown import Dropdown
     from component_labels import ProfileLabel
+    from component_lazy_tab_widget import LazyTabWidget
     from component_lineedit import LineEdit
     from component_modal import Modal
+    from component_profile_table import ProfileTableModel, ProfileTableView
     from component_toolbar import ToolbarComponent
+    from helper_drill_document import DrillDocument
     from helper_profiler import Profiler
     from window_test import TestWindow
 except ImportError:
     print("{}: Imports failed".format(__file__))
 finally:
-    import csv
     import shutil
 
     from PyQt5 import QtWidgets
     from PyQt5.QtCore import Qt
-    from PyQt5.QtGui import QColor, QFont
+    from PyQt5.QtGui import QFont
     from PyQt5.QtWidgets import (QApplication, QDialog, QHBoxLayout,
                                  QHeaderView, QTableWidget, QTableWidgetItem,
-                                 QTabWidget, QVBoxLayout, QWidget)
+                                 QVBoxLayout, QWidget)
 
 
 class DrillProfilesScreen(QWidget):
@@ -69,7 +71,7 @@ class DrillProfilesScreen(QWidget):
 
         # This font will be used for all table related purposes
         self.table_font = QFont()
-        self.table_font.setPixelSize(int(sc.FONT_L[:2]))
+        self.table_font.setPixelSize(sc.FONT_L_PX)
 
         # Create a screen layout object to populate
         self.screen_layout = QVBoxLayout()
@@ -100,57 +102,15 @@ class DrillProfilesScreen(QWidget):
             table_clicked_action (function): Function to execute when table is clicked
         """
 
-        # Create the main table widget where data will be populated
-        self.main_table_view = QTableWidget()
-        # Do not allow the user to edit the contents of the table
-        self.main_table_view.setEditTriggers(
-            QtWidgets.QTableWidget.NoEditTriggers)
-        # The number of rows is defined by how many objects there are in the dictionary
-        self.main_table_view.setRowCount(len(profile_dict_obj))
+        # The model hands the profiles to the view only as it needs them
+        self.profile_table_model = ProfileTableModel(
+            profile_dict_obj.keys(), self.table_font, show_delete_column=True)
         # 2 columns: one for the profile name and one for the delete button
-        self.main_table_view.setColumnCount(2)
-
-        # Iterate through the data in the dictionary and format it appropriately in the table
-        for row_count, profile_name in enumerate(profile_dict_obj):
-            # Modify the profile name's string and populate into a table cell
-            mod_profile_name = profile_name.replace('_', ' ').title()
-            mod_profile_name_widget = QTableWidgetItem(mod_profile_name)
-            # Create a delete 'button' by converting a cell to act like a button
-            delete_row_widget = QTableWidgetItem('Delete')
-            delete_row_widget.setBackground(
-                QColor(sc.COLOR_ERROR)
-            )
-            delete_row_widget.setForeground(
-                QColor(sc.COLOR_WHITE)
-            )
-            mod_profile_name_widget.setFont(self.table_font)
-            delete_row_widget.setFont(self.table_font)
-            # Align items in their respective cells appropriately
-            mod_profile_name_widget.setTextAlignment(Qt.AlignLeft)
-            delete_row_widget.setTextAlignment(Qt.AlignRight)
-            # Add items to the table view
-            self.main_table_view.setItem(
-                row_count, 0, mod_profile_name_widget)
-            self.main_table_view.setItem(
-                row_count, 1, delete_row_widget)
+        self.main_table_view = ProfileTableView(self.profile_table_model)
 
         # Function to execute when a cell from this table is clicked
         self.main_table_view.clicked.connect(table_clicked_action)
 
-        # Capture the horizontal header of the table
-        main_table_hor_head = self.main_table_view.horizontalHeader()
-
-        # Hide all headers of the table
-        self.main_table_view.verticalHeader().setVisible(False)
-        main_table_hor_head.setVisible(False)
-
-        # Resize the left column to stretch as far out as possible
-        main_table_hor_head.setSectionResizeMode(0, QHeaderView.Stretch)
-        # Resize the right column to wrap around its contents
-        main_table_hor_head.setSectionResizeMode(
-            1, QHeaderView.ResizeToContents)
-        self.main_table_view.resizeRowsToContents()
-
     def create_table_header_view(self, table_title_name, header_clicked_action):
         """Creates a table header for the table below it
 
@@ -218,7 +178,7 @@ class DrillProfilesScreen(QWidget):
         """
 
         # Unselect the currently picked cell
-        self.main_table_view.selectedItems()[0].setSelected(False)
+        self.main_table_view.clearSelection()
 
         # If a profile name has been clicked, then show a modal
         if item.column() == 0:
@@ -231,7 +191,8 @@ class DrillProfilesScreen(QWidget):
             check_delete_modal = Modal(
                 type="choice",
                 layout=check_delete_modal_layout,
-                window_title=self.main_table_view.item(item.row(), 0).text()
+                window_title=self.profile_table_model.get_display_name(
+                    item.row())
             )
 
             # If yes is clicked, delete the profile
@@ -250,11 +211,11 @@ class DrillProfilesScreen(QWidget):
 
         # Fetch the location of the drill profile
         location = str(pathlib.Path.home()) + '/Documents/ball_e_profiles/drill_profiles/' + \
-            self.main_table_view.item(
-                table_row, 0).text().replace(' ', '_').lower()
+            self.profile_table_model.get_profile_name(table_row)
         # Remove the directory and remove the row from the table
         shutil.rmtree(location, ignore_errors=True)
-        self.main_table_view.removeRow(table_row)
+        self.profiler.invalidate_profile_info(location)
+        self.profile_table_model.remove_row(table_row)
 
         # Update the drill profile instance
         self.get_drill_profiles_info()
@@ -280,31 +241,10 @@ class DrillProfilesScreen(QWidget):
             pathlib.Path(location).mkdir(parents=True, exist_ok=False)
             pathlib.Path(location+'/{}.csv'.format(drill_name.replace(' ',
                                                                       '_').lower())).touch(exist_ok=False)
-            # Append this new profile to the end of the table
-            last_row_num = self.main_table_view.rowCount()
-            self.main_table_view.insertRow(last_row_num)
-
-            # Format the row accordingly with the drill profile name and a delete 'button'
-            mod_drill_name_widget = QTableWidgetItem(drill_name.title())
-            delete_row_widget = QTableWidgetItem('Delete')
-            delete_row_widget.setBackground(
-                QColor(sc.COLOR_ERROR)
-            )
-            delete_row_widget.setForeground(
-                QColor(sc.COLOR_WHITE)
-            )
-            mod_drill_name_widget.setFont(self.table_font)
-            delete_row_widget.setFont(self.table_font)
-            mod_drill_name_widget.setTextAlignment(Qt.AlignLeft)
-            delete_row_widget.setTextAlignment(Qt.AlignRight)
-
-            # Set the contents in the table appropriately
-            self.main_table_view.setItem(
-                last_row_num, 0, mod_drill_name_widget)
-            self.main_table_view.setItem(
-                last_row_num, 1, delete_row_widget)
-
-            self.main_table_view.resizeRowsToContents()
+            # Add this new profile to the table in its sorted place
+            self.profile_table_model.add_profile(
+                drill_name.replace(' ', '_').lower())
+
             # Update the drill profiles instance
             self.get_drill_profiles_info()
 
@@ -326,8 +266,7 @@ class DrillProfilesScreen(QWidget):
         """
 
         # Get the drill's info
-        drill_name = self.main_table_view.item(
-            table_row, 0).text().replace(' ', '_').lower()
+        drill_name = self.profile_table_model.get_profile_name(table_row)
         drill_profile_path = self.drill_profiles[drill_name]
 
         modal_layout = QVBoxLayout()
@@ -345,7 +284,7 @@ class DrillProfilesScreen(QWidget):
             ball_number_widget = QTableWidgetItem(ball_number)
             ball_target_location_widget = QTableWidgetItem(ball_specifics[0])
             ball_speed_widget = QTableWidgetItem(ball_specifics[1])
-            self.table_font.setPixelSize(int(sc.FONT_L[:2]))
+            self.table_font.setPixelSize(sc.FONT_L_PX)
             ball_number_widget.setFont(self.table_font)
             ball_target_location_widget.setFont(self.table_font)
             ball_speed_widget.setFont(self.table_font)
@@ -362,11 +301,8 @@ class DrillProfilesScreen(QWidget):
         table_view.verticalHeader().setVisible(False)
         table_view.resizeRowsToContents()
 
-        table_view.horizontalHeader().setStyleSheet(
-            """
-            font-size: {font_size}
-            """.format(font_size=sc.FONT_L)
-        )
+        # The app style sheet sets the font of this header by its object name
+        table_view.horizontalHeader().setObjectName("profileInfoHeader")
 
         table_view.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
 
@@ -514,7 +450,9 @@ class DrillProfilesScreen(QWidget):
         exec_val = create_new_page_two.exec()
 
         if exec_val == QDialog.Rejected:
-            self.remove_drill_profile(self.main_table_view.rowCount()-1)
+            # The drill was never saved, so remove the profile that was created for it
+            self.remove_drill_profile(self.profile_table_model.get_row(
+                drill_name.replace(' ', '_').lower()))
 
     def create_new_drill_profile_modal_page_three(self, modal, drill_name):
         """create_new_drill_profile_modal_page_three.
@@ -543,18 +481,16 @@ class DrillProfilesScreen(QWidget):
             drill_name.replace(' ', '_').lower(
         ) + '/{}.csv'.format(drill_name.replace(' ', '_').lower())
 
-        modal_page_three_tab_widget = QTabWidget()
+        # All the ball tabs edit this one in-memory drill, which is only written to disk when Save is clicked
+        drill_document = DrillDocument(
+            drill_location, self.curr_drill_balls, self.curr_drill_rof, default_location="CM", default_speed=sc.MIN_BALL_SPEED)
 
-        with open(drill_location, 'w', newline='') as file:
-            writer = csv.writer(file, delimiter=",")
-            writer.writerow(
-                ["Ball #", "Target Location", "Ball Speed", "Rate of Fire"]
-            )
-            for balls in range(self.curr_drill_balls):
-                writer.writerow(["{}".format(
-                    balls+1), "CM", "{}".format(sc.MIN_BALL_SPEED), "{}".format(self.curr_drill_rof)])
-                modal_page_three_tab_widget.addTab(
-                    DrillCreationWidget(drill_location, "{}".format(balls+1)), "Ball {}".format(balls+1))
+        # Each ball's editor is only built when its tab is first opened
+        modal_page_three_tab_widget = LazyTabWidget()
+
+        for balls in range(self.curr_drill_balls):
+            modal_page_three_tab_widget.add_lazy_tab(
+                lambda ball_number="{}".format(balls+1): DrillCreationWidget(drill_document, ball_number), "Ball {}".format(balls+1))
 
         create_new_page_three_layout.addWidget(modal_page_three_tab_widget)
 
@@ -565,13 +501,29 @@ class DrillProfilesScreen(QWidget):
 
         save_button = GenericButton("Save")
         save_button.clicked.connect(
-            lambda: create_new_page_three.accept())
+            lambda: self.save_drill_document(drill_document, create_new_page_three))
         create_new_page_three_layout.addWidget(save_button)
 
         exec_val = create_new_page_three.exec()
 
         if exec_val == QDialog.Rejected:
-            self.remove_drill_profile(self.main_table_view.rowCount()-1)
+            # The drill was never saved, so remove the profile that was created for it
+            self.remove_drill_profile(self.profile_table_model.get_row(
+                drill_name.replace(' ', '_').lower()))
+
+    def save_drill_document(self, drill_document, modal):
+        """save_drill_document.
+
+        Writes the drill that was created in the modal to disk and closes the modal
+
+        :param drill_document: DrillDocument object containing the drill being created
+        :param modal: QDialog object representing the modal object
+        """
+        drill_document.save()
+        # The drill has been rewritten, so it must be parsed again the next time it is read
+        self.profiler.invalidate_profile_info(drill_document.local_location)
+
+        modal.accept()
 
     def update_total_drill_balls(self, updated_drill_balls):
         """update_total_drill_balls.
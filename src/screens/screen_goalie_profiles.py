@@ -24,7 +24,9 @@ try:
     from component_labels import ProfileLabel
     from component_lineedit import LineEdit
     from component_modal import Modal
+    from component_profile_table import ProfileTableModel, ProfileTableView
     from component_toolbar import ToolbarComponent
+    from helper_goalie_history import GOALIE_CSV_HEADER
     from helper_profiler import Profiler
     from window_test import TestWindow
 
@@ -36,11 +38,14 @@ finally:
 
     from PyQt5 import QtWidgets
     from PyQt5.QtCore import Qt
-    from PyQt5.QtGui import QColor, QFont
+    from PyQt5.QtGui import QFont
     from PyQt5.QtWidgets import (QApplication, QHBoxLayout, QHeaderView,
                                  QSizePolicy, QTableWidget, QTableWidgetItem,
                                  QVBoxLayout, QWidget)
 
+# How many drills of a goalie's history are shown at a time
+GOALIE_HISTORY_PAGE_SIZE = 20
+
 
 class GoalieProfilesScreen(QWidget):
     """Screen to create, delete, and view Goalie Profiles
@@ -62,7 +67,7 @@ class GoalieProfilesScreen(QWidget):
 
         # This font will be used for all table related purposes
         self.table_font = QFont()
-        self.table_font.setPixelSize(int(sc.FONT_L[:2]))
+        self.table_font.setPixelSize(sc.FONT_L_PX)
 
         # Create a screen layout object to populate
         self.screen_layout = QVBoxLayout()
@@ -93,59 +98,15 @@ class GoalieProfilesScreen(QWidget):
             table_clicked_action (function): Function to execute when table is clicked
         """
 
-        # Create the main table widget where data will be populated
-        self.main_table_view = QTableWidget()
-
-        # Do not allow the user to edit the contents of the table
-        self.main_table_view.setEditTriggers(
-            QtWidgets.QTableWidget.NoEditTriggers)
-        # The number of rows is defined by how many objects there are in the dictionary
-        self.main_table_view.setRowCount(len(profile_dict_obj))
+        # The model hands the profiles to the view only as it needs them
+        self.profile_table_model = ProfileTableModel(
+            profile_dict_obj.keys(), self.table_font, show_delete_column=True)
         # 2 columns: one for the profile name and one for the delete button
-        self.main_table_view.setColumnCount(2)
-
-        # Iterate through the data in the dictionary and format it appropriately in the table
-        for row_count, profile_name in enumerate(profile_dict_obj):
-            # Modify the profile name's string and populate into a table cell
-            mod_profile_name = profile_name.replace('_', ' ').title()
-            mod_profile_name_widget = QTableWidgetItem(mod_profile_name)
-            # Create a delete 'button' by converting a cell to act like a button
-            delete_row_widget = QTableWidgetItem('Delete')
-            delete_row_widget.setBackground(
-                QColor(sc.COLOR_ERROR)
-            )
-            delete_row_widget.setForeground(
-                QColor(sc.COLOR_WHITE)
-            )
-            mod_profile_name_widget.setFont(self.table_font)
-            delete_row_widget.setFont(self.table_font)
-            # Align items in their respective cells appropriately
-            mod_profile_name_widget.setTextAlignment(Qt.AlignLeft)
-            delete_row_widget.setTextAlignment(Qt.AlignRight)
-            # Add items to the table view
-            self.main_table_view.setItem(
-                row_count, 0, mod_profile_name_widget)
-            self.main_table_view.setItem(
-                row_count, 1, delete_row_widget)
+        self.main_table_view = ProfileTableView(self.profile_table_model)
 
         # Function to execute when a cell from this table is clicked
         self.main_table_view.clicked.connect(table_clicked_action)
 
-        # Capture the horizontal header of the table
-        main_table_hor_head = self.main_table_view.horizontalHeader()
-
-        # Hide all headers of the table
-        self.main_table_view.verticalHeader().setVisible(False)
-        main_table_hor_head.setVisible(False)
-
-        # Resize the left column to stretch as far out as possible
-        main_table_hor_head.setSectionResizeMode(0, QHeaderView.Stretch)
-        # Resize the right column to wrap around its contents
-        main_table_hor_head.setSectionResizeMode(
-            1, QHeaderView.ResizeToContents)
-
-        self.main_table_view.resizeRowsToContents()
-
     def create_table_header_view(self, table_title_name, header_clicked_action):
         """Creates a table header for the table below it
 
@@ -216,7 +177,7 @@ class GoalieProfilesScreen(QWidget):
         :param item: The object that was clicked in the table
         """
         # Unselect the currently picked cell
-        self.main_table_view.selectedItems()[0].setSelected(False)
+        self.main_table_view.clearSelection()
 
         # If a profile name has been clicked, then show a modal
         if item.column() == 0:
@@ -230,7 +191,8 @@ class GoalieProfilesScreen(QWidget):
             check_delete_modal = Modal(
                 type="choice",
                 layout=check_delete_modal_layout,
-                window_title=self.main_table_view.item(item.row(), 0).text()
+                window_title=self.profile_table_model.get_display_name(
+                    item.row())
             )
 
             # If yes is clicked, delete the profile
@@ -249,11 +211,11 @@ class GoalieProfilesScreen(QWidget):
 
         # Fetch the location of the goalie profile
         location = str(pathlib.Path.home()) + '/Documents/ball_e_profiles/goalie_profiles/' + \
-            self.main_table_view.item(
-                table_row, 0).text().replace(' ', '_').lower()
+            self.profile_table_model.get_profile_name(table_row)
         # Remove the directory and remove the row from the table
         shutil.rmtree(location, ignore_errors=True)
-        self.main_table_view.removeRow(table_row)
+        self.profiler.invalidate_profile_info(location)
+        self.profile_table_model.remove_row(table_row)
 
         # Update the goalie profile instance
         self.get_goalie_profiles_info()
@@ -314,33 +276,12 @@ class GoalieProfilesScreen(QWidget):
                 goalie_name=goalie_name.replace(' ', '_').lower())
             with open(goalie_path, 'w', newline='') as file:
                 writer = csv.writer(file, delimiter=',')
-                writer.writerow(
-                    ["Drill Name", "Date Completed (Most recent prioritized)"])
-            # Append this new profile to the end of the table
-            last_row_num = self.main_table_view.rowCount()
-            self.main_table_view.insertRow(last_row_num)
-
-            # Format the row accordingly with the goalie profile name and a delete 'button'
-            mod_goalie_name_widget = QTableWidgetItem(goalie_name)
-            delete_row_widget = QTableWidgetItem('Delete')
-            delete_row_widget.setBackground(
-                QColor(sc.COLOR_ERROR)
-            )
-            delete_row_widget.setForeground(
-                QColor(sc.COLOR_WHITE)
-            )
-            mod_goalie_name_widget.setFont(self.table_font)
-            delete_row_widget.setFont(self.table_font)
-            mod_goalie_name_widget.setTextAlignment(Qt.AlignLeft)
-            delete_row_widget.setTextAlignment(Qt.AlignRight)
-
-            # Set the contents in the table appropriately
-            self.main_table_view.setItem(
-                last_row_num, 0, mod_goalie_name_widget)
-            self.main_table_view.setItem(
-                last_row_num, 1, delete_row_widget)
-
-            self.main_table_view.resizeRowsToContents()
+                writer.writerow(GOALIE_CSV_HEADER)
+            self.profiler.invalidate_profile_info(goalie_path)
+            # Add this new profile to the table in its sorted place
+            self.profile_table_model.add_profile(
+                goalie_name.replace(' ', '_').lower())
+
             # Update the goalie profiles instance
             self.get_goalie_profiles_info()
 
@@ -361,30 +302,32 @@ class GoalieProfilesScreen(QWidget):
             table_row (Object): The selected row in the table
         """
 
+        goalie_name = self.profile_table_model.get_profile_name(table_row)
+
         # If the selected row was newly created, then just display the modal saying "No information yet and quit"
-        if table_row >= self.curr_goalie_profiles_len:
+        if goalie_name not in self.goalie_profiles:
             info_modal_layout = QVBoxLayout()
             info_modal_layout.addWidget(ProfileLabel("No information yet."))
             Modal(
                 type="info",
                 layout=info_modal_layout,
-                window_title=self.main_table_view.item(table_row, 0).text()
+                window_title=self.profile_table_model.get_display_name(
+                    table_row)
             )
             return
 
         # Get the goalie's info
-        goalie_name = self.main_table_view.item(
-            table_row, 0).text().replace(' ', '_').lower()
         goalie_profile_path = self.goalie_profiles[goalie_name]
 
         modal_layout = QVBoxLayout()
 
         table_view = QTableWidget()
         table_view.setEditTriggers(QtWidgets.QTableWidget.NoEditTriggers)
-        goalie_info = self.profiler.get_profile_info(goalie_profile_path)
+        # Only the most recent drills are read from disk. Older ones are read a page at a time when asked for.
+        goalie_history = self.profiler.get_goalie_history(goalie_profile_path)
 
         # If no info has been populated, also show that "No information yet" and quit
-        if(len(goalie_info) == 0):
+        if(goalie_history.get_entry_count() == 0):
             info_modal_layout = QVBoxLayout()
             info_modal_layout.addWidget(ProfileLabel("No information yet."))
             Modal(
@@ -394,17 +337,58 @@ class GoalieProfilesScreen(QWidget):
             )
             return
 
-        # Otherwise, create and populate the table with drill information and times performed
-        table_view.setRowCount(len(goalie_info))
+        # Otherwise, create and populate the table with the most recent drills and times performed
         table_view.setColumnCount(2)
+        self.append_goalie_history_page(table_view, goalie_history, 0)
+
+        table_view.setHorizontalHeaderLabels(
+            ["Drill History", "Date"])
+        table_view.verticalHeader().setVisible(False)
+        table_view.resizeRowsToContents()
+
+        # The app style sheet sets the font of this header by its object name
+        table_view.horizontalHeader().setObjectName("profileInfoHeader")
+
+        table_view.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+
+        modal_layout.addWidget(table_view)
+
+        # Button to fetch the next page of older drills, only shown if there are any
+        show_older_button = GenericButton("Show Older")
+        show_older_button.setVisible(
+            goalie_history.get_entry_count() > table_view.rowCount())
+        show_older_button.clicked.connect(
+            lambda: self.show_older_goalie_history(table_view, goalie_history, show_older_button))
+        modal_layout.addWidget(show_older_button)
+
+        # Create a modal object to show all this information
+        Modal(
+            type="info",
+            layout=modal_layout,
+            window_title=goalie_name.replace('_', ' ').title()
+        )
+
+    def append_goalie_history_page(self, table_view, goalie_history, page_number):
+        """append_goalie_history_page.
+
+        Reads one page of the goalie's drill history and adds it to the bottom of the table
+
+        :param table_view: QTableWidget object showing the goalie's drill history
+        :param goalie_history: GoalieHistory object of the goalie
+        :param page_number: Integer number of the page, counting back from the most recent drills
+        """
+        first_row = table_view.rowCount()
+        history_page = goalie_history.get_page(
+            page_number, GOALIE_HISTORY_PAGE_SIZE)
+        table_view.setRowCount(first_row + len(history_page))
 
         # Iterates through all the information and populates the table
-        for curr_row, drill_history in enumerate(goalie_info.values()):
+        for curr_row, drill_history in enumerate(history_page, start=first_row):
             drill_info = drill_history[0]
             date_info = drill_history[1]
             drill_name_widget = QTableWidgetItem(drill_info)
             date_info_widget = QTableWidgetItem(date_info)
-            self.table_font.setPixelSize(int(sc.FONT_L[:2]))
+            self.table_font.setPixelSize(sc.FONT_L_PX)
             drill_name_widget.setFont(self.table_font)
             date_info_widget.setFont(self.table_font)
             drill_name_widget.setTextAlignment(Qt.AlignCenter)
@@ -412,27 +396,23 @@ class GoalieProfilesScreen(QWidget):
             table_view.setItem(curr_row, 0, drill_name_widget)
             table_view.setItem(curr_row, 1, date_info_widget)
 
-        table_view.setHorizontalHeaderLabels(
-            ["Drill History", "Date"])
-        table_view.verticalHeader().setVisible(False)
         table_view.resizeRowsToContents()
 
-        table_view.horizontalHeader().setStyleSheet(
-            """
-            font-size: {font_size}
-            """.format(font_size=sc.FONT_L)
-        )
+    def show_older_goalie_history(self, table_view, goalie_history, show_older_button):
+        """show_older_goalie_history.
 
-        table_view.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+        Adds the next page of older drills to the goalie's drill history table
 
-        modal_layout.addWidget(table_view)
+        :param table_view: QTableWidget object showing the goalie's drill history
+        :param goalie_history: GoalieHistory object of the goalie
+        :param show_older_button: GenericButton object which is hidden once there are no older drills left
+        """
+        next_page_number = table_view.rowCount() // GOALIE_HISTORY_PAGE_SIZE
+        self.append_goalie_history_page(
+            table_view, goalie_history, next_page_number)
 
-        # Create a modal object to show all this information
-        Modal(
-            type="info",
-            layout=modal_layout,
-            window_title=goalie_name.replace('_', ' ').title()
-        )
+        show_older_button.setVisible(
+            goalie_history.get_entry_count() > table_view.rowCount())
 
     def get_window_title(self):
         """Helper function to return this window's title
@@ -62,13 +62,18 @@ class TrainingGetDistanceFromGoalScreen(QWidget):
 
         self.curr_dist = sc.MIN_DISTANCE
 
-        distance_input = Dropdown()
+        self.distance_input = Dropdown()
         for ball in range(sc.MIN_DISTANCE, sc.MAX_DISTANCE+1):
-            distance_input.addItem(str(ball))
-        distance_input.currentIndexChanged.connect(
-            lambda: self.update_distance(int(distance_input.currentText())))
+            self.distance_input.addItem(str(ball))
+        self.distance_input.currentIndexChanged.connect(
+            lambda: self.update_distance(int(self.distance_input.currentText())))
 
-        self.screen_layout.addWidget(distance_input)
+        self.screen_layout.addWidget(self.distance_input)
+
+        # Shows the distance worked out from the goal calibration, if there is one
+        self.estimate_label = ProfileLabel("")
+        self.estimate_label.setVisible(False)
+        self.screen_layout.addWidget(self.estimate_label)
 
         # Connect this button on the Main Page Window to act accordingly - whether Drill Profile or Manual Session was selected
         self.next_page_button = GenericButton("Next")
@@ -89,6 +94,27 @@ class TrainingGetDistanceFromGoalScreen(QWidget):
 
         self.curr_dist = updated_dist
 
+    def set_estimated_distance(self, distance, variance=None):
+        """set_estimated_distance.
+
+        This function selects the distance in the dropdown closest to one worked out from the goal calibration. The user can still change it.
+
+        :param distance: Distance (in ft.) of Ball-E from the goal
+        :param variance: Variance (in sq. ft.) of the distance, or None if it is not known
+        """
+        distance_yards = min(max(int(round(distance / 3)),
+                                 sc.MIN_DISTANCE), sc.MAX_DISTANCE)
+        self.distance_input.setCurrentIndex(distance_yards - sc.MIN_DISTANCE)
+        # The dropdown does not signal a change if the distance was already selected
+        self.update_distance(distance_yards)
+
+        estimate_text = "Ball-E worked out it is about {:.1f} yards away".format(
+            distance / 3)
+        if variance is not None:
+            estimate_text += " (+/- {:.1f})".format(variance ** 0.5 / 3)
+        self.estimate_label.setText(estimate_text)
+        self.estimate_label.setVisible(True)
+
     def get_goal_distance(self):
         """get_goal_distance.
 
@@ -15,30 +15,39 @@ try:
     sys.path.append(
         "{}/Developer/ball_e_gui/src/components".format(pathlib.Path.home()))
     sys.path.append(
-        "{}/Developer/ball_e_gui/src/windows".format(pathlib.Path.home()))
+        "{}/Developer/ball_e_gui/src/helpers".format(pathlib.Path.home()))
     sys.path.append(
-        "{}/Developer/ball_e_image_processing/src".format(pathlib.Path.home()))
+        "{}/Developer/ball_e_gui/src/windows".format(pathlib.Path.home()))
 
     from component_button import GenericButton
+    from component_calibration_canvas import CalibrationCanvas
     from component_labels import ProfileLabel
     from component_toolbar import ToolbarComponent
-    from goal_distance_calculator import GoalDistanceCalculator
+    from helper_calibration_cache import calibration_cache
+    from helper_distance_estimator import estimate_distance, track_corners
+    from helper_goal_calibration import GoalCalibration
+    from helper_goal_detector import detect_goal_corners
+    from helper_snapshot_store import (GOAL_BURST_SNAPSHOT_NAME,
+                                       GOAL_SNAPSHOT_NAME, GOAL_SNAPSHOT_PATH,
+                                       snapshot_store)
     from window_test import TestWindow
 
 except ImportError:
     print("{}: Imports failed".format(__file__))
 finally:
 
-    from PyQt5.QtCore import Qt
-    from PyQt5.QtGui import QBrush, QPainter, QPen, QPixmap
-    from PyQt5.QtWidgets import (QApplication, QHBoxLayout, QLabel,
-                                 QVBoxLayout, QWidget)
+    import logging
+
+    from PyQt5.QtGui import QPixmap
+    from PyQt5.QtWidgets import QApplication, QHBoxLayout, QVBoxLayout, QWidget
+
+logger = logging.getLogger(__name__)
 
 
 class TrainingGoalCalibrationScreen(QWidget):
     """TrainingGoalCalibrationScreen.
 
-    This class makes the user go through the process of selecting points around the goal and then the algorithm can figure out how far away Ball-E is from the goal.
+    This class makes the user go through the process of selecting points around the goal and then the algorithm can figure out how far away Ball-E is from the goal. When the goal can be found in the photo, its corners are proposed and the user only has to confirm them, or tap near a corner to move it.
     """
 
     def __init__(self, parent=None):
@@ -57,6 +66,12 @@ class TrainingGoalCalibrationScreen(QWidget):
 
         # This object will keep track of what the distance of Ball-E from the goal is
         self.goal_distance = None
+        # How much the distance varied over the frames it was worked out from
+        self.goal_distance_variance = None
+        # Maps points of the photo to the sections of the goal once all 4 corners are selected
+        self.goal_calibration = None
+        # Whether or not the corners changed since the distance was last worked out over the frames taken with the photo and the calibration saved
+        self.calibration_unconfirmed = False
 
         screen_layout = QVBoxLayout()
 
@@ -69,17 +84,11 @@ class TrainingGoalCalibrationScreen(QWidget):
             "Please select the 4 corners of the goal, going clockwise from the top-left corner")
         screen_layout.addWidget(self.info_label)
 
-        self.lax_goal_label = QLabel()
-        screen_layout.addWidget(self.lax_goal_label)
-        # NOTE: This will change to temp_training_lax_goal.png
-        self.lax_goal_img_location = str(
-            # Path.home()) + '/Developer/ball_e_gui/src/images/lax_goal.png'
-            pathlib.Path.home()) + '/Developer/ball_e_gui/src/images/temp_training_lax_goal.png'
-
-        self.pixmap_object = QPixmap()
-        self.pixmap_object.load(self.lax_goal_img_location)
-        self.lax_goal_label.mousePressEvent = self.draw_user_input
-        self.lax_goal_label.setPixmap(self.pixmap_object)
+        # Shows the goal photo with the corners and lines drawn over it, and lets the user drag the corners
+        self.calibration_canvas = CalibrationCanvas()
+        screen_layout.addWidget(self.calibration_canvas)
+        self.calibration_canvas.tapped.connect(self.draw_user_input)
+        self.calibration_canvas.corner_moved.connect(self.corner_dragged)
 
         self.button_layout = QHBoxLayout()
         self.reset_button = GenericButton("Reset")
@@ -87,6 +96,8 @@ class TrainingGoalCalibrationScreen(QWidget):
         self.reset_button.setVisible(False)
         self.next_page_button = GenericButton("Next")
         self.next_page_button.setVisible(False)
+        # Connected here, so the calibration is confirmed before whatever the window connects to the button uses it
+        self.next_page_button.clicked.connect(self.confirm_calibration)
 
         self.button_layout.addWidget(self.reset_button)
         self.button_layout.addWidget(self.next_page_button)
@@ -98,17 +109,76 @@ class TrainingGoalCalibrationScreen(QWidget):
         self.bottom_right_coord = None
         self.bottom_left_coord = None
 
+        self.update_lax_goal_pic()
+
         self.setLayout(screen_layout)
 
     def update_lax_goal_pic(self):
         """update_lax_goal_pic.
 
-        This function updates the QLabel object with the actual image of the goal that the user took from the previous page.
+        This function updates the calibration canvas with the actual image of the goal that the user took from the previous page. The photo is handed over in memory; the saved file is only read if there is none (i.e.: when this screen is run on its own).
+        """
+        goal_image = snapshot_store.get_image(GOAL_SNAPSHOT_NAME)
+        if goal_image is not None:
+            goal_pixmap = QPixmap.fromImage(goal_image)
+        else:
+            goal_pixmap = QPixmap()
+            goal_pixmap.load(GOAL_SNAPSHOT_PATH)
+        self.calibration_canvas.set_photo(goal_pixmap)
+
+        self.reset_lines()
+        if not self.reuse_cached_calibration():
+            self.propose_corners()
+
+    def reuse_cached_calibration(self):
+        """reuse_cached_calibration.
+
+        This function selects the corners and distance of the last calibration if the photo shows the same scene it was made on, i.e.: Ball-E has not been moved since. Returns True if they were reused.
         """
-        self.pixmap_object = QPixmap()
-        self.pixmap_object.load(self.lax_goal_img_location)
-        self.lax_goal_label.mousePressEvent = self.draw_user_input
-        self.lax_goal_label.setPixmap(self.pixmap_object)
+        goal_frame = snapshot_store.get_frame(GOAL_SNAPSHOT_NAME)
+        if goal_frame is None:
+            return False
+
+        cached_calibration = calibration_cache.find(goal_frame)
+        if cached_calibration is None:
+            return False
+        logger.info("Reusing the last calibration (%.0f%% of the scene changed)",
+                    cached_calibration.fingerprint_difference * 100)
+
+        (self.top_left_coord, self.top_right_coord,
+         self.bottom_right_coord, self.bottom_left_coord) = cached_calibration.corners
+        self.click_counter = 4
+        self.redraw_corners()
+        self.corners_selected("Ball-E has not moved since the last calibration, so it was reused. If a corner is off, tap near it to move it.",
+                              cached_calibration.goal_distance, cached_calibration.goal_distance_variance)
+        return True
+
+    def propose_corners(self):
+        """propose_corners.
+
+        This function looks for the goal in the photo and, if it is found with enough confidence, selects its 4 corners for the user to confirm.
+        """
+        goal_frame = snapshot_store.get_frame(GOAL_SNAPSHOT_NAME)
+        if goal_frame is None:
+            return
+
+        goal_detection = detect_goal_corners(goal_frame)
+        if goal_detection is None:
+            logger.info("Goal not found in the photo")
+            return
+        if not goal_detection.is_proposable():
+            logger.info("Goal found with too low a confidence (%.2f) to propose",
+                        goal_detection.confidence)
+            return
+        logger.info("Goal found with confidence %.2f in %.0f ms",
+                    goal_detection.confidence, goal_detection.detection_ms)
+
+        (self.top_left_coord, self.top_right_coord,
+         self.bottom_right_coord, self.bottom_left_coord) = goal_detection.corners
+        self.click_counter = 4
+        self.redraw_corners()
+        self.corners_selected("The goal was found ({:.0%} sure). If a corner is off, tap near it to move it.".format(
+            goal_detection.confidence))
 
     def reset_lines(self):
         """reset_lines.
@@ -117,16 +187,17 @@ class TrainingGoalCalibrationScreen(QWidget):
         """
         # Reset click counter
         self.click_counter = 0
+        self.goal_calibration = None
+        self.goal_distance = None
+        self.goal_distance_variance = None
+        self.calibration_unconfirmed = False
 
-        # Clear the image
-        # NOTE: This will change to temp_training_lax_goal.png
-        self.lax_goal_img_location = str(
-            pathlib.Path.home()) + '/Developer/ball_e_gui/src/images/temp_training_lax_goal.png'
-
-        self.pixmap_object = QPixmap()
-        self.pixmap_object.load(self.lax_goal_img_location)
-        self.lax_goal_label.mousePressEvent = self.draw_user_input
-        self.lax_goal_label.setPixmap(self.pixmap_object)
+        # Clear the corners and lines off the photo
+        self.top_left_coord = None
+        self.top_right_coord = None
+        self.bottom_right_coord = None
+        self.bottom_left_coord = None
+        self.calibration_canvas.set_corners([])
 
         self.reset_button.setVisible(False)
         self.next_page_button.setVisible(False)
@@ -134,30 +205,22 @@ class TrainingGoalCalibrationScreen(QWidget):
         self.info_label.setText(
             "Please select the 4 corners of the goal, going clockwise from the top-left corner")
 
-    def draw_user_input(self, event):
+    def draw_user_input(self, x_coord, y_coord):
         """draw_user_input.
 
         This function gets where the user clicked and then draws circles to indicate the points that the user clicked on.
 
-        :param event: The mouse click event which contains the x-and-y coordinates
+        :param x_coord: x-coordinate (in pixels of the photo) of the click
+        :param y_coord: y-coordinate (in pixels of the photo) of the click
         """
 
-        x_coord = event.pos().x()
-        y_coord = event.pos().y()
+        # Once all 4 corners are selected, a tap moves the closest one
+        if self.click_counter == 4:
+            self.move_closest_corner((x_coord, y_coord))
 
-        if self.click_counter < 4:
+        elif self.click_counter < 4:
             self.click_counter += 1
 
-            painter_obj = QPainter(self.pixmap_object)
-            painter_obj.setPen(QPen(Qt.green, 12, Qt.SolidLine))
-            painter_obj.setBrush(QBrush(Qt.green, Qt.SolidPattern))
-
-            painter_obj.drawEllipse(event.pos(), 20, 20)
-
-            painter_obj.end()
-
-            self.lax_goal_label.setPixmap(self.pixmap_object)
-
             if self.click_counter == 1:
                 self.top_left_coord = (x_coord, y_coord)
 
@@ -169,88 +232,184 @@ class TrainingGoalCalibrationScreen(QWidget):
 
             elif self.click_counter == 4:
                 self.bottom_left_coord = (x_coord, y_coord)
-                self.reset_button.setVisible(True)
-                self.next_page_button.setVisible(True)
-                self.draw_lines()
 
-                # Accumulate all the points acquired from the user in a list
-                points_drawn = [self.top_left_coord, self.top_right_coord,
-                                self.bottom_right_coord, self.bottom_left_coord]
-                # Create distance from goal calculator object
-                goal_distance_calculator = GoalDistanceCalculator(points_drawn)
-                # Get the distance calculated in ft.
-                self.goal_distance = goal_distance_calculator.get_obj_distance()/12
+            self.calibration_canvas.set_corners(self.get_selected_corners())
+            if self.click_counter == 4:
+                self.calibrate_goal()
+                self.corners_selected()
 
-                self.info_label.setText(
-                    "Distance Calculated: {%.2f} ft.\nThese will be your bounds. If you would like to redo this, click on the Reset button".format(goal_distance))
+    def corner_dragged(self, corner_index):
+        """corner_dragged.
 
-    def draw_lines(self):
-        """draw_lines.
+        This function takes the corner the user dragged on the calibration canvas, and works out the calibration and distance again once the user lets go of it.
 
-        This function draws the lines dividing the goal image into 9 sections given the points that the user clicked on.
+        :param corner_index: Integer index of the corner that was dragged
         """
+        corners = self.get_selected_corners()
+        corners[corner_index] = self.calibration_canvas.get_corners()[
+            corner_index]
+        (self.top_left_coord, self.top_right_coord, self.bottom_right_coord,
+         self.bottom_left_coord) = corners + [None] * (4 - len(corners))
 
-        painter_obj = QPainter(self.pixmap_object)
-        painter_obj.setPen(QPen(Qt.green, 12, Qt.SolidLine))
+        if self.click_counter == 4:
+            self.calibrate_goal()
+            self.corners_selected()
 
-        # Draw the perimeter
-        painter_obj.drawLine(
-            self.top_left_coord[0], self.top_left_coord[1], self.top_right_coord[0], self.top_right_coord[1])
+    def get_selected_corners(self):
+        """get_selected_corners.
 
-        painter_obj.drawLine(
-            self.top_left_coord[0], self.top_left_coord[1], self.bottom_left_coord[0], self.bottom_left_coord[1])
+        This function returns the list of the (x, y) tuples of the corners selected so far, in the order they are selected in
+        """
+        return [corner for corner in (self.top_left_coord, self.top_right_coord, self.bottom_right_coord, self.bottom_left_coord)
+                if corner is not None][:self.click_counter]
 
-        painter_obj.drawLine(
-            self.top_right_coord[0], self.top_right_coord[1], self.bottom_right_coord[0], self.bottom_right_coord[1])
+    def move_closest_corner(self, point):
+        """move_closest_corner.
 
-        painter_obj.drawLine(
-            self.bottom_left_coord[0], self.bottom_left_coord[1], self.bottom_right_coord[0], self.bottom_right_coord[1])
+        This function moves the corner closest to where the user tapped to there, and draws everything again.
 
-        # Calculate Left and Right coordinates for the latitudes
-        top_one_third_coord_left = (int((2/3)*(self.top_left_coord[0]))+int((1/3)*(self.bottom_left_coord[0])), int(
-            (2/3)*(self.top_left_coord[1]))+int((1/3)*(self.bottom_left_coord[1])))
-        top_two_third_coord_left = (int((1/3)*(self.top_left_coord[0]))+int((2/3)*(self.bottom_left_coord[0])), int(
-            (1/3)*(self.top_left_coord[1]))+int((2/3)*(self.bottom_left_coord[1])))
+        :param point: (x, y) tuple of where the user tapped
+        """
+        corners = [self.top_left_coord, self.top_right_coord,
+                   self.bottom_right_coord, self.bottom_left_coord]
+        closest_corner_index = min(range(4), key=lambda corner_index: (corners[corner_index][0] - point[0])**2
+                                   + (corners[corner_index][1] - point[1])**2)
+        corners[closest_corner_index] = point
 
-        top_one_third_coord_right = (int((2/3)*(self.top_right_coord[0]))+int((1/3)*(self.bottom_right_coord[0])), int(
-            (2/3)*(self.top_right_coord[1]))+int((1/3)*(self.bottom_right_coord[1])))
-        top_two_third_coord_right = (int((1/3)*(self.top_right_coord[0]))+int((2/3)*(self.bottom_right_coord[0])), int(
-            (1/3)*(self.top_right_coord[1]))+int((2/3)*(self.bottom_right_coord[1])))
+        (self.top_left_coord, self.top_right_coord,
+         self.bottom_right_coord, self.bottom_left_coord) = corners
+        self.redraw_corners()
+        self.corners_selected()
 
-        # Draw latitudes
-        painter_obj.drawLine(top_one_third_coord_left[0], top_one_third_coord_left[1],
-                             top_one_third_coord_right[0], top_one_third_coord_right[1])
-        painter_obj.drawLine(top_two_third_coord_left[0], top_two_third_coord_left[1],
-                             top_two_third_coord_right[0], top_two_third_coord_right[1])
+    def redraw_corners(self):
+        """redraw_corners.
 
-        # Calculate Top and Bottom coordinates for the longitudes
-        left_one_third_coord_top = (int((2/3)*(self.top_left_coord[0]))+int((1/3)*(self.top_right_coord[0])), int(
-            (2/3)*(self.top_left_coord[1]))+int((1/3)*(self.top_right_coord[1])))
-        left_two_third_coord_top = (int((1/3)*(self.top_left_coord[0]))+int((2/3)*(self.top_right_coord[0])), int(
-            (1/3)*(self.top_left_coord[1]))+int((2/3)*(self.top_right_coord[1])))
+        This function shows the 4 corners and the lines between them on the calibration canvas, and calibrates the goal from them.
+        """
+        self.calibration_canvas.set_corners(self.get_selected_corners())
+        self.calibrate_goal()
 
-        left_one_third_coord_bottom = (int((2/3)*(self.bottom_left_coord[0]))+int((1/3)*(self.bottom_right_coord[0])), int(
-            (2/3)*(self.bottom_left_coord[1]))+int((1/3)*(self.bottom_right_coord[1])))
-        left_two_third_coord_bottom = (int((1/3)*(self.bottom_left_coord[0]))+int((2/3)*(self.bottom_right_coord[0])), int(
-            (1/3)*(self.bottom_left_coord[1]))+int((2/3)*(self.bottom_right_coord[1])))
+    def corners_selected(self, info_text=None, goal_distance=None, goal_distance_variance=None):
+        """corners_selected.
 
-        # Draw longitudes
-        painter_obj.drawLine(left_one_third_coord_top[0], left_one_third_coord_top[1],
-                             left_one_third_coord_bottom[0], left_one_third_coord_bottom[1])
-        painter_obj.drawLine(left_two_third_coord_top[0], left_two_third_coord_top[1],
-                             left_two_third_coord_bottom[0], left_two_third_coord_bottom[1])
+        This function shows the distance of Ball-E from the goal once all 4 corners are selected, and lets the user move on or start again. While the user is still adjusting the corners, the distance is only worked out from the photo itself. It is worked out over all the frames taken with the photo, and the calibration saved, once it is confirmed.
 
-        painter_obj.end()
+        :param info_text: String shown above the distance (i.e.: how sure the goal detection is), or None
+        :param goal_distance: Distance (in ft.) already known for these corners (i.e.: from the last calibration), or None to work it out
+        :param goal_distance_variance: Variance (in sq. ft.) of the distance already known, or None
+        """
+        self.reset_button.setVisible(True)
+        self.next_page_button.setVisible(True)
+
+        if goal_distance is not None:
+            self.goal_distance = goal_distance
+            self.goal_distance_variance = goal_distance_variance
+            self.calibration_unconfirmed = False
+        else:
+            self.goal_distance = estimate_distance(
+                [self.get_selected_corners()], self.calibration_canvas.get_photo_size()[0],
+                snapshot_store.get_burst_fov_degrees(GOAL_BURST_SNAPSHOT_NAME)).distance
+            self.goal_distance_variance = None
+            self.calibration_unconfirmed = True
+
+        self.show_goal_distance(info_text)
+
+    def confirm_calibration(self):
+        """confirm_calibration.
+
+        This function works out the distance of Ball-E from the goal over all the frames taken with the photo, and saves the calibration so it can be reused. It is called when the user clicks Next or leaves the screen, and does nothing if the corners have not changed since it was last called.
+        """
+        if not self.calibration_unconfirmed:
+            return
+        self.calibration_unconfirmed = False
+
+        # Accumulate all the points acquired from the user in a list
+        points_drawn = self.get_selected_corners()
+
+        # Follow the corners through the frames taken just before the photo, and work out the distance over all of them at once
+        goal_frame = snapshot_store.get_frame(GOAL_SNAPSHOT_NAME)
+        if goal_frame is not None:
+            corner_tracks = track_corners(goal_frame, points_drawn,
+                                          snapshot_store.get_burst(GOAL_BURST_SNAPSHOT_NAME))
+        else:
+            corner_tracks = [points_drawn]
+        distance_estimate = estimate_distance(
+            corner_tracks, self.calibration_canvas.get_photo_size()[0],
+            snapshot_store.get_burst_fov_degrees(GOAL_BURST_SNAPSHOT_NAME))
+        logger.info("Distance %.2f ft. +/- %.2f from %d of %d frames", distance_estimate.distance,
+                    distance_estimate.get_standard_deviation(), distance_estimate.frames_used, distance_estimate.frames_total)
+        self.goal_distance = distance_estimate.distance
+        self.goal_distance_variance = distance_estimate.variance
+        self.show_goal_distance()
+
+        # Remember the calibration with the scene it was made on
+        if goal_frame is not None:
+            try:
+                calibration_cache.save(goal_frame, points_drawn, self.goal_distance,
+                                       self.goal_calibration.homography, self.goal_distance_variance)
+            except OSError:
+                logger.warning(
+                    "Could not save the calibration", exc_info=True)
+
+    def show_goal_distance(self, info_text=None):
+        """show_goal_distance.
+
+        This function shows the distance worked out, and how much it varied if it was worked out over several frames
+
+        :param info_text: String shown above the distance (i.e.: how sure the goal detection is), or None
+        """
+        if self.goal_distance_variance is None:
+            distance_text = "Distance Calculated: {:.2f} ft.".format(
+                self.goal_distance)
+        else:
+            distance_text = "Distance Calculated: {:.2f} ft. (+/- {:.2f} ft.)".format(
+                self.goal_distance, self.goal_distance_variance ** 0.5)
+        distance_text += "\nThese will be your bounds. If you would like to redo this, click on the Reset button"
+        self.info_label.setText(distance_text if info_text is None else "{}\n{}".format(
+            info_text, distance_text))
+
+    def hideEvent(self, event):
+        """hideEvent.
+
+        Confirms the calibration when the screen is left without clicking Next
+
+        :param event: Default arg.
+        """
+        super().hideEvent(event)
+        self.confirm_calibration()
 
-        self.lax_goal_label.setPixmap(self.pixmap_object)
+    def calibrate_goal(self):
+        """calibrate_goal.
+
+        This function calibrates the goal from the 4 corners, so every point of the photo can be mapped to one of its 9 sections. The calibration canvas draws the lines outlining and dividing it itself.
+        """
+        self.goal_calibration = GoalCalibration(
+            [self.top_left_coord, self.top_right_coord, self.bottom_right_coord, self.bottom_left_coord],
+            self.calibration_canvas.get_photo_size())
+
+    def get_goal_calibration(self):
+        """get_goal_calibration.
+
+        This function returns the GoalCalibration object of the 4 corners selected, or None if they have not all been selected
+        """
+
+        return self.goal_calibration
 
     def get_goal_distance(self):
         """get_goal_distance.
 
-        This function returns the goal distance calculated in inches
+        This function returns the goal distance calculated in ft., or None if the 4 corners have not all been selected
+        """
+
+        return self.goal_distance
+
+    def get_goal_distance_variance(self):
+        """get_goal_distance_variance.
+
+        This function returns the variance (in sq. ft.) of the goal distance calculated, or None if the 4 corners have not all been selected
         """
 
-        return self.goal_distance/12
+        return self.goal_distance_variance
 
     def get_window_title(self):
         """Helper function to return this window's title
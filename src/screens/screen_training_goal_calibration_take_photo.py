@@ -14,102 +14,38 @@ try:
     import sys
     sys.path.append(
         "{}/Developer/ball_e_gui/src/components".format(pathlib.Path.home()))
+    sys.path.append(
+        "{}/Developer/ball_e_gui/src/helpers".format(pathlib.Path.home()))
     sys.path.append(
         "{}/Developer/ball_e_gui/src/windows".format(pathlib.Path.home()))
 
     from component_button import GenericButton
     from component_labels import ProfileLabel
     from component_toolbar import ToolbarComponent
+    from helper_camera_service import get_camera_service
+    from helper_snapshot_store import (GOAL_BURST_SNAPSHOT_NAME,
+                                       GOAL_SNAPSHOT_NAME, GOAL_SNAPSHOT_PATH,
+                                       SAVE_GOAL_SNAPSHOT_PNG, snapshot_store)
     from window_test import TestWindow
 
 except ImportError:
     print("{}: Imports failed".format(__file__))
 finally:
 
-    import cv2
-    import numpy as np
-    from PyQt5 import QtGui
-    from PyQt5.QtCore import Qt, QThread, pyqtSignal, pyqtSlot
-    from PyQt5.QtGui import QPixmap
-    from PyQt5.QtWidgets import QApplication, QLabel, QVBoxLayout, QWidget
-
-
-class VideoThread(QThread):
-    """VideoThread.
+    import logging
+    import threading
 
-    This class gets the video stream from from the camera using OpenCV.
-    """
-
-    change_pixmap_signal = pyqtSignal(np.ndarray)
-
-    def __init__(self):
-        """__init__.
-
-        Initializes OpenCV appropriately
-        """
-
-        super().__init__()
-        self._run_flag = True
-
-    def run(self):
-        """run.
+    from PyQt5.QtCore import Qt, QTimer, pyqtSlot
+    from PyQt5.QtGui import QPixmap
+    from PyQt5.QtWidgets import (QApplication, QLabel, QSizePolicy,
+                                 QVBoxLayout, QWidget)
 
-        Captures the video stream
-        """
+logger = logging.getLogger(__name__)
 
-        # capture from web cam
-        cap = cv2.VideoCapture(self.gstreamer_pipeline(), cv2.CAP_GSTREAMER)
-        while self._run_flag:
-            ret, cv_img = cap.read()
-            if ret:
-                self.change_pixmap_signal.emit(cv_img)
-        # shut down capture system
-        cap.release()
-
-    def stop(self):
-        """Sets run flag to False and waits for thread to finish"""
-        self._run_flag = False
-        self.wait()
-
-    def gstreamer_pipeline(
-        self,
-        capture_width=1920,
-        capture_height=1080,
-        display_width=960,
-        display_height=540,
-        framerate=30,
-        flip_method=0,
-    ):
-        """gstreamer_pipeline.
-
-        Uses gstreamer to talk to camera module
-
-        :param capture_width: Width (in pixels) to capture feed
-        :param capture_height: Height (in pixels) to capture feed
-        :param display_width: Width (in pixels) to display feed
-        :param display_height: Height (in pixels) to display feed
-        :param framerate: Framerate (in fps) to display feed
-        :param flip_method: Argument for rotation of image capturing and displaying
-        """
-
-        return (
-            "nvarguscamerasrc ! "
-            "video/x-raw(memory:NVMM), "
-            "width=(int)%d, height=(int)%d, "
-            "format=(string)NV12, framerate=(fraction)%d/1 ! "
-            "nvvidconv flip-method=%d ! "
-            "video/x-raw, width=(int)%d, height=(int)%d, format=(string)BGRx ! "
-            "videoconvert ! "
-            "video/x-raw, format=(string)BGR ! appsink"
-            % (
-                capture_width,
-                capture_height,
-                framerate,
-                flip_method,
-                display_width,
-                display_height,
-            )
-        )
+# How long (in ms) the size of the image label has to stay the same before the camera feed is sized for it, so a resize in many steps only resizes the feed once
+PREVIEW_RESIZE_DELAY_MS = 250
+# Longest (in s) taking the full-resolution still may take before the sharpest preview frame is used as the photo instead. The CSI camera has to be reopened twice for it.
+STILL_TIMEOUT_S = 5
 
 
 class TrainingGoalCalibrationTakePhotoScreen(QWidget):
@@ -140,13 +76,20 @@ class TrainingGoalCalibrationTakePhotoScreen(QWidget):
         screen_layout.addWidget(ProfileLabel(
             "Please set up the device your appropriate distance from the goal, then click Next"))
 
-        # Image frames shown in this
+        # Image frames shown in this. It takes all the space left, whatever the size of the frames, so the camera feed can be sized to it.
         self.image_label = QLabel()
+        self.image_label.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
+        self.image_label.setAlignment(Qt.AlignCenter)
         screen_layout.addWidget(self.image_label)
 
-        # Initializing the thread to run the camera
+        # The camera's VideoThread while this screen is attached to it
         self.thread = None
 
+        self.preview_resize_timer = QTimer(self)
+        self.preview_resize_timer.setSingleShot(True)
+        self.preview_resize_timer.setInterval(PREVIEW_RESIZE_DELAY_MS)
+        self.preview_resize_timer.timeout.connect(self.update_preview_size)
+
         self.next_page_button = GenericButton("Next")
         self.next_page_button.clicked.connect(self.cleanup_steps)
         screen_layout.addWidget(self.next_page_button)
@@ -158,43 +101,96 @@ class TrainingGoalCalibrationTakePhotoScreen(QWidget):
     def start_camera(self):
         """start_camera.
 
-        This function starts the camera feed.
+        This function starts the camera feed. The camera stays open for a while after this screen is left, so coming back does not bring it up again.
+        """
+        self.updated_temp_goal_image = None
+        self.thread = get_camera_service().attach(self.update_image)
+        self.update_preview_size()
+
+    def resizeEvent(self, event):
+        """resizeEvent.
+
+        Sizes the camera feed for the new size of the image label, once it has stopped changing
+
+        :param event: Default arg.
         """
-        # create the video capture thread
-        self.thread = VideoThread()
-        # connect its signal to the update_image slot
-        self.thread.change_pixmap_signal.connect(self.update_image)
-        # start the thread
-        self.thread.start()
+        super().resizeEvent(event)
+        if self.thread is not None:
+            self.preview_resize_timer.start()
+
+    def update_preview_size(self):
+        """update_preview_size.
+
+        Sizes the camera feed for the current size of the image label
+        """
+        self.preview_resize_timer.stop()
+        if self.thread is not None:
+            self.thread.set_preview_size(
+                self.image_label.width(), self.image_label.height())
 
     def cleanup_steps(self):
         """cleanup_steps.
-        This function ensures that the camera's resources are properly disposed of when done
+        This function takes the photo at the camera's full resolution and detaches from the camera, which closes it once nothing has used it for a while
+        """
+        # Both the Next button and the window's closing steps call this
+        if self.thread is None:
+            return
+
+        self.preview_resize_timer.stop()
+        get_camera_service().detach(self.update_image)
+        logger.debug("Camera feed stats: %s", self.thread.get_stats())
+        # The corners selected on the photo are followed through these frames to average out the distance, which depends on the field of view of the sensor mode they were taken in
+        snapshot_store.put_burst(GOAL_BURST_SNAPSHOT_NAME, self.thread.get_recent_frames(),
+                                 self.thread.capture_source.get_horizontal_fov_degrees())
+
+        still_frame = self.take_still()
+        if still_frame is not None:
+            self.updated_temp_goal_image = still_frame
+        else:
+            # The newest preview frame is often blurred by the tap on Next, so use the sharpest recent one
+            logger.warning(
+                "Could not take a full-resolution still, so the photo is a preview frame")
+            sharpest_frame = self.thread.get_sharpest_frame()
+            if sharpest_frame is not None:
+                self.updated_temp_goal_image = sharpest_frame
+        if self.updated_temp_goal_image is not None:
+            # The calibration screen gets the photo from memory. Saving it to disk (if at all) happens in the background.
+            snapshot_store.put(GOAL_SNAPSHOT_NAME, self.updated_temp_goal_image,
+                               GOAL_SNAPSHOT_PATH if SAVE_GOAL_SNAPSHOT_PNG else None)
+        self.thread = None
+
+    def take_still(self):
+        """take_still.
+
+        This function asks the camera for a full-resolution still and waits up to STILL_TIMEOUT_S for it. By the time the camera has switched to the still's sensor mode, it has settled from the tap on Next. Returns the BGR frame, or None if it could not be taken in time.
         """
-        # NOTE: This must be called so that camera pipeline is closed successfully
-        self.thread.stop()
-        cv2.imwrite('images/temp_training_lax_goal.png',
-                    self.updated_temp_goal_image)
-
-    @pyqtSlot(np.ndarray)
-    def update_image(self, cv_img):
-        """Updates the image_label with a new opencv image"""
+        # A camera that could not be opened never takes it
+        if not self.thread.isRunning():
+            return None
+
+        still_taken = threading.Event()
+        still_frames = list()
+
+        def store_still(still_frame):
+            still_frames.append(still_frame)
+            still_taken.set()
+
+        self.thread.request_still(store_still)
+        if not still_taken.wait(STILL_TIMEOUT_S):
+            return None
+        return still_frames[0]
+
+    @pyqtSlot()
+    def update_image(self):
+        """Updates the image_label with the newest frame from the camera"""
+        if self.thread is None:
+            return
+        frame = self.thread.frame_mailbox.take()
+        if frame is None:
+            return
+        qt_img, cv_img = frame
         self.updated_temp_goal_image = cv_img
-        qt_img = self.convert_cv_qt(cv_img)
-        self.image_label.setPixmap(qt_img)
-
-    def convert_cv_qt(self, cv_img):
-        """Convert from an opencv image to QPixmap"""
-        rgb_image = cv2.cvtColor(cv_img, cv2.COLOR_BGR2RGB)
-        h, w, ch = rgb_image.shape
-        bytes_per_line = ch * w
-        convert_to_Qt_format = QtGui.QImage(
-            rgb_image.data, w, h, bytes_per_line, QtGui.QImage.Format_RGB888)
-        display_width = 960
-        display_height = 540
-        p = convert_to_Qt_format.scaled(
-            display_width, display_height, Qt.KeepAspectRatio)
-        return QPixmap.fromImage(p)
+        self.image_label.setPixmap(QPixmap.fromImage(qt_img))
 
     def get_window_title(self):
         """get_window_title.
@@ -22,16 +22,16 @@ try:
     import style_constants as sc
     from component_button import GenericButton
     from component_labels import ProfileLabel
+    from component_profile_table import ProfileTableModel, ProfileTableView
     from component_toolbar import ToolbarComponent
-    from helper_profiler import Profiler
+    from helper_profile_watcher import get_profile_watcher
     from window_test import TestWindow
 
 except ImportError:
     print("{}: Imports failed".format(__file__))
 finally:
-
     from PyQt5 import QtWidgets
-    from PyQt5.QtCore import Qt
+    from PyQt5.QtCore import pyqtSlot
     from PyQt5.QtGui import QFont
     from PyQt5.QtWidgets import (QApplication, QHBoxLayout, QHeaderView,
                                  QSizePolicy, QTableWidget, QTableWidgetItem,
@@ -54,14 +54,18 @@ class TrainingGoalieProfileSelectionScreen(QWidget):
 
         self.window_title = "Goalie Profile Selection"
 
-        self.profiler = Profiler('goalie_profiles')
-        self.goalie_profiles = self.profiler.get_profiles()
+        # The watcher keeps the live set of profiles and says when it has changed
+        self.profile_watcher = get_profile_watcher('goalie_profiles')
+        self.goalie_profiles = self.profile_watcher.get_profiles()
+        self.profile_watcher.profiles_changed.connect(self.on_profiles_changed)
+        # Whether or not the profiles changed on disk since the table was last updated
+        self.profiles_outdated = False
 
         self.selected_goalie_profile = None
 
         # This font will be used for all table related purposes
         self.table_font = QFont()
-        self.table_font.setPixelSize(int(sc.FONT_L[:2]))
+        self.table_font.setPixelSize(sc.FONT_L_PX)
 
         self.screen_layout = QVBoxLayout()
 
@@ -88,23 +92,43 @@ class TrainingGoalieProfileSelectionScreen(QWidget):
         # Create the main table and add to the layout
         self.create_main_table_view(profile_dict_obj=self.goalie_profiles,
                                     table_clicked_action=self.choose_main_table_click_action)
-        self.main_table_view.resizeRowsToContents()
         self.screen_layout.addWidget(self.main_table_view)
 
         self.setLayout(self.screen_layout)
 
+    # Decorated so that Qt drops the connection to the shared watcher when this screen is deleted
+    @pyqtSlot(dict, list, list)
+    def on_profiles_changed(self, added, removed, modified):
+        """on_profiles_changed.
+
+        Marks the table as outdated when the watcher reports that profiles were added or removed. Modified profiles keep their name, so the table does not need to change for them.
+
+        :param added: Dictionary of the {profile name: profile .csv path} added
+        :param removed: List of the profile names removed
+        :param modified: List of the profile names whose files changed
+        """
+        if len(added) > 0 or len(removed) > 0:
+            self.profiles_outdated = True
+
     def update_profiles(self):
-        """Refreshes the profiles on the screen to show to the user
+        """Refreshes the profiles on the screen to show to the user, only if they changed since the table was last updated
         """
-        self.screen_layout.removeWidget(self.main_table_view)
+        if not self.profiles_outdated:
+            return
+        self.profiles_outdated = False
 
-        self.goalie_profiles = self.profiler.get_profiles()
+        self.goalie_profiles = self.profile_watcher.get_profiles()
 
-        # Create the main table and add to the layout
-        self.create_main_table_view(profile_dict_obj=self.goalie_profiles,
-                                    table_clicked_action=self.choose_main_table_click_action)
-        self.main_table_view.resizeRowsToContents()
-        self.screen_layout.addWidget(self.main_table_view)
+        # The same table is kept for the life of the screen, only the rows that changed are inserted or removed
+        _, removed = self.profile_table_model.update_profiles(
+            self.goalie_profiles.keys())
+
+        # The selected profile may have just been deleted
+        if self.selected_goalie_profile in removed:
+            self.selected_goalie_profile = None
+            self.next_page_button.setVisible(False)
+            self.goalie_profile_selection_label.setText(
+                "Please Select a Goalie Profile to Continue")
 
     def create_table_header_view(self, table_title_name, header_clicked_action):
         """Creates a table header for the table below it
@@ -165,40 +189,14 @@ class TrainingGoalieProfileSelectionScreen(QWidget):
             table_clicked_action (function): Function to execute when table is clicked
         """
 
-        # Create the main table widget where data will be populated
-        self.main_table_view = QTableWidget()
-        # Do not allow the user to edit the contents of the table
-        self.main_table_view.setEditTriggers(
-            QtWidgets.QTableWidget.NoEditTriggers)
-        # The number of rows is defined by how many objects there are in the dictionary
-        self.main_table_view.setRowCount(len(profile_dict_obj))
-        self.main_table_view.setColumnCount(1)
-
-        # Iterate through the data in the dictionary and format it appropriately in the table
-        for row_count, profile_name in enumerate(profile_dict_obj):
-            # Modify the profile name's string and populate into a table cell
-            mod_profile_name = profile_name.replace('_', ' ').title()
-            mod_profile_name_widget = QTableWidgetItem(mod_profile_name)
-            mod_profile_name_widget.setFont(self.table_font)
-            # Align items in their respective cells appropriately
-            mod_profile_name_widget.setTextAlignment(Qt.AlignLeft)
-            # Add items to the table view
-            self.main_table_view.setItem(
-                row_count, 0, mod_profile_name_widget)
+        # The model hands the profiles to the view only as it needs them
+        self.profile_table_model = ProfileTableModel(
+            profile_dict_obj.keys(), self.table_font)
+        self.main_table_view = ProfileTableView(self.profile_table_model)
 
         # Function to execute when a cell from this table is clicked
         self.main_table_view.clicked.connect(table_clicked_action)
 
-        # Capture the horizontal header of the table
-        main_table_hor_head = self.main_table_view.horizontalHeader()
-
-        # Hide all headers of the table
-        self.main_table_view.verticalHeader().setVisible(False)
-        main_table_hor_head.setVisible(False)
-
-        # Resize the left column to stretch as far out as possible
-        main_table_hor_head.setSectionResizeMode(0, QHeaderView.Stretch)
-
     def choose_main_table_click_action(self, item):
         """choose_main_table_click_action.
 
@@ -207,14 +205,15 @@ class TrainingGoalieProfileSelectionScreen(QWidget):
         :param item: The object that was clicked in the table
         """
 
-        goalie_name = self.main_table_view.item(item.row(), 0).text()
+        goalie_name = self.profile_table_model.get_display_name(item.row())
 
         self.goalie_profile_selection_label.setText("You have selected: {}".format(
             goalie_name
         ))
         self.next_page_button.setVisible(True)
 
-        self.selected_goalie_profile = goalie_name.replace(' ', '_').lower()
+        self.selected_goalie_profile = self.profile_table_model.get_profile_name(
+            item.row())
 
     def reset_screen(self):
         """reset_screen.
@@ -223,8 +222,7 @@ class TrainingGoalieProfileSelectionScreen(QWidget):
         """
 
         # Unselect the currently picked cell
-        self.main_table_view.selectedItems()[
-            0].setSelected(False)
+        self.main_table_view.clearSelection()
 
         self.goalie_profile_selection_label.setText(
             "Please Select a Goalie Profile to Continue")
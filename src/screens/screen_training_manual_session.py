@@ -14,6 +14,8 @@ try:
     import sys
     sys.path.append(
         "{}/Developer/ball_e_gui/src/components".format(pathlib.Path.home()))
+    sys.path.append(
+        "{}/Developer/ball_e_gui/src/helpers".format(pathlib.Path.home()))
     sys.path.append(
         "{}/Developer/ball_e_gui/src/windows".format(pathlib.Path.home()))
     sys.path.append(
@@ -24,13 +26,13 @@ try:
     from component_dropdown import Dropdown
     from component_labels import ProfileLabel
     from component_toolbar import ToolbarComponent
+    from helper_pixmap_cache import get_lax_goal_pixmap
     from threaded_drill_session_handler import ThreadedDrillSessionHandler
     from window_test import TestWindow
 except ImportError:
     print("{}: Imports failed".format(__file__))
 finally:
-    from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot
-    from PyQt5.QtGui import QPainter, QPen, QPixmap
+    from PyQt5.QtCore import pyqtSignal, pyqtSlot
     from PyQt5.QtWidgets import (QApplication, QHBoxLayout, QLabel,
                                  QVBoxLayout, QWidget)
 
@@ -136,44 +138,10 @@ class TrainingManualSessionScreen(QWidget):
         This function sets up the lacrosse goal image such that the user can interact with the sections when shooting out a ball
         """
 
-        lax_goal_img_location = str(
-            pathlib.Path.home()) + '/Developer/ball_e_gui/src/images/lax_goal.png'
-        pixmap_object = QPixmap()
-        pixmap_object.load(lax_goal_img_location)
-        self.scaled_pixmap_obj = pixmap_object.scaled(
-            pixmap_object.width()-300, pixmap_object.height()-300)
+        # The goal image with its 9 sections is rendered once and shared with the drill creation tabs
+        self.scaled_pixmap_obj = get_lax_goal_pixmap()
         self.lax_goal_label.mousePressEvent = self.show_shot_location
 
-        painter_obj = QPainter(self.scaled_pixmap_obj)
-        painter_obj.setPen(QPen(Qt.green, 12, Qt.SolidLine))
-
-        # Top Line
-        painter_obj.drawLine(0, 0, self.scaled_pixmap_obj.width(), 0)
-        # Top 1/3 Line
-        painter_obj.drawLine(0, int(self.scaled_pixmap_obj.height(
-        )/3), self.scaled_pixmap_obj.width(), int(self.scaled_pixmap_obj.height()/3))
-        # Bottom 1/3 Line
-        painter_obj.drawLine(0, (self.scaled_pixmap_obj.height() - int(self.scaled_pixmap_obj.height()/3)),
-                             self.scaled_pixmap_obj.width(), (self.scaled_pixmap_obj.height() - int(self.scaled_pixmap_obj.height()/3)))
-        # Bottom Line
-        painter_obj.drawLine(0, self.scaled_pixmap_obj.height(),
-                             self.scaled_pixmap_obj.width(), self.scaled_pixmap_obj.height())
-        # Left Line
-        painter_obj.drawLine(0, 0,
-                             0, self.scaled_pixmap_obj.height())
-        # Left 1/3 Line
-        painter_obj.drawLine(int(self.scaled_pixmap_obj.width(
-        )/3), 0, int(self.scaled_pixmap_obj.width(
-        )/3), self.scaled_pixmap_obj.height())
-        # Right 1/3 Line
-        painter_obj.drawLine(int(self.scaled_pixmap_obj.width() - self.scaled_pixmap_obj.width()/3), 0,
-                             int(self.scaled_pixmap_obj.width() - self.scaled_pixmap_obj.width()/3), self.scaled_pixmap_obj.height())
-        # Right Line
-        painter_obj.drawLine(self.scaled_pixmap_obj.width(), 0,
-                             self.scaled_pixmap_obj.width(), self.scaled_pixmap_obj.height())
-
-        painter_obj.end()
-
         self.lax_goal_label.setPixmap(self.scaled_pixmap_obj)
 
     def show_shot_location(self, event):
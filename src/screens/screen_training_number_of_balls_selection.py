@@ -141,9 +141,11 @@ class TrainingNumberOfBallsSelectionScreen(QWidget):
         This function ensures that the ball number requirement by the drill is met by the number of balls in the queue if it is an Automated Training Session
         """
 
-        if self.curr_ball_num < self.get_drill_required_balls():
+        required_ball_num = self.get_drill_required_balls()
+
+        if self.curr_ball_num < required_ball_num:
             self.enough_balls_label.setText(
-                "Selected drill requires {} balls. Please fill at least that many then try again.".format(self.get_drill_required_balls()))
+                "Selected drill requires {} balls. Please fill at least that many then try again.".format(required_ball_num))
             self.next_page_button.setVisible(False)
         else:
             self.enough_balls_label.setText("You are good to go!")
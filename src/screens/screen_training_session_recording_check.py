@@ -23,6 +23,7 @@ try:
     from component_button import GenericButton
     from component_labels import ProfileLabel
     from component_toolbar import ToolbarComponent
+    from helper_session_recorder import find_usb_mount
     from window_test import TestWindow
 except ImportError:
     print("{}: Imports failed".format(__file__))
@@ -49,6 +50,9 @@ class TrainingSessionRecordingCheckScreen(QWidget):
 
         self.window_title = "Session Recording Check"
 
+        # Whether or not the user chose to record the session
+        self.record_session = False
+
         # Create a screen layout object to populate
         self.screen_layout = QVBoxLayout()
 
@@ -93,6 +97,8 @@ class TrainingSessionRecordingCheckScreen(QWidget):
         :param required_flag: Boolean value which when True ensures that the user goes through the flow to insert a USB.
         """
 
+        self.record_session = required_flag
+
         # the training session is not being recorded - no USB required
         if not required_flag:
             self.usb_connected_label.setText("You are good to go!")
@@ -141,6 +147,15 @@ class TrainingSessionRecordingCheckScreen(QWidget):
         self.yes_button.setEnabled(True)
         self.no_button.setEnabled(True)
 
+    def get_recording_directory(self):
+        """get_recording_directory.
+
+        Returns the mount point of the USB stick the session is to be recorded to, or None if the session is not being recorded or no USB stick is mounted
+        """
+        if not self.record_session:
+            return None
+        return find_usb_mount()
+
     def reset_screen(self):
         """reset_screen.
 
@@ -10,10 +10,14 @@ Last Modified: May 08, 2021
 """
 
 try:
+    import logging
+    import os
     import sys
     from pathlib import Path
     sys.path.append(
         "{}/Developer/ball_e_gui/src/screens".format(Path.home()))
+    sys.path.append(
+        "{}/Developer/ball_e_gui/src/helpers".format(Path.home()))
     import screen_drill_profiles
     import screen_goalie_profiles
     import screen_help
@@ -35,6 +39,8 @@ try:
     import screen_training_session_complete
 
     # import screen_training_session_recording_check
+    from helper_session_screens import SessionScreenManager
+    from helper_theme import apply_theme
 except ImportError:
     print("{}: Imports failed".format(__file__))
 finally:
@@ -42,6 +48,13 @@ finally:
     from PyQt5.QtCore import Qt, pyqtSlot
     from PyQt5.QtWidgets import QApplication, QMainWindow
 
+# Set this environment variable to the level of the log messages printed, i.e.: DEBUG to also print how long each lazily built tab took to build
+LOG_LEVEL_ENV = "BALL_E_LOG_LEVEL"
+# Level of the log messages printed if LOG_LEVEL_ENV is not set
+DEFAULT_LOG_LEVEL = "WARNING"
+# Most seconds the window waits, when closing, for each goal photo still being saved to disk
+SNAPSHOT_SAVE_TIMEOUT_S = 5
+
 
 class MainWindow(QMainWindow):
     """MainWindow.
@@ -60,109 +73,97 @@ class MainWindow(QMainWindow):
         self.setWindowFlag(Qt.FramelessWindowHint)
         self.showFullScreen()
 
+        # Style every widget in the app with one style sheet, before any screen is built
+        apply_theme()
+
         # Whether or not a Manual Session has been selected by user, defaults to False
         self.manual_session = False
         # Whether or not an Automated Session using a Goalie Profile has been selected by user, defaults to False
         self.automated_with_goalie_session = False
 
-        # All screens setup
-        self.home_screen = screen_home.HomeScreen()
-
-        # Instantiate Training screens objects
-        self.training_screen = screen_training.TrainingScreen()
-        self.training_goalie_profile_selection_screen = screen_training_goalie_profile_selection.TrainingGoalieProfileSelectionScreen()
-        self.training_drill_profile_selection_screen = screen_training_drill_profile_selection.TrainingDrillProfileSelectionScreen()
-        # For the Number of Balls selection screen, the previous screen needs to be known, therefore it will be called from the respective flow
-        # self.training_session_recording_check_screen = screen_training_session_recording_check.TrainingSessionRecordingCheckScreen()
-        # self.training_goal_calibration_take_photo_screen = screen_training_goal_calibration_take_photo.TrainingGoalCalibrationTakePhotoScreen()
-        # self.training_goal_calibration_screen = screen_training_goal_calibration.TrainingGoalCalibrationScreen()
-        self.training_get_distance_from_goal_screen = screen_training_get_distance_from_goal.TrainingGetDistanceFromGoalScreen()
-        self.training_session_complete_screen = screen_training_session_complete.TrainingSessionCompleteScreen()
-
-        # Instantiate Profiles screens objects
-        self.profiles_screen = screen_profiles.ProfilesScreen()
-        self.goalie_profiles_screen = screen_goalie_profiles.GoalieProfilesScreen()
-        self.drill_profiles_screen = screen_drill_profiles.DrillProfilesScreen()
-
-        # Instantiate Help screens objects
-        self.help_screen = screen_help.HelpScreen()
-        self.calibration_help_screen = screen_help_calibration.CalibrationHelpScreen()
-        self.training_help_screen = screen_help_training.TrainingHelpScreen()
-        self.profiles_help_screen = screen_help_profiles.ProfilesHelpScreen()
-        self.using_ball_e_help_screen = screen_help_using_ball_e.UsingBallEHelpScreen()
-
         # The Stacked Widget
         self.main_widget = QtWidgets.QStackedWidget()
         # When the widget in the stacked widget changes, it will call this function
         self.main_widget.currentChanged.connect(self.stacked_widget_updated)
         self.setCentralWidget(self.main_widget)
 
-        # Adding all screens to the stacked widget
+        # Every other screen is only built, added to the stacked widget, and has its flows set up the first time it is navigated to
+        # {screen attribute name: (QWidget class of the screen, function which sets up its flows)}
+        self.screen_registry = {
+            # Training screens
+            "training_screen": (screen_training.TrainingScreen, self.training_screen_flows),
+            "training_goalie_profile_selection_screen": (screen_training_goalie_profile_selection.TrainingGoalieProfileSelectionScreen, self.training_goalie_profile_selection_screen_flows),
+            # For the Number of Balls selection and Drill Profile selection screens, the previous screen needs to be known, therefore they are built from the respective flow
+            # "training_session_recording_check_screen": (screen_training_session_recording_check.TrainingSessionRecordingCheckScreen, self.training_session_recording_check_screen_flows),
+            # "training_goal_calibration_take_photo_screen": (screen_training_goal_calibration_take_photo.TrainingGoalCalibrationTakePhotoScreen, self.training_goal_calibration_take_photo_screen_flows),
+            # "training_goal_calibration_screen": (screen_training_goal_calibration.TrainingGoalCalibrationScreen, self.training_goal_calibration_screen_flows),
+            "training_get_distance_from_goal_screen": (screen_training_get_distance_from_goal.TrainingGetDistanceFromGoalScreen, self.training_get_distance_from_goal_screen_flows),
+            "training_session_complete_screen": (screen_training_session_complete.TrainingSessionCompleteScreen, self.training_session_complete_screen_flows),
+            # Profiles screens
+            "profiles_screen": (screen_profiles.ProfilesScreen, self.profiles_screen_flows),
+            "goalie_profiles_screen": (screen_goalie_profiles.GoalieProfilesScreen, self.goalie_profiles_screen_flows),
+            "drill_profiles_screen": (screen_drill_profiles.DrillProfilesScreen, self.drill_profiles_screen_flows),
+            # Help screens
+            "help_screen": (screen_help.HelpScreen, self.help_screen_flows),
+            "calibration_help_screen": (screen_help_calibration.CalibrationHelpScreen, self.calibration_help_screen_flows),
+            "training_help_screen": (screen_help_training.TrainingHelpScreen, self.training_help_screen_flows),
+            "profiles_help_screen": (screen_help_profiles.ProfilesHelpScreen, self.profiles_help_screen_flows),
+            "using_ball_e_help_screen": (screen_help_using_ball_e.UsingBallEHelpScreen, self.using_ball_e_help_screen_flows),
+        }
+
+        # The screens that are built anew for every session. Replacing one tears down the old one.
+        self.session_screens = SessionScreenManager(self.main_widget)
+        # Records the camera feed of the training session in progress to the USB stick, if the user chose to record it
+        self.session_recorder = None
+
+        # Only the Home Screen is built at startup
+        self.home_screen = screen_home.HomeScreen()
         self.main_widget.addWidget(self.home_screen)
 
-        # Add all instantiated Training screen objects above
-        self.main_widget.addWidget(self.training_screen)
-        self.main_widget.addWidget(
-            self.training_goalie_profile_selection_screen)
-        self.main_widget.addWidget(
-            self.training_drill_profile_selection_screen)
-        self.main_widget.addWidget(
-            self.training_get_distance_from_goal_screen
-        )
-        # self.main_widget.addWidget(
-        #     self.training_session_recording_check_screen)
-        # self.main_widget.addWidget(
-        #     self.training_goal_calibration_take_photo_screen)
-        # self.main_widget.addWidget(
-        #     self.training_goal_calibration_screen)
-        self.main_widget.addWidget(
-            self.training_session_complete_screen)
-
-        # Add all instantiated Profiles screen objects above
-        self.main_widget.addWidget(self.profiles_screen)
-        self.main_widget.addWidget(self.goalie_profiles_screen)
-        self.main_widget.addWidget(self.drill_profiles_screen)
-
-        # Add all instantiated Help screen objects above
-        self.main_widget.addWidget(self.help_screen)
-        self.main_widget.addWidget(self.calibration_help_screen)
-        self.main_widget.addWidget(self.training_help_screen)
-        self.main_widget.addWidget(self.profiles_help_screen)
-        self.main_widget.addWidget(self.using_ball_e_help_screen)
-
         # For program startup, set it as the current widget
         self.main_widget.setCurrentWidget(self.home_screen)
 
         # Home Screen Flows
         self.home_screen_flows()
 
-        # Training Screen Flows
-        self.training_screen_flows()
-        self.training_goalie_profile_selection_screen_flows()
-        self.training_drill_profile_selection_screen_flows()
-        # self.training_session_recording_check_screen_flows()
-        # self.training_goal_calibration_take_photo_screen_flows()
-        # self.training_goal_calibration_screen_flows()
-        self.training_get_distance_from_goal_screen_flows()
-        self.training_session_complete_screen_flows()
+    def closeEvent(self, event):
+        """closeEvent.
 
-        # Profiles Screen Flows
-        self.profiles_screen_flows()
-        # Goalie Profiles Screen Flows
-        self.goalie_profiles_screen_flows()
-        # Drill Profiles Screen Flows
-        self.drill_profiles_screen_flows()
+        Stops recording the session, tears down the session screens and stops their drill handler threads, and lets the goal photo finish saving before the window closes
 
-        # Help Screen Flows
-        self.help_screen_flows()
-        # Calibration Help Screen Flows
-        self.calibration_help_screen_flows()
-        # Training Help Screen Flows
-        self.training_help_screen_flows()
-        # Profiles Help Screen Flows
-        self.profiles_help_screen_flows()
-        # Session Recording Help Screen Flows
-        self.using_ball_e_help_screen_flows()
+        :param event: Default arg.
+        """
+        self.stop_session_recording(wait=True)
+        self.session_screens.release_all()
+        # The snapshot store is only loaded once a screen that takes or shows the goal photo was built, so there is nothing to wait for otherwise
+        snapshot_store_module = sys.modules.get("helper_snapshot_store")
+        if snapshot_store_module is not None and not snapshot_store_module.snapshot_store.wait_for_saves(SNAPSHOT_SAVE_TIMEOUT_S):
+            print("{}: The goal photo did not finish saving".format(__file__))
+        super().closeEvent(event)
+
+    def get_screen(self, screen_name):
+        """get_screen.
+
+        Returns a registered screen, building it, adding it to the stacked widget, and setting up its flows if this is the first time it is asked for
+
+        :param screen_name: String attribute name of the screen (i.e.: training_screen)
+        """
+        if not hasattr(self, screen_name):
+            screen_class, screen_flows = self.screen_registry[screen_name]
+            setattr(self, screen_name, screen_class())
+            self.main_widget.addWidget(getattr(self, screen_name))
+            screen_flows()
+
+        return getattr(self, screen_name)
+
+    def show_screen(self, screen_name):
+        """show_screen.
+
+        Navigates to a registered screen, building it first if needed
+
+        :param screen_name: String attribute name of the screen (i.e.: training_screen)
+        """
+        self.main_widget.setCurrentWidget(self.get_screen(screen_name))
 
     def stacked_widget_updated(self, index):
         """stacked_widget_updated.
@@ -183,10 +184,19 @@ class MainWindow(QMainWindow):
             self.training_drill_profile_selection_screen.update_profiles()
         elif curr_widget_class_name == "TrainingGoalCalibrationScreen":
             self.training_goal_calibration_screen.update_lax_goal_pic()
+        elif curr_widget_class_name == "TrainingGetDistanceFromGoalScreen":
+            # Pre-fill the distance worked out from the goal calibration, if it was done
+            if hasattr(self, "training_goal_calibration_screen") and self.training_goal_calibration_screen.get_goal_distance() is not None:
+                self.training_get_distance_from_goal_screen.set_estimated_distance(
+                    self.training_goal_calibration_screen.get_goal_distance(), self.training_goal_calibration_screen.get_goal_distance_variance())
         elif curr_widget_class_name == "TrainingScreen":
             self.manual_session = False
             self.automated_with_goalie_session = False
 
+        # Leaving the training session (i.e.: when it is complete) ends its recording
+        if curr_widget_class_name not in ("TrainingManualSessionScreen", "TrainingAutomatedSessionScreen"):
+            self.stop_session_recording()
+
     def home_screen_flows(self):
         """home_screen_flows.
 
@@ -194,11 +204,11 @@ class MainWindow(QMainWindow):
         """
         # Home Screen Flows
         self.home_screen.training_button.clicked.connect(
-            lambda: self.main_widget.setCurrentWidget(self.training_screen))
+            lambda: self.show_screen("training_screen"))
         self.home_screen.profiles_button.clicked.connect(
-            lambda: self.main_widget.setCurrentWidget(self.profiles_screen))
+            lambda: self.show_screen("profiles_screen"))
         self.home_screen.help_button.clicked.connect(
-            lambda: self.main_widget.setCurrentWidget(self.help_screen))
+            lambda: self.show_screen("help_screen"))
 
     def training_screen_flows(self):
         """training_screen_flows.
@@ -211,8 +221,7 @@ class MainWindow(QMainWindow):
 
         # Training Screen Flows
         self.training_screen.load_goalie_profile_button.clicked.connect(
-            lambda: self.main_widget.setCurrentWidget(
-                self.training_goalie_profile_selection_screen)
+            lambda: self.show_screen("training_goalie_profile_selection_screen")
         )
         self.training_screen.load_drill_profile_button.clicked.connect(
             self.helper_only_training_drill_profile_profile_selection_screen_setup
@@ -229,14 +238,13 @@ class MainWindow(QMainWindow):
         self.manual_session = True
         prev_screen = "training_screen"
 
-        self.training_number_of_balls_selection_screen = screen_training_number_of_balls_selection.TrainingNumberOfBallsSelectionScreen(
-            prev_screen=prev_screen)
+        self.training_number_of_balls_selection_screen = self.session_screens.replace(
+            "training_number_of_balls_selection_screen", screen_training_number_of_balls_selection.TrainingNumberOfBallsSelectionScreen(
+                prev_screen=prev_screen))
 
         self.training_number_of_balls_selection_screen_flows(
             prev_screen=prev_screen)
 
-        self.main_widget.addWidget(
-            self.training_number_of_balls_selection_screen)
         self.main_widget.setCurrentWidget(
             self.training_number_of_balls_selection_screen)
 
@@ -252,7 +260,7 @@ class MainWindow(QMainWindow):
             lambda: self.main_widget.setCurrentWidget(self.home_screen))
         if prev_screen == "training_screen":
             self.training_number_of_balls_selection_screen.toolbar.prev_screen_button.clicked.connect(
-                lambda: self.main_widget.setCurrentWidget(self.training_screen))
+                lambda: self.show_screen("training_screen"))
         elif prev_screen == "training_drill_profile_choice_screen":
             self.training_number_of_balls_selection_screen.toolbar.prev_screen_button.clicked.connect(
                 lambda: self.main_widget.setCurrentWidget(self.training_drill_profile_selection_screen))
@@ -260,8 +268,7 @@ class MainWindow(QMainWindow):
             return
 
         self.training_number_of_balls_selection_screen.next_page_button.clicked.connect(
-            lambda: self.main_widget.setCurrentWidget(
-                self.training_get_distance_from_goal_screen)
+            lambda: self.show_screen("training_get_distance_from_goal_screen")
         )
 
     def helper_only_training_drill_profile_profile_selection_screen_setup(self):
@@ -271,10 +278,8 @@ class MainWindow(QMainWindow):
         """
         self.manual_session = False
 
-        self.training_drill_profile_selection_screen = screen_training_drill_profile_selection.TrainingDrillProfileSelectionScreen()
-
-        self.main_widget.addWidget(
-            self.training_drill_profile_selection_screen)
+        self.training_drill_profile_selection_screen = self.session_screens.replace(
+            "training_drill_profile_selection_screen", screen_training_drill_profile_selection.TrainingDrillProfileSelectionScreen())
 
         self.training_drill_profile_selection_screen_flows(
             goalie_selected=None)
@@ -291,7 +296,7 @@ class MainWindow(QMainWindow):
         self.training_goalie_profile_selection_screen.toolbar.back_to_home_button.clicked.connect(
             lambda: self.main_widget.setCurrentWidget(self.home_screen))
         self.training_goalie_profile_selection_screen.toolbar.prev_screen_button.clicked.connect(
-            lambda: self.main_widget.setCurrentWidget(self.training_screen))
+            lambda: self.show_screen("training_screen"))
 
         # Training Goalie Profile Selection Screen Flows
         # Repopulate the Drill Selection page according to the Goalie Profile Selection flow
@@ -310,11 +315,9 @@ class MainWindow(QMainWindow):
 
         self.training_goalie_profile_selection_screen.reset_screen()
 
-        self.training_drill_profile_selection_screen = screen_training_drill_profile_selection.TrainingDrillProfileSelectionScreen(
-            goalie_selected)
-
-        self.main_widget.addWidget(
-            self.training_drill_profile_selection_screen)
+        self.training_drill_profile_selection_screen = self.session_screens.replace(
+            "training_drill_profile_selection_screen", screen_training_drill_profile_selection.TrainingDrillProfileSelectionScreen(
+                goalie_selected))
 
         self.training_drill_profile_selection_screen_flows(
             goalie_selected=goalie_selected)
@@ -334,10 +337,10 @@ class MainWindow(QMainWindow):
             lambda: self.main_widget.setCurrentWidget(self.home_screen))
         if goalie_selected is None:
             self.training_drill_profile_selection_screen.toolbar.prev_screen_button.clicked.connect(
-                lambda: self.main_widget.setCurrentWidget(self.training_screen))
+                lambda: self.show_screen("training_screen"))
         else:
             self.training_drill_profile_selection_screen.toolbar.prev_screen_button.clicked.connect(
-                lambda: self.main_widget.setCurrentWidget(self.training_goalie_profile_selection_screen))
+                lambda: self.show_screen("training_goalie_profile_selection_screen"))
 
         self.training_drill_profile_selection_screen.next_page_button.clicked.connect(
             lambda: self.helper_automated_session_training_number_of_balls_selection_screen_setup(self.training_drill_profile_selection_screen.get_selected_drill_profile()))
@@ -351,14 +354,13 @@ class MainWindow(QMainWindow):
         """
         prev_screen = "training_drill_profile_choice_screen"
 
-        self.training_number_of_balls_selection_screen = screen_training_number_of_balls_selection.TrainingNumberOfBallsSelectionScreen(
-            prev_screen=prev_screen, drill_name=drill_name)
+        self.training_number_of_balls_selection_screen = self.session_screens.replace(
+            "training_number_of_balls_selection_screen", screen_training_number_of_balls_selection.TrainingNumberOfBallsSelectionScreen(
+                prev_screen=prev_screen, drill_name=drill_name))
 
         self.training_number_of_balls_selection_screen_flows(
             prev_screen=prev_screen)
 
-        self.main_widget.addWidget(
-            self.training_number_of_balls_selection_screen)
         self.main_widget.setCurrentWidget(
             self.training_number_of_balls_selection_screen)
 
@@ -413,8 +415,7 @@ class MainWindow(QMainWindow):
         This function's purpose is to ensure that the camera object has been started properly.
         """
 
-        self.main_widget.setCurrentWidget(
-            self.training_goal_calibration_take_photo_screen)
+        self.show_screen("training_goal_calibration_take_photo_screen")
 
         self.training_goal_calibration_take_photo_screen.start_camera()
 
@@ -432,11 +433,9 @@ class MainWindow(QMainWindow):
             self.main_widget.setCurrentWidget(
                 self.home_screen)
         elif button_type == "prev_screen":
-            self.main_widget.setCurrentWidget(
-                self.training_session_recording_check_screen)
+            self.show_screen("training_session_recording_check_screen")
         elif button_type == "next_screen":
-            self.main_widget.setCurrentWidget(
-                self.training_goal_calibration_screen)
+            self.show_screen("training_goal_calibration_screen")
 
     def training_goal_calibration_screen_flows(self):
         """training_goal_calibration_screen_flows.
@@ -447,7 +446,7 @@ class MainWindow(QMainWindow):
         self.training_goal_calibration_screen.toolbar.back_to_home_button.clicked.connect(
             lambda: self.main_widget.setCurrentWidget(self.home_screen))
         self.training_goal_calibration_screen.toolbar.prev_screen_button.clicked.connect(
-            lambda: self.main_widget.setCurrentWidget(self.training_goal_calibration_take_photo_screen))
+            lambda: self.show_screen("training_goal_calibration_take_photo_screen"))
 
         # Screen Flows
         self.training_goal_calibration_screen.next_page_button.clicked.connect(
@@ -458,6 +457,8 @@ class MainWindow(QMainWindow):
 
         This function executes all necessary setup that needs to happen before actually going into the screens appropriate flows, such as getting some information from the previous page, etc.
         """
+        self.start_session_recording()
+
         # If a manual session has been selected
         if self.manual_session:
             # Instantiate a manual screen QWidget
@@ -469,7 +470,9 @@ class MainWindow(QMainWindow):
             self.training_manual_session_screen.drill_handler_thread.run_drill_signal.connect(
                 self.update_main_widget_to_training_session_complete_screen)
             self.training_manual_session_screen_flows()
-            self.main_widget.addWidget(self.training_manual_session_screen)
+            # Manual and Automated Training Sessions share one slot, so only the latest session's screen and handler thread are kept
+            self.session_screens.replace(
+                "training_session_screen", self.training_manual_session_screen)
             self.main_widget.setCurrentWidget(
                 self.training_manual_session_screen)
         # Otherwise, some automated session has been selected
@@ -488,10 +491,53 @@ class MainWindow(QMainWindow):
             self.training_automated_session_screen.drill_handler_thread.run_drill_signal.connect(
                 self.update_main_widget_to_training_session_complete_screen)
             self.training_automated_session_screen_flows()
-            self.main_widget.addWidget(self.training_automated_session_screen)
+            self.session_screens.replace(
+                "training_session_screen", self.training_automated_session_screen)
             self.main_widget.setCurrentWidget(
                 self.training_automated_session_screen)
 
+    def start_session_recording(self):
+        """start_session_recording.
+
+        Starts recording the camera feed of the training session that is starting, if the user chose to record it on the Session Recording Check screen and a USB stick is mounted
+        """
+        self.stop_session_recording()
+
+        # The Session Recording Check screen is only built if it is part of the training flow
+        if not hasattr(self, "training_session_recording_check_screen"):
+            return
+        recording_directory = self.training_session_recording_check_screen.get_recording_directory()
+        if recording_directory is None:
+            return
+
+        # Imported here, since they load OpenCV, which would slow down bringing up the Home Screen
+        from helper_camera_service import get_camera_service
+        from helper_session_recorder import SessionRecorder
+
+        self.session_recorder = SessionRecorder(recording_directory)
+        self.session_recorder.start()
+        # The camera service keeps the recorder's tap (and the camera open) even when the screens showing the camera are left
+        get_camera_service().add_frame_tap(self.session_recorder.submit)
+
+    def stop_session_recording(self, wait=False):
+        """stop_session_recording.
+
+        Stops recording the camera feed, if it is being recorded
+
+        :param wait: Boolean value which when True waits a bounded time for the frames already queued to be written (i.e.: when the app is closing). Otherwise they are written in the background.
+        """
+        if self.session_recorder is None:
+            return
+
+        from helper_camera_service import get_camera_service
+
+        get_camera_service().remove_frame_tap(self.session_recorder.submit)
+        if wait:
+            self.session_recorder.stop()
+        else:
+            self.session_recorder.stop(timeout=0)
+        self.session_recorder = None
+
     @pyqtSlot(bool)
     def update_main_widget_to_training_session_complete_screen(self, some_bool):
         """update_main_widget_to_training_session_complete_screen.
@@ -502,8 +548,7 @@ class MainWindow(QMainWindow):
         """
         # If the drill is complete, display the training session complete page
         if not some_bool:
-            self.main_widget.setCurrentWidget(
-                self.training_session_complete_screen)
+            self.show_screen("training_session_complete_screen")
 
     def training_automated_session_screen_flows(self):
         """training_automated_session_screen_flows.
@@ -514,7 +559,7 @@ class MainWindow(QMainWindow):
         self.training_automated_session_screen.toolbar.back_to_home_button.clicked.connect(
             lambda: self.main_widget.setCurrentWidget(self.home_screen))
         self.training_automated_session_screen.toolbar.prev_screen_button.clicked.connect(
-            lambda: self.main_widget.setCurrentWidget(self.training_get_distance_from_goal_screen))
+            lambda: self.show_screen("training_get_distance_from_goal_screen"))
 
     def training_manual_session_screen_flows(self):
         """training_manual_session_screen_flows.
@@ -525,7 +570,7 @@ class MainWindow(QMainWindow):
         self.training_manual_session_screen.toolbar.back_to_home_button.clicked.connect(
             lambda: self.main_widget.setCurrentWidget(self.home_screen))
         self.training_manual_session_screen.toolbar.prev_screen_button.clicked.connect(
-            lambda: self.main_widget.setCurrentWidget(self.training_get_distance_from_goal_screen))
+            lambda: self.show_screen("training_get_distance_from_goal_screen"))
 
     def training_session_complete_screen_flows(self):
         """training_session_complete_screen_flows.
@@ -547,9 +592,9 @@ class MainWindow(QMainWindow):
 
         # Profiles Screen Flows
         self.profiles_screen.goalie_profiles_button.clicked.connect(
-            lambda: self.main_widget.setCurrentWidget(self.goalie_profiles_screen))
+            lambda: self.show_screen("goalie_profiles_screen"))
         self.profiles_screen.drill_profiles_button.clicked.connect(
-            lambda: self.main_widget.setCurrentWidget(self.drill_profiles_screen))
+            lambda: self.show_screen("drill_profiles_screen"))
 
     def goalie_profiles_screen_flows(self):
         """goalie_profiles_screen_flows.
@@ -560,7 +605,7 @@ class MainWindow(QMainWindow):
         self.goalie_profiles_screen.toolbar.back_to_home_button.clicked.connect(
             lambda: self.main_widget.setCurrentWidget(self.home_screen))
         self.goalie_profiles_screen.toolbar.prev_screen_button.clicked.connect(
-            lambda: self.main_widget.setCurrentWidget(self.profiles_screen))
+            lambda: self.show_screen("profiles_screen"))
 
     def drill_profiles_screen_flows(self):
         """drill_profiles_screen_flows.
@@ -571,7 +616,7 @@ class MainWindow(QMainWindow):
         self.drill_profiles_screen.toolbar.back_to_home_button.clicked.connect(
             lambda: self.main_widget.setCurrentWidget(self.home_screen))
         self.drill_profiles_screen.toolbar.prev_screen_button.clicked.connect(
-            lambda: self.main_widget.setCurrentWidget(self.profiles_screen))
+            lambda: self.show_screen("profiles_screen"))
 
     def help_screen_flows(self):
         """help_screen_flows.
@@ -585,13 +630,13 @@ class MainWindow(QMainWindow):
 
         # Help Screen Flows
         self.help_screen.calibration_screen_button.clicked.connect(
-            lambda: self.main_widget.setCurrentWidget(self.calibration_help_screen))
+            lambda: self.show_screen("calibration_help_screen"))
         self.help_screen.training_screen_button.clicked.connect(
-            lambda: self.main_widget.setCurrentWidget(self.training_help_screen))
+            lambda: self.show_screen("training_help_screen"))
         self.help_screen.profiles_screen_button.clicked.connect(
-            lambda: self.main_widget.setCurrentWidget(self.profiles_help_screen))
+            lambda: self.show_screen("profiles_help_screen"))
         self.help_screen.using_ball_e_screen_button.clicked.connect(
-            lambda: self.main_widget.setCurrentWidget(self.using_ball_e_help_screen))
+            lambda: self.show_screen("using_ball_e_help_screen"))
 
     def calibration_help_screen_flows(self):
         """calibration_help_screen_flows.
@@ -603,7 +648,7 @@ class MainWindow(QMainWindow):
         self.calibration_help_screen.toolbar.back_to_home_button.clicked.connect(
             lambda: self.main_widget.setCurrentWidget(self.home_screen))
         self.calibration_help_screen.toolbar.prev_screen_button.clicked.connect(
-            lambda: self.main_widget.setCurrentWidget(self.help_screen))
+            lambda: self.show_screen("help_screen"))
 
     def training_help_screen_flows(self):
         """training_help_screen_flows.
@@ -615,7 +660,7 @@ class MainWindow(QMainWindow):
         self.training_help_screen.toolbar.back_to_home_button.clicked.connect(
             lambda: self.main_widget.setCurrentWidget(self.home_screen))
         self.training_help_screen.toolbar.prev_screen_button.clicked.connect(
-            lambda: self.main_widget.setCurrentWidget(self.help_screen))
+            lambda: self.show_screen("help_screen"))
 
     def profiles_help_screen_flows(self):
         """profiles_help_screen_flows.
@@ -627,7 +672,7 @@ class MainWindow(QMainWindow):
         self.profiles_help_screen.toolbar.back_to_home_button.clicked.connect(
             lambda: self.main_widget.setCurrentWidget(self.home_screen))
         self.profiles_help_screen.toolbar.prev_screen_button.clicked.connect(
-            lambda: self.main_widget.setCurrentWidget(self.help_screen))
+            lambda: self.show_screen("help_screen"))
 
     def using_ball_e_help_screen_flows(self):
         """using_ball_e_help_screen_flows.
@@ -639,14 +684,16 @@ class MainWindow(QMainWindow):
         self.using_ball_e_help_screen.toolbar.back_to_home_button.clicked.connect(
             lambda: self.main_widget.setCurrentWidget(self.home_screen))
         self.using_ball_e_help_screen.toolbar.prev_screen_button.clicked.connect(
-            lambda: self.main_widget.setCurrentWidget(self.help_screen))
+            lambda: self.show_screen("help_screen"))
 
 
 def main():
     """main.
 
-    Main prototyping/testing area. Code prototyping and checking happens here. In this case, it instantiates and runs the Ball-E GUI.
+    Main prototyping/testing area. Code prototyping and checking happens here. In this case, it sets up logging and instantiates and runs the Ball-E GUI.
     """
+    logging.basicConfig(level=os.environ.get(LOG_LEVEL_ENV, DEFAULT_LOG_LEVEL).upper(),
+                        format="%(asctime)s %(levelname)s %(name)s: %(message)s")
     app = QApplication(sys.argv)
     win = MainWindow()
     win.show()
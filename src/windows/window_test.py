@@ -9,8 +9,18 @@ Date: May 4, 2021
 Last Modified: May 08, 2021
 """
 
-from PyQt5.QtCore import Qt
-from PyQt5.QtWidgets import QMainWindow
+try:
+    import pathlib
+    import sys
+    sys.path.append(
+        "{}/Developer/ball_e_gui/src/helpers".format(pathlib.Path.home()))
+
+    from helper_theme import apply_theme
+except ImportError:
+    print("{}: Imports failed".format(__file__))
+finally:
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtWidgets import QMainWindow
 
 
 class TestWindow(QMainWindow):
@@ -28,6 +38,8 @@ class TestWindow(QMainWindow):
         :param parent: Default arg.
         """
         super().__init__(parent=parent)
+        # Style the widget being tested the same way the app does
+        apply_theme()
         self.setWindowFlag(Qt.FramelessWindowHint)
         self.showFullScreen()
         self.setWindowTitle(some_widget.get_window_title())
@@ -0,0 +1,122 @@
+"""
+conftest.py
+---
+This file contains the pytest fixtures shared by the tests: a QApplication, a temporary home directory for the profiles so the tests never touch the real ones, and a stand-in for the drill handler thread, which needs Ball-E's motors.
+---
+
+Date: October 18, 2026
+Last Modified: October 18, 2026
+"""
+
+import os
+import pathlib
+import sys
+
+import pytest
+from PyQt5.QtCore import QThread, pyqtSignal
+
+# The app's modules import each other by name, like when they are run from their own directories
+SRC_DIR = pathlib.Path(__file__).resolve().parent.parent / 'src'
+for module_dir in ('components', 'helpers', 'screens', 'windows'):
+    sys.path.insert(0, str(SRC_DIR / module_dir))
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+
+@pytest.fixture(scope='session')
+def profile_home(tmp_path_factory):
+    """profile_home.
+
+    Points the home directory at a temporary one for the whole session, with the app's source where the app expects it, and returns its path
+
+    :param tmp_path_factory: Default arg.
+    """
+    home = tmp_path_factory.mktemp('home')
+    (home / 'Developer').mkdir()
+    (home / 'Developer' / 'ball_e_gui').symlink_to(SRC_DIR.parent)
+    (home / 'Documents' / 'ball_e_profiles').mkdir(parents=True)
+
+    real_home = os.environ.get('HOME')
+    os.environ['HOME'] = str(home)
+    yield home
+    if real_home is None:
+        del os.environ['HOME']
+    else:
+        os.environ['HOME'] = real_home
+
+
+@pytest.fixture(scope='session')
+def qapp(profile_home):
+    """qapp.
+
+    Returns the QApplication every widget needs, created once for the session
+
+    :param profile_home: Default arg.
+    """
+    from PyQt5.QtWidgets import QApplication
+
+    return QApplication.instance() or QApplication(sys.argv)
+
+
+class SimulatedDrillSessionHandler(QThread):
+    """SimulatedDrillSessionHandler.
+
+    Stands in for ThreadedDrillSessionHandler, which needs the motors. Once started, it runs until it is asked to stop, and remembers whether stop_drill() was called.
+    """
+
+    run_drill_signal = pyqtSignal(bool)
+    update_ball_num_signal = pyqtSignal(bool)
+
+    def __init__(self, distance_from_goal=None, drill_name=None, goalie_name=None):
+        """__init__.
+
+        Initializes the SimulatedDrillSessionHandler object with the arguments of ThreadedDrillSessionHandler
+
+        :param distance_from_goal: Distance from the goal in feet
+        :param drill_name: String name of the drill, or None for a manual session
+        :param goalie_name: String name of the goalie, or None
+        """
+        super().__init__()
+        self.drill_stopped = False
+
+    def run(self):
+        """run.
+
+        Idles until the thread is asked to stop
+        """
+        while not self.isInterruptionRequested():
+            self.msleep(1)
+
+    def start_drill(self):
+        """start_drill.
+
+        Starts the drill loop
+        """
+        self.drill_stopped = False
+        self.start()
+
+    def stop_drill(self):
+        """stop_drill.
+
+        Stops the drill loop
+        """
+        self.drill_stopped = True
+
+
+@pytest.fixture
+def simulated_drill_handler(monkeypatch, qapp):
+    """simulated_drill_handler.
+
+    Makes the training session screens use SimulatedDrillSessionHandler for the rest of the test, and returns the class
+
+    :param monkeypatch: Default arg.
+    :param qapp: Default arg.
+    """
+    import screen_training_automated_session
+    import screen_training_manual_session
+
+    for screen_module in (screen_training_automated_session, screen_training_manual_session):
+        # The real handler may not have been importable at all, in which case the name is missing
+        monkeypatch.setattr(screen_module, 'ThreadedDrillSessionHandler',
+                            SimulatedDrillSessionHandler, raising=False)
+    return SimulatedDrillSessionHandler
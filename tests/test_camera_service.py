@@ -0,0 +1,100 @@
+"""
+test_camera_service.py
+---
+This file contains the tests which check that the camera feed keeps running (or stops cleanly) when the capture source cannot be reopened for a new preview size.
+---
+
+Date: October 18, 2026
+Last Modified: October 18, 2026
+"""
+
+from helper_camera_service import VideoThread
+from helper_capture_sources import SyntheticCaptureSource
+
+# How long (in ms) a test waits for the capture thread
+THREAD_TIMEOUT_MS = 5000
+
+
+class PickyCaptureSource(SyntheticCaptureSource):
+    """PickyCaptureSource.
+
+    Stands in for a camera that cannot be opened for frames wider than a limit, or at all once it is broken
+    """
+
+    def __init__(self, max_width):
+        """__init__.
+
+        Initializes the PickyCaptureSource object
+
+        :param max_width: Widest frames (in pixels) it can be opened for
+        """
+        super().__init__(1920, 1080, 0)
+        self.max_width = max_width
+        self.broken = False
+        self.open_count = 0
+
+    def open(self):
+        """open.
+
+        Opens the source if it is not broken and the frames are not too wide
+        """
+        self.open_count += 1
+        if self.broken or self.width > self.max_width:
+            return False
+        return super().open()
+
+    def read(self):
+        """read.
+
+        Returns (False, None) once the source is released, like cv2.VideoCapture
+        """
+        if self.background is None:
+            return False, None
+        return super().read()
+
+
+def wait_for_frames(video_thread, frame_count):
+    """wait_for_frames.
+
+    Waits for a number of frames to be captured, and returns True if they were
+
+    :param video_thread: Running VideoThread object
+    :param frame_count: Integer number of frames to wait for
+    """
+    start_count = video_thread.frame_mailbox.get_stats()["captured"]
+    for _ in range(THREAD_TIMEOUT_MS):
+        if video_thread.frame_mailbox.get_stats()["captured"] - start_count >= frame_count:
+            return True
+        video_thread.msleep(1)
+    return False
+
+
+def test_failed_reopen_goes_back_to_the_last_profile(qapp):
+    capture_source = PickyCaptureSource(max_width=960)
+    video_thread = VideoThread(960, 540, capture_source=capture_source)
+    video_thread.start()
+    try:
+        assert wait_for_frames(video_thread, 5)
+
+        video_thread.set_preview_size(1920, 1080)
+        assert wait_for_frames(video_thread, 5)
+        assert (video_thread.preview_width, video_thread.preview_height) == (960, 540)
+        assert capture_source.width == 960
+    finally:
+        assert video_thread.stop(THREAD_TIMEOUT_MS)
+
+
+def test_failed_reopen_with_the_last_profile_stops_the_thread(qapp):
+    capture_source = PickyCaptureSource(max_width=960)
+    video_thread = VideoThread(960, 540, capture_source=capture_source)
+    video_thread.start()
+    try:
+        assert wait_for_frames(video_thread, 5)
+
+        capture_source.broken = True
+        video_thread.set_preview_size(480, 270)
+        assert video_thread.wait(THREAD_TIMEOUT_MS)
+        # The first open, the one at the new size, and the one at the last profile
+        assert capture_source.open_count == 3
+    finally:
+        video_thread.stop(THREAD_TIMEOUT_MS)
@@ -0,0 +1,89 @@
+"""
+test_goalie_history.py
+---
+This file contains the tests which check that reading a goalie's history never writes to the profile, that the first append converts and indexes it, and that an index left behind by a rewritten .csv file is not trusted.
+---
+
+Date: October 18, 2026
+Last Modified: October 18, 2026
+"""
+
+import csv
+
+from helper_goalie_history import (GOALIE_CSV_HEADER, INDEX_SUFFIX,
+                                   LEGACY_GOALIE_CSV_HEADER, GoalieHistory)
+
+# Drills in the order they were completed
+DRILLS = [["Drill {}".format(number), "10/{:02d}/2026".format(number)]
+          for number in range(1, 8)]
+
+
+def write_csv(path, header, rows):
+    """write_csv.
+
+    Writes a goalie .csv file the way the app does
+
+    :param path: pathlib.Path object of the .csv file
+    :param header: List of the header's columns
+    :param rows: List of the rows' lists of columns
+    """
+    with open(path, 'w', newline='') as file:
+        writer = csv.writer(file, delimiter=',')
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def test_reading_legacy_file_writes_nothing(tmp_path):
+    profile_path = tmp_path / 'goalie_a.csv'
+    write_csv(profile_path, LEGACY_GOALIE_CSV_HEADER, DRILLS[::-1])
+    csv_bytes = profile_path.read_bytes()
+
+    history = GoalieHistory(str(profile_path))
+
+    assert history.get_entry_count() == len(DRILLS)
+    assert history.get_page(0, 3) == DRILLS[:-4:-1]
+    assert history.get_page(2, 3) == DRILLS[:1]
+    assert profile_path.read_bytes() == csv_bytes
+    assert not (tmp_path / ('goalie_a.csv' + INDEX_SUFFIX)).exists()
+
+
+def test_first_append_converts_legacy_file(tmp_path):
+    profile_path = tmp_path / 'goalie_a.csv'
+    write_csv(profile_path, LEGACY_GOALIE_CSV_HEADER, DRILLS[-2::-1])
+
+    GoalieHistory(str(profile_path)).append(*DRILLS[-1])
+
+    with open(profile_path, newline='') as file:
+        assert list(csv.reader(file)) == [GOALIE_CSV_HEADER] + DRILLS
+    history = GoalieHistory(str(profile_path))
+    assert history.index_stored
+    assert history.get_page(0, 3) == DRILLS[:-4:-1]
+
+
+def test_reading_unindexed_file_writes_nothing(tmp_path):
+    profile_path = tmp_path / 'goalie_a.csv'
+    write_csv(profile_path, GOALIE_CSV_HEADER, DRILLS)
+
+    history = GoalieHistory(str(profile_path))
+
+    assert history.get_page(0, 3) == DRILLS[:-4:-1]
+    assert not (tmp_path / ('goalie_a.csv' + INDEX_SUFFIX)).exists()
+
+
+def test_index_of_rewritten_file_is_rebuilt(tmp_path):
+    profile_path = tmp_path / 'goalie_a.csv'
+    write_csv(profile_path, GOALIE_CSV_HEADER, [])
+    history = GoalieHistory(str(profile_path))
+    for drill in DRILLS:
+        history.append(*drill)
+
+    # Rewritten with rows of other lengths, and appended to past the old size so the size alone does not give it away
+    rewritten_drills = [["Other drill {}".format(number), date]
+                        for number, (_, date) in enumerate(DRILLS * 2)]
+    write_csv(profile_path, GOALIE_CSV_HEADER, rewritten_drills)
+
+    history = GoalieHistory(str(profile_path))
+
+    assert not history.index_stored
+    assert history.get_entry_count() == len(rewritten_drills)
+    assert history.get_page(0, 2) == rewritten_drills[:-3:-1]
@@ -0,0 +1,38 @@
+"""
+test_main_window_close.py
+---
+This file contains the test which closes the MainWindow while the goal photo is still being saved and checks that the save gets to finish.
+---
+
+Date: October 18, 2026
+Last Modified: October 18, 2026
+"""
+
+import threading
+import time
+
+from helper_snapshot_store import snapshot_store
+from window_main import MainWindow
+
+# Seconds the simulated save of the goal photo takes
+SAVE_DURATION_S = 0.3
+
+
+def test_close_waits_for_goal_photo_save(qapp, simulated_drill_handler):
+    saved = threading.Event()
+
+    def slow_save():
+        time.sleep(SAVE_DURATION_S)
+        saved.set()
+
+    window = MainWindow()
+    save_thread = threading.Thread(target=slow_save, daemon=True)
+    save_thread.start()
+    snapshot_store.save_threads.append(save_thread)
+
+    window.close()
+    window.deleteLater()
+    qapp.processEvents()
+
+    assert saved.is_set()
+    assert snapshot_store.save_threads == []
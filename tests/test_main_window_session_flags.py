@@ -0,0 +1,56 @@
+"""
+test_main_window_session_flags.py
+---
+This file contains the tests which walk the MainWindow through the training flow and check that going back to the Training screen always forgets the kind of session picked before.
+---
+
+Date: October 18, 2026
+Last Modified: October 18, 2026
+"""
+
+import pytest
+
+from window_main import MainWindow
+
+
+@pytest.fixture
+def main_window(qapp, simulated_drill_handler):
+    """main_window.
+
+    Returns a MainWindow object, and tears its session screens down after the test
+
+    :param qapp: Default arg.
+    :param simulated_drill_handler: Default arg.
+    """
+    window = MainWindow()
+    yield window
+    window.close()
+    window.deleteLater()
+    qapp.processEvents()
+
+
+def test_manual_session_then_training_screen_resets_flags(main_window):
+    main_window.home_screen.training_button.click()
+    assert not main_window.manual_session
+    assert not main_window.automated_with_goalie_session
+
+    main_window.training_screen.manual_session_button.click()
+    assert main_window.manual_session
+    main_window.training_number_of_balls_selection_screen.next_page_button.click()
+    main_window.training_get_distance_from_goal_screen.next_page_button.click()
+    assert main_window.main_widget.currentWidget() is main_window.training_manual_session_screen
+
+    main_window.show_screen("training_screen")
+    assert not main_window.manual_session
+    assert not main_window.automated_with_goalie_session
+
+
+def test_goalie_profile_selection_then_training_screen_resets_flags(main_window):
+    main_window.home_screen.training_button.click()
+    main_window.training_screen.load_goalie_profile_button.click()
+    assert main_window.automated_with_goalie_session
+
+    main_window.training_goalie_profile_selection_screen.toolbar.prev_screen_button.click()
+    assert main_window.main_widget.currentWidget() is main_window.training_screen
+    assert not main_window.manual_session
+    assert not main_window.automated_with_goalie_session
@@ -0,0 +1,64 @@
+"""
+test_pixmap_cache.py
+---
+This file contains the test which checks that the shared Lacrosse goal pixmap has exactly the pixels the manual session screen and the drill creation tabs used to paint for themselves.
+---
+
+Date: October 18, 2026
+Last Modified: October 18, 2026
+"""
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QPainter, QPen, QPixmap
+
+import helper_pixmap_cache
+
+
+def paint_lax_goal_per_screen(lax_goal_img_location):
+    """paint_lax_goal_per_screen.
+
+    Returns the Lacrosse goal image painted the way the manual session screen and every drill creation tab painted it before the pixmap was shared
+
+    :param lax_goal_img_location: String path of the Lacrosse goal image
+    """
+    pixmap_object = QPixmap()
+    pixmap_object.load(lax_goal_img_location)
+    scaled_pixmap_obj = pixmap_object.scaled(
+        pixmap_object.width()-300, pixmap_object.height()-300)
+    width = scaled_pixmap_obj.width()
+    height = scaled_pixmap_obj.height()
+
+    painter_obj = QPainter(scaled_pixmap_obj)
+    painter_obj.setPen(QPen(Qt.green, 12, Qt.SolidLine))
+    # Top, top 1/3, bottom 1/3, and bottom lines
+    painter_obj.drawLine(0, 0, width, 0)
+    painter_obj.drawLine(0, int(height/3), width, int(height/3))
+    painter_obj.drawLine(0, (height - int(height/3)),
+                         width, (height - int(height/3)))
+    painter_obj.drawLine(0, height, width, height)
+    # Left, left 1/3, right 1/3, and right lines
+    painter_obj.drawLine(0, 0, 0, height)
+    painter_obj.drawLine(int(width/3), 0, int(width/3), height)
+    painter_obj.drawLine(int(width - width/3), 0,
+                         int(width - width/3), height)
+    painter_obj.drawLine(width, 0, width, height)
+    painter_obj.end()
+
+    return scaled_pixmap_obj
+
+
+def test_shared_pixmap_matches_per_screen_painting(qapp, profile_home, monkeypatch):
+    # The image path was worked out from the real home directory when the module was imported
+    lax_goal_img_location = str(
+        profile_home / 'Developer' / 'ball_e_gui' / 'src' / 'images' / 'lax_goal.png')
+    monkeypatch.setattr(helper_pixmap_cache,
+                        'LAX_GOAL_IMAGE_PATH', lax_goal_img_location)
+    monkeypatch.setattr(helper_pixmap_cache, 'grid_pixmaps', dict())
+    expected_image = paint_lax_goal_per_screen(
+        lax_goal_img_location).toImage()
+
+    shared_image = helper_pixmap_cache.get_lax_goal_pixmap().toImage()
+
+    assert not expected_image.isNull()
+    assert shared_image.size() == expected_image.size()
+    assert shared_image == expected_image
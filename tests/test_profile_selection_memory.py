@@ -0,0 +1,83 @@
+"""
+test_profile_selection_memory.py
+---
+This file contains the tests which visit the training profile selection screens over and over, with a profile appearing and disappearing on disk between visits, and check that nothing piles up.
+---
+
+Date: October 18, 2026
+Last Modified: October 18, 2026
+"""
+
+import shutil
+import tracemalloc
+
+import pytest
+from PyQt5.QtCore import QObject
+
+from helper_profile_watcher import get_profile_watcher
+from screen_training_drill_profile_selection import \
+    TrainingDrillProfileSelectionScreen
+from screen_training_goalie_profile_selection import \
+    TrainingGoalieProfileSelectionScreen
+
+# Number of visits measured
+VISIT_COUNT = 1000
+# Visits made before measuring, so caches filled on the first visits are not counted
+WARM_UP_VISIT_COUNT = 20
+# Most the Python heap may grow (in bytes) over all the visits measured. A table or model left behind on every visit grows it by megabytes.
+MEMORY_BOUND_BYTES = 256 * 1024
+
+
+def visit(app, screen, watcher, profile_dir, visit_index):
+    """visit.
+
+    Adds the profile on even visits and deletes it on odd ones, lets the watcher send the change, then refreshes and resets the screen like a visit does
+
+    :param app: QApplication object
+    :param screen: Profile selection screen object
+    :param watcher: ProfileWatcher object of the screen's profile directory
+    :param profile_dir: pathlib.Path object of the profile's directory
+    :param visit_index: Integer number of the visit
+    """
+    if visit_index % 2 == 0:
+        profile_dir.mkdir()
+        (profile_dir / '{}.csv'.format(profile_dir.name)).write_text(
+            "Name,{}\n".format(profile_dir.name))
+    else:
+        shutil.rmtree(profile_dir)
+    # What the watcher's timer does once the changes settle
+    watcher.send_changes()
+
+    screen.update_profiles()
+    screen.reset_screen()
+    app.processEvents()
+
+
+@pytest.mark.parametrize('screen_class, dirname', [
+    (TrainingGoalieProfileSelectionScreen, 'goalie_profiles'),
+    (TrainingDrillProfileSelectionScreen, 'drill_profiles'),
+])
+def test_repeated_visits_keep_memory_bounded(qapp, profile_home, screen_class, dirname):
+    profile_location = profile_home / 'Documents' / 'ball_e_profiles' / dirname
+    profile_location.mkdir(exist_ok=True)
+    profile_dir = profile_location / 'visit_check_profile'
+
+    screen = screen_class()
+    watcher = get_profile_watcher(dirname)
+    for visit_index in range(WARM_UP_VISIT_COUNT):
+        visit(qapp, screen, watcher, profile_dir, visit_index)
+
+    start_children = len(screen.findChildren(QObject))
+    tracemalloc.start()
+    try:
+        start_memory = tracemalloc.get_traced_memory()[0]
+        for visit_index in range(VISIT_COUNT):
+            visit(qapp, screen, watcher, profile_dir, visit_index)
+        memory_growth = tracemalloc.get_traced_memory()[0] - start_memory
+    finally:
+        tracemalloc.stop()
+
+    # Each visit ends with the profile deleted, as it started
+    assert 'visit_check_profile' not in watcher.get_profiles()
+    assert len(screen.findChildren(QObject)) == start_children
+    assert memory_growth < MEMORY_BOUND_BYTES
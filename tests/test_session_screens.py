@@ -0,0 +1,116 @@
+"""
+test_session_screens.py
+---
+This file contains the tests which run many simulated training sessions through the SessionScreenManager and check that nothing piles up, and that a replaced session's drill is stopped.
+---
+
+Date: October 18, 2026
+Last Modified: October 18, 2026
+"""
+
+import os
+
+from PyQt5.QtCore import QEvent
+from PyQt5.QtWidgets import QLabel, QStackedWidget, QVBoxLayout, QWidget
+
+from helper_session_screens import SessionScreenManager
+from screen_training_drill_profile_selection import \
+    TrainingDrillProfileSelectionScreen
+from screen_training_number_of_balls_selection import \
+    TrainingNumberOfBallsSelectionScreen
+
+# Number of sessions run
+SESSION_COUNT = 500
+# Sessions run before the memory and widgets are first measured, so caches filled by the first sessions are not counted
+WARM_UP_SESSION_COUNT = 50
+# Most the resident memory may grow (in KB) over the sessions after the warm-up
+RSS_GROWTH_LIMIT_KB = 8 * 1024
+
+
+def get_rss_kb():
+    """get_rss_kb.
+
+    Returns the resident memory of this process in KB (Linux only)
+    """
+    with open("/proc/self/statm") as file:
+        resident_pages = int(file.read().split()[1])
+    return resident_pages * os.sysconf('SC_PAGE_SIZE') // 1024
+
+
+class SimulatedSessionScreen(QWidget):
+    """SimulatedSessionScreen.
+
+    Stands in for the Manual/Automated Training Session screens
+    """
+
+    def __init__(self, handler_class):
+        """__init__.
+
+        Initializes the SimulatedSessionScreen object with a running drill handler thread
+
+        :param handler_class: Class of the drill handler thread
+        """
+        super().__init__()
+        self.drill_handler_thread = handler_class()
+        self.drill_handler_thread.finished.connect(self.update)
+        screen_layout = QVBoxLayout()
+        screen_layout.addWidget(QLabel("Simulated session"))
+        self.setLayout(screen_layout)
+        self.drill_handler_thread.start_drill()
+
+
+def process_deferred_deletes(app):
+    """process_deferred_deletes.
+
+    Lets the deferred deletes run, like the event loop would between sessions
+
+    :param app: QApplication object
+    """
+    app.processEvents()
+    app.sendPostedEvents(None, QEvent.DeferredDelete)
+
+
+def test_many_sessions_do_not_pile_up(qapp, simulated_drill_handler):
+    stacked_widget = QStackedWidget()
+    stacked_widget.addWidget(QWidget())
+    session_screens = SessionScreenManager(stacked_widget)
+
+    for session in range(SESSION_COUNT):
+        session_screens.replace("training_drill_profile_selection_screen",
+                                TrainingDrillProfileSelectionScreen("goalie_a"))
+        session_screens.replace("training_number_of_balls_selection_screen",
+                                TrainingNumberOfBallsSelectionScreen(prev_screen="training_screen"))
+        session_screens.replace("training_session_screen",
+                                SimulatedSessionScreen(simulated_drill_handler))
+        process_deferred_deletes(qapp)
+
+        if session == WARM_UP_SESSION_COUNT:
+            start_rss_kb = get_rss_kb()
+            start_widget_count = len(qapp.allWidgets())
+
+    assert stacked_widget.count() == 4, "Old session screens were left in the stack"
+    assert len(qapp.allWidgets()) <= start_widget_count
+    assert get_rss_kb() - start_rss_kb < RSS_GROWTH_LIMIT_KB
+
+    session_screens.release_all()
+    process_deferred_deletes(qapp)
+    assert len(session_screens.finishing_threads) == 0, "Handler threads were left running"
+    stacked_widget.deleteLater()
+    process_deferred_deletes(qapp)
+
+
+def test_replaced_session_stops_its_drill(qapp, simulated_drill_handler):
+    stacked_widget = QStackedWidget()
+    session_screens = SessionScreenManager(stacked_widget)
+
+    old_screen = session_screens.replace(
+        "training_session_screen", SimulatedSessionScreen(simulated_drill_handler))
+    old_handler_thread = old_screen.drill_handler_thread
+    session_screens.replace(
+        "training_session_screen", SimulatedSessionScreen(simulated_drill_handler))
+    assert old_handler_thread.drill_stopped
+
+    session_screens.release_all()
+    process_deferred_deletes(qapp)
+    stacked_widget.deleteLater()
+    process_deferred_deletes(qapp)